@@ -119,7 +119,11 @@ except ImportError:
     pass
 
 try:
-    from paper_scraper.modules.search.models import SearchActivity  # noqa: F401
+    from paper_scraper.modules.search.models import (  # noqa: F401
+        PaperNeighbor,
+        SearchActivity,
+        SearchOutboxEntry,
+    )
 except ImportError:
     pass
 
@@ -166,6 +170,11 @@ try:
 except ImportError:
     pass
 
+try:
+    from paper_scraper.modules.embeddings.models import StoredEmbedding  # noqa: F401
+except ImportError:
+    pass
+
 # Alembic Config object
 config = context.config
 
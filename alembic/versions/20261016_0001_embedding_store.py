@@ -0,0 +1,34 @@
+"""Add the cross-tenant content-addressed embedding store.
+
+Revision ID: embedding_store_v1
+Revises: org_usage_v1
+Create Date: 2026-10-16 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "embedding_store_v1"
+down_revision: str | None = "org_usage_v1"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_store",
+        sa.Column("model", sa.String(100), primary_key=True),
+        sa.Column("content_hash", sa.String(64), primary_key=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+    )
+    op.execute("ALTER TABLE embedding_store ADD COLUMN embedding vector(1536) NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_store")
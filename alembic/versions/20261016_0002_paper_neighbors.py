@@ -0,0 +1,56 @@
+"""Add the precomputed paper k-nearest-neighbour table.
+
+Revision ID: paper_neighbors_v1
+Revises: embedding_store_v1
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "paper_neighbors_v1"
+down_revision: str | None = "embedding_store_v1"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "paper_neighbors",
+        sa.Column(
+            "organization_id",
+            sa.Uuid(),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "paper_id",
+            sa.Uuid(),
+            sa.ForeignKey("papers.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "neighbor_id",
+            sa.Uuid(),
+            sa.ForeignKey("papers.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("similarity", sa.Float(), nullable=False),
+        sa.Column(
+            "computed_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+    )
+    op.create_index(
+        "ix_paper_neighbors_org_neighbor",
+        "paper_neighbors",
+        ["organization_id", "neighbor_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_paper_neighbors_org_neighbor", table_name="paper_neighbors")
+    op.drop_table("paper_neighbors")
@@ -0,0 +1,61 @@
+"""Add quantized HNSW indexes for the halfvec/binary storage modes.
+
+Expression indexes over the existing papers.embedding column, so the
+full-precision vectors used for exact re-ranking are stored only once:
+
+- ix_papers_embedding_halfvec_hnsw: embedding::halfvec(1536), cosine
+  (half the size of the full-precision index)
+- ix_papers_embedding_bit_hnsw: binary_quantize(embedding)::bit(1536),
+  Hamming (1/32 of the full-precision vector size)
+
+Only the index for the configured PGVECTOR_STORAGE_MODE is built; with
+the default "full" mode this migration builds nothing. To switch modes
+later, build the matching index first with
+``python -m scripts.build_embedding_index --mode halfvec``. Once a
+quantized mode is in use, ix_papers_embedding_hnsw can be dropped to
+reclaim its memory. Requires pgvector 0.7+. Indexes are built
+CONCURRENTLY so the papers table stays writable during the build.
+
+Revision ID: quantized_embeddings_v1
+Revises: paper_neighbors_v1
+Create Date: 2026-10-16 15:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from paper_scraper.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "quantized_embeddings_v1"
+down_revision: str | None = "paper_neighbors_v1"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+_QUANTIZED_INDEXES = {
+    "halfvec": """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_papers_embedding_halfvec_hnsw
+        ON papers USING hnsw ((embedding::halfvec(1536)) halfvec_cosine_ops)
+        WITH (m = 32, ef_construction = 200)
+        """,
+    "binary": """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_papers_embedding_bit_hnsw
+        ON papers USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops)
+        WITH (m = 32, ef_construction = 200)
+        """,
+}
+
+
+def upgrade() -> None:
+    ddl = _QUANTIZED_INDEXES.get(settings.PGVECTOR_STORAGE_MODE)
+    if ddl is None:
+        return
+    with op.get_context().autocommit_block():
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_papers_embedding_bit_hnsw")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_papers_embedding_halfvec_hnsw")
@@ -0,0 +1,144 @@
+"""Resize paper embeddings to EMBEDDING_DIMENSIONS.
+
+text-embedding-3 vectors are Matryoshka-trained: the first d components,
+re-normalized, are what the API returns for ``dimensions=d``. Two ways to
+move existing vectors to the configured size:
+
+- truncate (default, shrinking only): keep the leading components and
+  L2-normalize them in place. No API calls.
+- reembed: clear the vectors (has_embedding = false) so the bulk embed
+  and backfill jobs regenerate them at the new size. Required when
+  growing the dimension or for models without Matryoshka training.
+
+Select with ``alembic -x embedding_resize=reembed upgrade head``. Each
+existing HNSW index (full, halfvec, binary) is dropped and rebuilt
+CONCURRENTLY for the new size; only the column rewrite itself blocks
+writes to papers. If a build fails, re-create the index with
+scripts/build_embedding_index.py. The migration is a no-op when the
+column already has the configured size; to resize again later, change
+the setting and run scripts/resize_embeddings.py, which applies the same
+steps outside of alembic.
+
+The embedding store keys vectors by model and dimension, so it needs no
+change beyond dropping its fixed column size.
+
+Revision ID: embedding_dimensions_v1
+Revises: quantized_embeddings_v1
+Create Date: 2026-10-16 18:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import context, op
+from paper_scraper.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "embedding_dimensions_v1"
+down_revision: str | None = "quantized_embeddings_v1"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+# Index name -> (indexed expression, operator class) for a given dimension
+_HNSW_INDEXES = {
+    "ix_papers_embedding_hnsw": ("embedding", "vector_cosine_ops"),
+    "ix_papers_embedding_halfvec_hnsw": ("(embedding::halfvec({dims}))", "halfvec_cosine_ops"),
+    "ix_papers_embedding_bit_hnsw": (
+        "(binary_quantize(embedding)::bit({dims}))",
+        "bit_hamming_ops",
+    ),
+}
+
+
+def _current_dimensions() -> int:
+    # For pgvector columns atttypmod holds the declared dimension
+    return (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT atttypmod FROM pg_attribute "
+                "WHERE attrelid = 'papers'::regclass AND attname = 'embedding'"
+            )
+        )
+        .scalar_one()
+    )
+
+
+def _existing_hnsw_indexes() -> list[str]:
+    existing = set(
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = 'papers' AND indexname = ANY(:names)"
+            ),
+            {"names": list(_HNSW_INDEXES)},
+        )
+        .scalars()
+    )
+    return [name for name in _HNSW_INDEXES if name in existing]
+
+
+def _create_hnsw_indexes(names: list[str], dims: int) -> None:
+    # CONCURRENTLY keeps papers writable during the (long) HNSW builds
+    with op.get_context().autocommit_block():
+        for name in names:
+            expression, opclass = _HNSW_INDEXES[name]
+            op.execute(
+                f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON papers
+                USING hnsw ({expression.format(dims=dims)} {opclass})
+                WITH (m = 32, ef_construction = 200)
+                """
+            )
+
+
+def upgrade() -> None:
+    # Undimensioned column: rows for several model/dimension keys can coexist
+    op.execute("ALTER TABLE embedding_store ALTER COLUMN embedding TYPE vector")
+
+    target = int(settings.EMBEDDING_DIMENSIONS)
+    current = _current_dimensions()
+    if current == target:
+        return
+
+    strategy = context.get_x_argument(as_dictionary=True).get("embedding_resize", "truncate")
+    if strategy not in ("truncate", "reembed"):
+        raise ValueError(f"Unknown embedding_resize strategy: {strategy}")
+    if strategy == "truncate" and target > current:
+        raise ValueError(
+            f"Cannot truncate {current}-d embeddings to {target}-d; "
+            "use -x embedding_resize=reembed"
+        )
+
+    # Rebuild only the indexes this deployment has; dropping them first
+    # keeps the column rewrite below from rebuilding them under its lock
+    indexes = _existing_hnsw_indexes()
+    with op.get_context().autocommit_block():
+        for name in indexes:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    if strategy == "truncate":
+        op.execute(
+            f"""
+            ALTER TABLE papers ALTER COLUMN embedding TYPE vector({target})
+            USING l2_normalize(subvector(embedding, 1, {target}))::vector({target})
+            """
+        )
+    else:
+        op.execute("UPDATE papers SET embedding = NULL, has_embedding = false")
+        op.execute(f"ALTER TABLE papers ALTER COLUMN embedding TYPE vector({target})")
+
+    # Similarities were computed on the old vectors. Lookups fall back to live
+    # kNN until the graph is rebuilt: by the embedding backfill (reembed) or
+    # scripts/build_paper_neighbors.py (truncate)
+    op.execute("TRUNCATE paper_neighbors")
+
+    _create_hnsw_indexes(indexes, target)
+
+
+def downgrade() -> None:
+    # Discarded precision cannot be restored; vectors stay at their current
+    # size. Resize with scripts/resize_embeddings.py instead.
+    pass
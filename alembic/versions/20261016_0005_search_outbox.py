@@ -0,0 +1,42 @@
+"""Add the search_outbox table feeding the Typesense indexer.
+
+Revision ID: search_outbox_v1
+Revises: embedding_dimensions_v1
+Create Date: 2026-10-16 19:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "search_outbox_v1"
+down_revision: str | None = "embedding_dimensions_v1"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_outbox",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("paper_id", sa.Uuid(), nullable=False),
+        sa.Column("organization_id", sa.Uuid(), nullable=True),
+        sa.Column("operation", sa.String(10), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "available_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+    )
+    op.create_index("ix_search_outbox_available", "search_outbox", ["available_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_search_outbox_available", table_name="search_outbox")
+    op.drop_table("search_outbox")
@@ -0,0 +1,29 @@
+"""Add model_configurations.scoring_strategy for combined single-call scoring.
+
+Revision ID: scoring_strategy_v1
+Revises: search_outbox_v1
+Create Date: 2026-10-16 20:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "scoring_strategy_v1"
+down_revision: str | None = "search_outbox_v1"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "model_configurations",
+        sa.Column("scoring_strategy", sa.String(20), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("model_configurations", "scoring_strategy")
@@ -29,7 +29,9 @@ from paper_scraper.core.exceptions import (
     UnauthorizedError,
     ValidationError,
 )
+from paper_scraper.core.http_clients import HTTPClientManager
 from paper_scraper.core.logging import get_logger, setup_logging
+from paper_scraper.core.search_engine import shutdown_typesense_executor
 
 # Setup structured logging
 setup_logging()
@@ -94,6 +96,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await app.state.db_engine.dispose()
         logger.info("Database connection pool disposed")
 
+    shutdown_typesense_executor()
+    await HTTPClientManager.close_all()
+
     logger.info("Cleanup complete")
 
 
@@ -251,12 +256,16 @@ async def readiness_check(request: Request) -> JSONResponse:
 
     status_code = status.HTTP_200_OK if overall_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
 
+    from paper_scraper.modules.scoring.embeddings import query_embedding_cache
+
     return JSONResponse(
         status_code=status_code,
         content={
             "status": "ready" if overall_healthy else "not ready",
             "service": settings.APP_NAME,
             "checks": checks,
+            # Per-process counters since startup
+            "caches": {"query_embeddings": query_embedding_cache.stats()},
         },
     )
 
@@ -49,6 +49,11 @@ class Settings(BaseSettings):
     # pgvector (Vector search — built into PostgreSQL)
     # ==========================================================================
     PGVECTOR_HNSW_EF_SEARCH: int = 100  # Search quality (default 40, higher = better recall)
+    PGVECTOR_ITERATIVE_SCAN: str = "strict_order"  # Filtered kNN: strict_order/relaxed_order/off
+    PGVECTOR_STORAGE_MODE: str = "full"  # kNN candidate index: full/halfvec/binary
+    PGVECTOR_RERANK_CANDIDATES: int = 400  # Quantized candidates re-ranked with full vectors
+    PAPER_NEIGHBORS_ENABLED: bool = True  # Serve similar papers from the precomputed kNN graph
+    PAPER_NEIGHBORS_K: int = 50  # Neighbours stored per paper (>= largest similar-papers limit)
 
     # ==========================================================================
     # AWS Bedrock (LLM inference via AWS credits)
@@ -56,13 +61,39 @@ class Settings(BaseSettings):
     AWS_REGION: str = "eu-central-1"
     AWS_BEDROCK_MODEL: str = "amazon.nova-lite-v1:0"  # Default scoring model
     AWS_BEDROCK_BATCH_S3_BUCKET: str = ""  # S3 bucket for Bedrock batch I/O
+    # cachePoint after the shared scoring prefix; enable only for models with
+    # Bedrock prompt caching (Claude 3.7+/4, Nova), others reject it
+    AWS_BEDROCK_PROMPT_CACHING: bool = False
 
     # ==========================================================================
     # Typesense (Full-text search engine)
     # ==========================================================================
-    TYPESENSE_URL: str = "http://localhost:8108"
+    TYPESENSE_URL: str = "http://localhost:8108"  # Write primary (and sole node by default)
+    TYPESENSE_NODES: list[str] = []  # Read nodes (URLs), round-robin; empty = TYPESENSE_URL
+    TYPESENSE_NEAREST_NODE: str = ""  # Preferred read node (e.g. same-zone replica)
+    TYPESENSE_NUM_RETRIES: int = 3  # Attempts on other nodes after a failed request
+    TYPESENSE_RETRY_INTERVAL_SECONDS: float = 0.1
+    TYPESENSE_HEALTHCHECK_INTERVAL_SECONDS: int = 15  # Before retrying a node marked unhealthy
     TYPESENSE_API_KEY: SecretStr = SecretStr("paperscraper_dev_key")
     TYPESENSE_COLLECTION_PREFIX: str = ""  # Prefix for collection names (e.g., "test_")
+    TYPESENSE_MAX_WORKERS: int = 16  # Thread pool size (and keep-alive pool) for SDK calls
+    TYPESENSE_CATALOG_SHARDS: int = 1  # Global catalog collections; changing it needs a reindex
+    TYPESENSE_REINDEX_BATCH_SIZE: int = 5000  # Documents per JSONL import request
+    TYPESENSE_REINDEX_WRITERS: int = 4  # Concurrent import requests during a reindex
+    TYPESENSE_IMPORT_TIMEOUT_SECONDS: float = 300.0  # Client timeout for reindex imports
+    SEARCH_OUTBOX_BATCH_SIZE: int = 500  # Outbox entries drained per Typesense import
+    SEARCH_OUTBOX_RETRY_BASE_SECONDS: int = 5  # Doubles per failed attempt
+    SEARCH_OUTBOX_RETRY_MAX_SECONDS: int = 900
+    SEARCH_OUTBOX_LAG_WARN_SECONDS: int = 120  # Log a warning when the oldest entry is older
+
+    # ==========================================================================
+    # Search (hybrid leg timeouts, cursor pagination, response cache)
+    # ==========================================================================
+    SEARCH_FULLTEXT_TIMEOUT_SECONDS: float = 2.0  # Typesense leg of hybrid search
+    SEARCH_EMBEDDING_TIMEOUT_SECONDS: float = 3.0  # Query embedding for the pgvector leg
+    SEARCH_CURSOR_TTL_SECONDS: int = 600  # Lifetime of cached hybrid rankings behind a cursor
+    SEARCH_RESPONSE_CACHE_ENABLED: bool = True
+    SEARCH_RESPONSE_CACHE_TTL_SECONDS: int = 60  # Upper bound; index writes invalidate sooner
 
     # ==========================================================================
     # JWT Authentication
@@ -103,8 +134,43 @@ class Settings(BaseSettings):
     LLM_PROVIDER: str = "openai"  # openai, anthropic, ollama, azure
     LLM_MODEL: str = "gpt-5-mini"  # Default model (can be overridden per-org)
     LLM_EMBEDDING_MODEL: str = "text-embedding-3-small"  # For vector embeddings
+    EMBEDDING_DIMENSIONS: int = 1536  # text-embedding-3 output size; sizes the pgvector column
+    EMBEDDING_CACHE_ENABLED: bool = True  # Query embedding cache (process LRU + Redis)
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 2048  # In-process LRU size cap
+    EMBEDDING_CACHE_TTL_SECONDS: int = 86400  # TTL for both cache tiers
+    EMBEDDING_MAX_INPUT_TOKENS: int = 8191  # Per-input token limit (truncate above)
+    EMBEDDING_MAX_BATCH_TOKENS: int = 300_000  # Per-request token limit
+    EMBEDDING_MAX_BATCH_INPUTS: int = 2048  # Per-request input count limit
+    EMBEDDING_MAX_CONCURRENT_REQUESTS: int = 4  # Concurrent sub-batch requests
+    EMBEDDING_MAX_RETRIES: int = 5  # Retries for 429/5xx/connection errors
+    EMBEDDING_STORE_ENABLED: bool = True  # Cross-tenant content-addressed paper embeddings
     LLM_TEMPERATURE: float = 0.3  # Default temperature for scoring
     LLM_MAX_TOKENS: int = 4096  # Max tokens for responses
+    LLM_PROMPT_CACHING: bool = True  # Anthropic cache_control on the shared scoring prefix
+
+    # Scoring call strategy: "per_dimension" (one LLM call per dimension) or
+    # "combined" (one call for all dimensions); overridable per organization
+    # via model_configurations.scoring_strategy
+    SCORING_STRATEGY: str = "per_dimension"
+
+    # Scoring context sources (wall-clock budget each; a slow source is skipped)
+    SCORING_CONTEXT_CITATION_TIMEOUT_SECONDS: float = 10.0  # OpenAlex/Crossref citation graph
+    SCORING_CONTEXT_JSTOR_TIMEOUT_SECONDS: float = 10.0
+    SCORING_CONTEXT_AUTHOR_PROFILES_TIMEOUT_SECONDS: float = 10.0  # GitHub + ORCID
+
+    # Pooled outbound HTTP clients (one pool per host, see core/http_clients.py)
+    HTTPX_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTPX_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTPX_HTTP2: bool = True  # Used when the h2 package is installed
+
+    # Shared enrichment cache (Redis) for citation graph, JSTOR and author profiles
+    ENRICHMENT_CACHE_ENABLED: bool = True
+    ENRICHMENT_CACHE_OPENALEX_TTL_SECONDS: int = 30 * 86400  # DOI -> work ID, work metadata
+    ENRICHMENT_CACHE_CITING_TTL_SECONDS: int = 7 * 86400  # Citing papers keep growing
+    ENRICHMENT_CACHE_JSTOR_TTL_SECONDS: int = 30 * 86400
+    ENRICHMENT_CACHE_PROFILE_TTL_SECONDS: int = 7 * 86400  # ORCID records, GitHub matches
+    ENRICHMENT_CACHE_NEGATIVE_TTL_SECONDS: int = 86400  # Lookups that found nothing
+    ENRICHMENT_PREWARM_CONCURRENCY: int = 8  # Per-key requests in flight while pre-warming
 
     # OpenAI
     OPENAI_API_KEY: SecretStr = SecretStr("")
@@ -212,6 +278,19 @@ class Settings(BaseSettings):
     # ==========================================================================
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:5173"]
 
+    @field_validator("TYPESENSE_NODES", mode="before")
+    @classmethod
+    def parse_typesense_nodes(cls, v: Any) -> list[str]:
+        """Parse Typesense node URLs from a comma-separated string or list."""
+        if isinstance(v, str):
+            if v.startswith("["):
+                import json
+
+                v = json.loads(v)
+            else:
+                v = v.split(",")
+        return [str(url).strip() for url in v or [] if str(url).strip()]
+
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
     def parse_cors_origins(cls, v: Any) -> list[str]:
@@ -327,9 +406,14 @@ class Settings(BaseSettings):
 
         # TLS enforcement for external services in production
         if self.APP_ENV == "production":
-            if self.TYPESENSE_URL.startswith("http://"):
+            typesense_urls = [
+                self.TYPESENSE_URL,
+                *self.TYPESENSE_NODES,
+                self.TYPESENSE_NEAREST_NODE,
+            ]
+            if any(url.startswith("http://") for url in typesense_urls):
                 logger.warning(
-                    "TYPESENSE_URL uses plain HTTP — TLS (https://) is strongly "
+                    "Typesense nodes use plain HTTP — TLS (https://) is strongly "
                     "recommended in production"
                 )
 
@@ -0,0 +1,116 @@
+"""Process-wide registry of pooled httpx clients.
+
+Outbound API calls (LLM providers, OpenAlex, Crossref, GitHub, ORCID,
+Resend) borrow a long-lived AsyncClient per host instead of opening a new
+one per request, so keep-alive connections and TLS sessions are reused.
+Each host gets its own pool with HTTPX_MAX_CONNECTIONS_PER_HOST as its
+limit. HTTP/2 is negotiated when enabled and the ``h2`` package is
+installed (``pip install httpx[http2]``).
+
+The API lifespan and the worker shutdown hook call close_all().
+
+Usage:
+    async with HTTPClientManager.get_client(url, timeout=15.0) as client:
+        response = await client.get(url)
+"""
+
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+import httpx
+
+from paper_scraper.core.config import settings
+
+try:
+    import h2  # noqa: F401
+
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+logger = logging.getLogger(__name__)
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class HTTPClientManager:
+    """Manages shared HTTP clients for connection pooling.
+
+    Clients are keyed by origin (scheme, host, port), timeout and requested
+    pool size, so callers with different timeouts or concurrency needs
+    against the same host get separate pools.
+    """
+
+    _clients: dict[tuple[str, float, int | None], httpx.AsyncClient] = {}
+
+    @classmethod
+    def client(
+        cls,
+        url: str,
+        timeout: float = 120.0,
+        max_connections: int | None = None,
+    ) -> httpx.AsyncClient:
+        """Get or create the shared client for a URL's host.
+
+        Args:
+            url: Any URL on the target host.
+            timeout: Request timeout in seconds.
+            max_connections: Pool size; defaults to HTTPX_MAX_CONNECTIONS_PER_HOST.
+
+        Returns:
+            Shared AsyncClient instance.
+        """
+        key = (_origin(url), timeout, max_connections)
+        client = cls._clients.get(key)
+        if client is None or client.is_closed:
+            limit = max_connections or settings.HTTPX_MAX_CONNECTIONS_PER_HOST
+            client = httpx.AsyncClient(
+                timeout=timeout,
+                http2=settings.HTTPX_HTTP2 and _HAS_H2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=max(5, limit // 2),
+                    max_connections=limit,
+                    keepalive_expiry=settings.HTTPX_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+            cls._clients[key] = client
+        return client
+
+    @classmethod
+    @asynccontextmanager
+    async def get_client(
+        cls,
+        base_url: str,
+        timeout: float = 120.0,
+        max_connections: int | None = None,
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Get or create a shared HTTP client for the given base URL.
+
+        The client stays open when the block exits.
+
+        Args:
+            base_url: Base URL for the API
+            timeout: Request timeout in seconds
+            max_connections: Pool size (default HTTPX_MAX_CONNECTIONS_PER_HOST)
+
+        Yields:
+            Shared AsyncClient instance
+        """
+        yield cls.client(base_url, timeout=timeout, max_connections=max_connections)
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all HTTP clients."""
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Failed to close HTTP client: %s", e)
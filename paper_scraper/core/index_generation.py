@@ -0,0 +1,71 @@
+"""Per-organization search index generation counters.
+
+Every write that can change what a tenant's search returns (Typesense
+sync, paper deletes, new scores) bumps that tenant's generation. Writes
+to the shared global catalog bump a separate global generation. Caches
+of search results embed the current generation in their keys, so a bump
+retires every cached response for the tenant without scanning Redis.
+
+Usage:
+    await index_generation.bump(organization_id)
+    token = await index_generation.current(organization_id, include_global=True)
+"""
+
+import logging
+from uuid import UUID
+
+from paper_scraper.core.redis_base import RedisService
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for generation counters
+INDEX_GENERATION_PREFIX = "search:gen:"
+GLOBAL_GENERATION_KEY = f"{INDEX_GENERATION_PREFIX}global"
+
+
+class IndexGeneration(RedisService):
+    """Redis counters marking when a tenant's search index last changed."""
+
+    @staticmethod
+    def _key(organization_id: UUID | None) -> str:
+        if organization_id is None:
+            return GLOBAL_GENERATION_KEY
+        return f"{INDEX_GENERATION_PREFIX}{organization_id}"
+
+    async def bump(self, organization_id: UUID | None) -> None:
+        """Advance the generation for an organization (None = global catalog).
+
+        Failures are logged and swallowed; cached responses then expire on
+        their own TTL.
+        """
+        try:
+            redis = await self._get_redis()
+            await redis.incr(self._key(organization_id))
+        except Exception as e:
+            logger.warning("Failed to bump search generation for %s: %s", organization_id, e)
+
+    async def current(self, organization_id: UUID, include_global: bool = False) -> str | None:
+        """Return a token identifying the current generation.
+
+        Args:
+            organization_id: Tenant whose generation to read.
+            include_global: Also fold in the global catalog generation
+                (for searches that can return global papers).
+
+        Returns:
+            Generation token, or None if Redis is unavailable.
+        """
+        keys = [self._key(organization_id)]
+        if include_global:
+            keys.append(GLOBAL_GENERATION_KEY)
+        try:
+            redis = await self._get_redis()
+            values = await redis.mget(keys)
+        except Exception as e:
+            logger.warning("Failed to read search generation for %s: %s", organization_id, e)
+            return None
+        return ".".join(v or "0" for v in values)
+
+
+# Module-level singleton
+index_generation = IndexGeneration()
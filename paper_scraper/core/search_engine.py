@@ -6,28 +6,71 @@ Replaces PostgreSQL trigram/ILIKE search with Typesense for:
 - Faceted filtering (source, paper_type, keywords)
 - Instant search (<10ms p99)
 
-Collection: papers — indexed with title, abstract, keywords, and metadata.
+Collections (same schema: title, abstract, keywords, and metadata):
+- papers  — tenant library papers, searched with an organization_id filter
+- catalog — the shared global catalog; with TYPESENSE_CATALOG_SHARDS > 1 it
+  is split into catalog_s0..catalog_sN-1 by a hash of the paper ID
+
+Documents are routed by their is_global flag, so tenant queries and facet
+counts never touch the catalog. Searches over several collections (a
+sharded catalog, or library plus catalog) run as one multi_search and
+are merged here.
+
+Each name is an alias for a versioned collection (papers_v1, papers_v2,
+...); a reindex builds the next versions alongside and swaps the aliases.
+
+Writes and collection management go to the primary (TYPESENSE_URL);
+searches are spread over TYPESENSE_NODES with the SDK's health-checked
+round robin, preferring TYPESENSE_NEAREST_NODE.
+
+The typesense SDK is synchronous (requests-based). All network calls are
+dispatched to a bounded thread pool so they never block the event loop; the
+SDK's shared keep-alive session is sized to match the pool.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 from uuid import UUID
 
 import typesense
+from requests.adapters import HTTPAdapter
 
 from paper_scraper.core.config import settings
+from paper_scraper.core.exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
-# Singleton client
+T = TypeVar("T")
+
+# Singleton clients: writes go to the primary, searches are load-balanced
 _client: typesense.Client | None = None
+_read_client: typesense.Client | None = None
+
+# Bounded executor for blocking Typesense SDK calls
+_executor: ThreadPoolExecutor | None = None
 
-# Schema version — bump when schema changes require reindex
+# Schema version — bump when schema changes require reindex. It is the
+# minimum version of the collection a reindex creates behind the alias.
 SCHEMA_VERSION = 1
 
+# Aliases every read and write goes through
+PAPERS_ALIAS = "papers"
+CATALOG_ALIAS = "catalog"
+
+# Typesense caps per_page; merged multi-collection pages cannot go deeper
+MAX_PER_PAGE = 250
+
+_VERSION_SUFFIX = re.compile(r"_v(\d+)$")
+
 PAPERS_SCHEMA: dict[str, Any] = {
     "fields": [
         {"name": "paper_id", "type": "string"},
@@ -51,41 +94,227 @@ PAPERS_SCHEMA: dict[str, Any] = {
 }
 
 
+def _node_config(url: str) -> dict[str, str]:
+    """Convert a node URL (http[s]://host[:port]) to an SDK node dict."""
+    protocol = "https" if url.startswith("https") else "http"
+    # Strip protocol prefix
+    host_port = url.replace("https://", "").replace("http://", "").rstrip("/")
+    # Split host and port
+    parts = host_port.split(":")
+    host = parts[0]
+    port = int(parts[1]) if len(parts) > 1 else (443 if protocol == "https" else 80)
+    return {"host": host, "port": str(port), "protocol": protocol}
+
+
+def create_typesense_client(
+    connection_timeout_seconds: float = 10,
+    nodes: list[str] | None = None,
+    nearest_node: str | None = None,
+) -> typesense.Client:
+    """Create a Typesense client.
+
+    The SDK round-robins requests over ``nodes``, preferring ``nearest_node``
+    while it is healthy. A node that fails is skipped for
+    TYPESENSE_HEALTHCHECK_INTERVAL_SECONDS, and failed requests are retried
+    on the next node.
+
+    Most callers want the shared get_typesense_client() (writes) or
+    get_typesense_read_client() (searches); bulk jobs create their own with
+    a timeout long enough for large imports.
+
+    Args:
+        connection_timeout_seconds: Per-request timeout.
+        nodes: Node URLs (default: the write primary, TYPESENSE_URL).
+        nearest_node: Preferred node URL, if any.
+    """
+    config: dict[str, Any] = {
+        "api_key": settings.TYPESENSE_API_KEY.get_secret_value(),
+        "nodes": [_node_config(url) for url in nodes or [settings.TYPESENSE_URL]],
+        "connection_timeout_seconds": connection_timeout_seconds,
+        "num_retries": settings.TYPESENSE_NUM_RETRIES,
+        "retry_interval_seconds": settings.TYPESENSE_RETRY_INTERVAL_SECONDS,
+        "healthcheck_interval_seconds": settings.TYPESENSE_HEALTHCHECK_INTERVAL_SECONDS,
+    }
+    if nearest_node:
+        config["nearest_node"] = _node_config(nearest_node)
+
+    client = typesense.Client(config)
+    _size_sdk_connection_pool(settings.TYPESENSE_MAX_WORKERS)
+    return client
+
+
 def get_typesense_client() -> typesense.Client:
-    """Get or create the Typesense client singleton."""
+    """Get or create the client singleton for writes and collection management.
+
+    All writes go to the primary (TYPESENSE_URL), so a document written
+    here is visible to the next read on the same node.
+    """
     global _client
     if _client is None:
-        # Parse URL to extract host, port, protocol
-        url = settings.TYPESENSE_URL
-        protocol = "https" if url.startswith("https") else "http"
-        # Strip protocol prefix
-        host_port = url.replace("https://", "").replace("http://", "")
-        # Split host and port
-        parts = host_port.split(":")
-        host = parts[0]
-        port = int(parts[1]) if len(parts) > 1 else (443 if protocol == "https" else 80)
-
-        _client = typesense.Client(
-            {
-                "api_key": settings.TYPESENSE_API_KEY.get_secret_value(),
-                "nodes": [
-                    {
-                        "host": host,
-                        "port": str(port),
-                        "protocol": protocol,
-                    }
-                ],
-                "connection_timeout_seconds": 10,
-            }
-        )
+        _client = create_typesense_client()
     return _client
 
 
+def get_typesense_read_client() -> typesense.Client:
+    """Get or create the client singleton for searches.
+
+    Balances over TYPESENSE_NODES (replicas may briefly lag the primary).
+    Without configured nodes this is the write client.
+    """
+    global _read_client
+    if not settings.TYPESENSE_NODES and not settings.TYPESENSE_NEAREST_NODE:
+        return get_typesense_client()
+    if _read_client is None:
+        _read_client = create_typesense_client(
+            nodes=settings.TYPESENSE_NODES or [settings.TYPESENSE_URL],
+            nearest_node=settings.TYPESENSE_NEAREST_NODE or None,
+        )
+    return _read_client
+
+
+def _size_sdk_connection_pool(pool_size: int) -> None:
+    """Grow the SDK's shared requests.Session pool to one connection per worker.
+
+    requests defaults to 10 pooled connections per host; with more executor
+    threads than that, surplus connections would be discarded instead of kept
+    alive.
+    """
+    session = getattr(typesense.api_call, "session", None)
+    if session is None:
+        return
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def get_typesense_executor() -> ThreadPoolExecutor:
+    """Get or create the bounded thread pool used for Typesense I/O."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.TYPESENSE_MAX_WORKERS,
+            thread_name_prefix="typesense",
+        )
+    return _executor
+
+
+def shutdown_typesense_executor() -> None:
+    """Shut down the Typesense thread pool (API/worker shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
 def _collection_name(name: str) -> str:
     """Get the full collection name with optional prefix."""
     return f"{settings.TYPESENSE_COLLECTION_PREFIX}{name}"
 
 
+def _versioned_collection_name(name: str, version: int) -> str:
+    """Get the full name of one version of an aliased collection."""
+    return _collection_name(f"{name}_v{version}")
+
+
+def collection_version(collection_name: str) -> int:
+    """Version number of a versioned collection (0 for a legacy, unversioned one)."""
+    match = _VERSION_SUFFIX.search(collection_name)
+    return int(match.group(1)) if match else 0
+
+
+def catalog_collections() -> list[str]:
+    """Alias names of the global catalog shards (unprefixed)."""
+    shards = max(1, settings.TYPESENSE_CATALOG_SHARDS)
+    if shards == 1:
+        return [CATALOG_ALIAS]
+    return [f"{CATALOG_ALIAS}_s{shard}" for shard in range(shards)]
+
+
+def managed_collections() -> list[str]:
+    """Alias names of every collection this module maintains (unprefixed)."""
+    return [PAPERS_ALIAS, *catalog_collections()]
+
+
+def catalog_collection_for(paper_id: str) -> str:
+    """Catalog shard holding a paper; stable for a given shard count."""
+    shards = catalog_collections()
+    return shards[UUID(paper_id).int % len(shards)]
+
+
+def collection_for_document(doc: dict[str, Any]) -> str:
+    """Alias name a paper document is written to (unprefixed)."""
+    if doc.get("is_global"):
+        return catalog_collection_for(doc["id"])
+    return PAPERS_ALIAS
+
+
+def stale_collection_for_document(doc: dict[str, Any]) -> str:
+    """Alias name that held the document before its is_global flag last flipped."""
+    if doc.get("is_global"):
+        return PAPERS_ALIAS
+    return catalog_collection_for(doc["id"])
+
+
+def _hit_sort_key(sort_by: str | None) -> tuple[Callable[[dict[str, Any]], Any], bool]:
+    """Key function and direction for merging hits from several collections.
+
+    Follows the first sort_by clause, falling back to Typesense's default
+    of text match score (descending).
+    """
+    field, _, order = (sort_by or "_text_match:desc").split(",")[0].strip().partition(":")
+    reverse = order.strip().lower() != "asc"
+    if field == "_text_match":
+        return (lambda hit: hit.get("text_match", 0)), reverse
+
+    def key(hit: dict[str, Any]) -> tuple[bool, Any]:
+        value = hit.get("document", {}).get(field)
+        # Documents missing the field sort last in either direction
+        return (value is not None) == reverse, value if value is not None else 0
+
+    return key, reverse
+
+
+def _merge_facet_counts(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sum facet value counts across collections."""
+    merged: dict[str, dict[str, int]] = {}
+    for result in results:
+        for facet in result.get("facet_counts", []):
+            counts = merged.setdefault(facet["field_name"], {})
+            for entry in facet.get("counts", []):
+                counts[entry["value"]] = counts.get(entry["value"], 0) + entry.get("count", 0)
+    return [
+        {
+            "field_name": field,
+            "counts": [
+                {"value": value, "count": count}
+                for value, count in sorted(counts.items(), key=lambda kv: -kv[1])
+            ],
+        }
+        for field, counts in merged.items()
+    ]
+
+
+def merge_search_results(
+    results: list[dict[str, Any]],
+    page: int,
+    page_size: int,
+    sort_by: str | None = None,
+) -> dict[str, Any]:
+    """Merge per-collection results (each fetched from page 1) into one page."""
+    hits = [hit for result in results for hit in result.get("hits", [])]
+    key, reverse = _hit_sort_key(sort_by)
+    hits.sort(key=key, reverse=reverse)
+    start = (page - 1) * page_size
+    return {
+        "found": sum(result.get("found", 0) for result in results),
+        "out_of": sum(result.get("out_of", 0) for result in results),
+        "page": page,
+        "hits": hits[start : start + page_size],
+        "facet_counts": _merge_facet_counts(results),
+        "search_time_ms": max((result.get("search_time_ms", 0) for result in results), default=0),
+    }
+
+
 def _datetime_to_epoch(dt: datetime | None) -> int | None:
     """Convert datetime to epoch seconds for Typesense int64 fields."""
     if dt is None:
@@ -97,44 +326,133 @@ class SearchEngineService:
     """High-level full-text search operations backed by Typesense.
 
     Provides tenant-isolated search with BM25 ranking, typo tolerance,
-    and faceted filtering.
+    and faceted filtering. Every network-bound method is a coroutine that
+    runs the blocking SDK call on the shared Typesense executor.
     """
 
-    def __init__(self, client: typesense.Client | None = None) -> None:
+    def __init__(
+        self,
+        client: typesense.Client | None = None,
+        read_client: typesense.Client | None = None,
+    ) -> None:
         self._client = client or get_typesense_client()
+        # An explicitly injected client serves reads too
+        self._read_client = read_client or client or get_typesense_read_client()
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking SDK call on the bounded Typesense executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_typesense_executor(),
+            functools.partial(fn, *args, **kwargs),
+        )
 
     # =========================================================================
     # Collection Management
     # =========================================================================
 
     async def ensure_collections(self) -> None:
-        """Create collections if they don't exist.
-
-        Note: Typesense client is synchronous. This method wraps sync calls
-        for consistency with the async interface.
-        """
-        self._ensure_collection_sync("papers", PAPERS_SCHEMA)
+        """Create collections (and their aliases) if they don't exist."""
+        for name in managed_collections():
+            await self._run(self._ensure_collection_sync, name, PAPERS_SCHEMA)
 
     def _ensure_collection_sync(self, name: str, schema: dict[str, Any]) -> None:
-        """Synchronously ensure a collection exists."""
+        """Synchronously ensure an aliased collection exists.
+
+        Typesense resolves aliases on collection lookups, so an existing
+        alias (or a legacy unversioned collection of the same name) counts.
+        """
         full_name = _collection_name(name)
         try:
             self._client.collections[full_name].retrieve()
             logger.debug("Typesense collection %s already exists", full_name)
+            return
+        except typesense.exceptions.ObjectNotFound:
+            pass
+
+        target = _versioned_collection_name(name, SCHEMA_VERSION)
+        try:
+            self._client.collections[target].retrieve()
+        except typesense.exceptions.ObjectNotFound:
+            self._client.collections.create({"name": target, **schema})
+            logger.info("Created Typesense collection: %s", target)
+        self._client.aliases.upsert(full_name, {"collection_name": target})
+        logger.info("Pointed Typesense alias %s at %s", full_name, target)
+
+    async def resolve_collection(self, name: str = PAPERS_ALIAS) -> str | None:
+        """Return the collection an alias currently points at.
+
+        Returns:
+            The aliased collection, the name itself for a legacy unversioned
+            collection, or None if neither exists.
+        """
+        return await self._run(self._resolve_collection_sync, name)
+
+    def _resolve_collection_sync(self, name: str) -> str | None:
+        full_name = _collection_name(name)
+        try:
+            return self._client.aliases[full_name].retrieve()["collection_name"]
+        except typesense.exceptions.ObjectNotFound:
+            pass
+        try:
+            self._client.collections[full_name].retrieve()
+            return full_name
         except typesense.exceptions.ObjectNotFound:
-            create_schema = {
-                "name": full_name,
-                **schema,
-            }
-            self._client.collections.create(create_schema)
-            logger.info("Created Typesense collection: %s", full_name)
+            return None
+
+    async def create_versioned_collection(
+        self,
+        version: int,
+        name: str = PAPERS_ALIAS,
+        schema: dict[str, Any] | None = None,
+    ) -> str:
+        """Create (or recreate, after an aborted reindex) a collection version.
+
+        Returns:
+            Full name of the new, empty collection.
+        """
+        target = _versioned_collection_name(name, version)
+        await self.drop_collection(target)
+        await self._run(
+            self._client.collections.create, {"name": target, **(schema or PAPERS_SCHEMA)}
+        )
+        logger.info("Created Typesense collection: %s", target)
+        return target
+
+    async def count_documents(self, collection_name: str) -> int:
+        """Number of documents in a collection (by its full name)."""
+        info = await self._run(self._client.collections[collection_name].retrieve)
+        return int(info.get("num_documents", 0))
+
+    async def point_alias(self, collection_name: str, name: str = PAPERS_ALIAS) -> None:
+        """Atomically switch an alias to a collection.
+
+        A legacy unversioned collection holding the alias name is dropped
+        first; searches fail for the moment between the two calls, so this
+        happens only on the first reindex after upgrading.
+        """
+        full_name = _collection_name(name)
+        if await self.resolve_collection(name) == full_name:
+            logger.warning("Replacing legacy Typesense collection %s with an alias", full_name)
+            await self.drop_collection(full_name)
+        await self._run(
+            self._client.aliases.upsert, full_name, {"collection_name": collection_name}
+        )
+        logger.info("Pointed Typesense alias %s at %s", full_name, collection_name)
+
+    async def drop_collection(self, collection_name: str) -> None:
+        """Delete a collection by its full name; missing collections are ignored."""
+        try:
+            await self._run(self._client.collections[collection_name].delete)
+        except typesense.exceptions.ObjectNotFound:
+            pass
 
     async def delete_collections(self) -> None:
         """Delete all managed collections. Used in testing."""
-        for name in ["papers"]:
+        for name in managed_collections():
             full_name = _collection_name(name)
             try:
-                self._client.collections[full_name].delete()
+                await self._run(self._client.collections[full_name].delete)
             except Exception:
                 pass
 
@@ -142,53 +460,161 @@ class SearchEngineService:
     # Indexing
     # =========================================================================
 
-    def index_paper(self, paper_data: dict[str, Any]) -> None:
+    async def index_paper(self, paper_data: dict[str, Any]) -> None:
         """Index or update a single paper document.
 
+        The document is also removed from the collection it would have been
+        routed to with the opposite is_global flag, so a paper that moved
+        between library and catalog is not returned twice.
+
         Args:
             paper_data: Paper document with fields matching PAPERS_SCHEMA
         """
-        full_name = _collection_name("papers")
-        self._client.collections[full_name].documents.upsert(paper_data)
+        full_name = _collection_name(collection_for_document(paper_data))
+        await self._run(self._client.collections[full_name].documents.upsert, paper_data)
+        stale_name = _collection_name(stale_collection_for_document(paper_data))
+        try:
+            await self._run(
+                self._client.collections[stale_name].documents[paper_data["id"]].delete
+            )
+        except typesense.exceptions.ObjectNotFound:
+            pass
 
-    def index_papers_batch(
+    async def index_papers_batch(
         self,
         papers: list[dict[str, Any]],
         action: str = "upsert",
     ) -> list[dict[str, Any]]:
-        """Batch index papers.
+        """Batch index papers, one import per target collection.
+
+        Like index_paper, each document is then deleted from its stale
+        collection (one filtered delete per collection).
 
         Args:
             papers: List of paper documents
             action: Import action (create, upsert, update)
 
         Returns:
-            List of import results (one per document)
+            List of import results (one per document, in input order)
         """
         if not papers:
             return []
 
-        full_name = _collection_name("papers")
-        results = self._client.collections[full_name].documents.import_(papers, {"action": action})
+        groups: dict[str, list[int]] = {}
+        for index, paper in enumerate(papers):
+            groups.setdefault(collection_for_document(paper), []).append(index)
+
+        group_results = await asyncio.gather(
+            *(
+                self._run(
+                    self._client.collections[_collection_name(name)].documents.import_,
+                    [papers[i] for i in indexes],
+                    {"action": action},
+                )
+                for name, indexes in groups.items()
+            )
+        )
+        results: list[dict[str, Any]] = [{}] * len(papers)
+        for indexes, imported in zip(groups.values(), group_results, strict=True):
+            for i, result in zip(indexes, imported, strict=False):
+                results[i] = result
+
+        stale: dict[str, list[str]] = {}
+        for paper in papers:
+            stale.setdefault(stale_collection_for_document(paper), []).append(paper["id"])
+        await asyncio.gather(
+            *(
+                self._run(
+                    self._client.collections[_collection_name(name)].documents.delete,
+                    {"filter_by": f"paper_id:[{','.join(ids)}]"},
+                )
+                for name, ids in stale.items()
+            )
+        )
         return results
 
-    def delete_paper(self, paper_id: str) -> None:
-        """Delete a paper from the search index."""
-        full_name = _collection_name("papers")
-        try:
-            self._client.collections[full_name].documents[paper_id].delete()
-        except typesense.exceptions.ObjectNotFound:
-            pass
+    async def import_jsonl(
+        self,
+        collection_name: str,
+        jsonl: str,
+        action: str = "create",
+    ) -> tuple[int, list[str]]:
+        """Import a pre-serialized JSONL batch into a collection.
+
+        Used by reindexing, which serializes documents while the previous
+        batch is in flight instead of handing the SDK Python lists.
+
+        Args:
+            collection_name: Full collection name (not an alias).
+            jsonl: Newline-separated JSON documents.
+            action: Import action (create, upsert, update).
+
+        Returns:
+            Tuple of (documents imported, error messages of failed ones).
+        """
+        response = await self._run(
+            self._client.collections[collection_name].documents.import_,
+            jsonl,
+            {"action": action},
+        )
+        imported = 0
+        errors: list[str] = []
+        for line in response.splitlines():
+            result = json.loads(line)
+            if result.get("success", False):
+                imported += 1
+            else:
+                errors.append(str(result.get("error", "unknown error")))
+        return imported, errors
+
+    async def delete_paper(self, paper_id: str) -> None:
+        """Delete a paper from the search index.
+
+        The paper may be a library or a catalog paper, so both candidate
+        collections are tried.
+        """
+        for name in (PAPERS_ALIAS, catalog_collection_for(paper_id)):
+            full_name = _collection_name(name)
+            try:
+                await self._run(self._client.collections[full_name].documents[paper_id].delete)
+            except typesense.exceptions.ObjectNotFound:
+                pass
 
-    def delete_papers_by_org(self, organization_id: UUID) -> int:
+    async def delete_papers(self, paper_ids: list[str]) -> int:
+        """Delete several papers from the search index, one request per collection.
+
+        Returns:
+            Number of documents deleted (missing ones are not an error)
+        """
+        if not paper_ids:
+            return 0
+        groups: dict[str, list[str]] = {PAPERS_ALIAS: list(paper_ids)}
+        for paper_id in paper_ids:
+            groups.setdefault(catalog_collection_for(paper_id), []).append(paper_id)
+
+        results = await asyncio.gather(
+            *(
+                self._run(
+                    self._client.collections[_collection_name(name)].documents.delete,
+                    {"filter_by": f"paper_id:[{','.join(ids)}]"},
+                )
+                for name, ids in groups.items()
+            )
+        )
+        return sum(result.get("num_deleted", 0) for result in results)
+
+    async def delete_papers_by_org(self, organization_id: UUID) -> int:
         """Delete all papers for an organization from the search index.
 
+        Only the library collection holds tenant documents.
+
         Returns:
             Number of documents deleted
         """
-        full_name = _collection_name("papers")
-        result = self._client.collections[full_name].documents.delete(
-            {"filter_by": f"organization_id:={organization_id}"}
+        full_name = _collection_name(PAPERS_ALIAS)
+        result = await self._run(
+            self._client.collections[full_name].documents.delete,
+            {"filter_by": f"organization_id:={organization_id}"},
         )
         return result.get("num_deleted", 0)
 
@@ -196,7 +622,7 @@ class SearchEngineService:
     # Search
     # =========================================================================
 
-    def search_papers(
+    async def search_papers(
         self,
         query: str,
         organization_id: UUID,
@@ -209,35 +635,35 @@ class SearchEngineService:
     ) -> dict[str, Any]:
         """Full-text search for papers.
 
+        Library searches query only the tenant collection; catalog searches
+        query only the catalog shards; scope 'all' queries both. A search
+        over several collections is one multi_search whose results are
+        merged into a single page. Each collection returns at most
+        MAX_PER_PAGE hits, so later pages of such searches must end within
+        the first MAX_PER_PAGE results (a first page is capped instead).
+
         Args:
             query: Search query text
-            organization_id: Tenant isolation filter (used when scope='library')
+            organization_id: Tenant isolation filter (used for library papers)
             page: Page number (1-indexed)
             page_size: Results per page
             filter_by: Additional Typesense filter expression
             sort_by: Sort expression (e.g., "created_at:desc")
             facet_by: Facet fields (e.g., "source,paper_type")
-            scope: 'library' for org-scoped search, 'catalog' for global
+            scope: 'library' for org-scoped search, 'catalog' for global,
+                'all' for both
 
         Returns:
             Typesense search result with hits, found count, facets, etc.
-        """
-        full_name = _collection_name("papers")
-
-        # Build filter based on scope
-        if scope == "catalog":
-            filters = ["is_global:=true"]
-        else:
-            filters = [f"organization_id:={organization_id}"]
-        if filter_by:
-            filters.append(filter_by)
-        filter_str = " && ".join(filters)
 
+        Raises:
+            ValidationError: If a multi-collection search asks for a later
+                page reaching past the first MAX_PER_PAGE results.
+        """
         search_params: dict[str, Any] = {
             "q": query,
             "query_by": "title,abstract,keywords",
             "query_by_weights": "3,1,2",
-            "filter_by": filter_str,
             "per_page": page_size,
             "page": page,
             "highlight_full_fields": "title,abstract",
@@ -252,9 +678,53 @@ class SearchEngineService:
         if facet_by:
             search_params["facet_by"] = facet_by
 
-        return self._client.collections[full_name].documents.search(search_params)
-
-    def multi_search(
+        # (collection, filter) per target; catalog documents need no scope filter
+        org_filter = f"organization_id:={organization_id}"
+        targets: list[tuple[str, list[str]]] = []
+        if scope != "catalog":
+            targets.append((PAPERS_ALIAS, [org_filter]))
+        if scope != "library":
+            targets.extend((name, []) for name in catalog_collections())
+        if filter_by:
+            for _, filters in targets:
+                filters.append(filter_by)
+
+        if len(targets) == 1:
+            name, filters = targets[0]
+            if filters:
+                search_params["filter_by"] = " && ".join(filters)
+            return await self._run(
+                self._read_client.collections[_collection_name(name)].documents.search,
+                search_params,
+            )
+
+        # Every collection returns its own top page * page_size; merge after
+        if page > 1 and page * page_size > MAX_PER_PAGE:
+            raise ValidationError(
+                f"Only the first {MAX_PER_PAGE} results can be paged through for this "
+                "search scope; refine the query or filters",
+                field="page",
+            )
+        search_params["page"] = 1
+        search_params["per_page"] = min(page * page_size, MAX_PER_PAGE)
+        searches = []
+        for name, filters in targets:
+            search = {"collection": _collection_name(name)}
+            if filters:
+                search["filter_by"] = " && ".join(filters)
+            searches.append(search)
+        response = await self._run(
+            self._read_client.multi_search.perform, {"searches": searches}, search_params
+        )
+        results = response.get("results", [])
+        for result in results:
+            if "error" in result:
+                raise typesense.exceptions.TypesenseClientError(
+                    f"Multi-collection search failed: {result['error']}"
+                )
+        return merge_search_results(results, page, page_size, sort_by)
+
+    async def multi_search(
         self,
         searches: list[dict[str, Any]],
         organization_id: UUID | None = None,
@@ -276,7 +746,8 @@ class SearchEngineService:
                 if org_filter not in existing:
                     s["filter_by"] = f"{existing} && {org_filter}" if existing else org_filter
 
-        return self._client.multi_search.perform(
+        return await self._run(
+            self._read_client.multi_search.perform,
             {"searches": searches},
             {},
         )
@@ -0,0 +1,244 @@
+"""Transactional outbox for the Typesense search index.
+
+Code that changes a paper records the change with enqueue_paper_sync()
+on its own session, so the outbox row commits (or rolls back) together
+with the change and no request waits on Typesense. The search indexer
+job drains the outbox:
+
+- claims a batch with FOR UPDATE SKIP LOCKED (indexers can run in parallel)
+- coalesces entries per paper; the latest operation wins
+- upserts current paper state from PostgreSQL with one import_ call and
+  deletes removed papers with one filtered delete
+- deletes the entries that succeeded; failed ones are retried with
+  exponential backoff and keep their last error
+- bumps the search index generations of the affected tenants
+
+Usage:
+    await enqueue_paper_sync(db, [paper.id])
+    await db.commit()
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.database import get_db_session
+from paper_scraper.core.index_generation import IndexGeneration, index_generation
+from paper_scraper.core.search_engine import SearchEngineService
+from paper_scraper.core.sync import PAPER_DOCUMENT_COLUMNS, paper_row_to_document
+from paper_scraper.modules.papers.models import Paper
+from paper_scraper.modules.search.models import SearchOutboxEntry
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_UPSERT = "upsert"
+OUTBOX_DELETE = "delete"
+
+
+async def enqueue_paper_sync(
+    db: AsyncSession,
+    paper_ids: Iterable[UUID],
+    operation: str = OUTBOX_UPSERT,
+    organization_id: UUID | None = None,
+) -> None:
+    """Record that papers' search documents must be rewritten (or deleted).
+
+    Runs on the caller's session and does not commit; the entries become
+    visible to the indexer with the caller's transaction.
+
+    Args:
+        db: The session making the paper change.
+        paper_ids: Changed papers.
+        operation: OUTBOX_UPSERT or OUTBOX_DELETE.
+        organization_id: Owning tenant; needed for deletes, whose paper row
+            is gone by the time the indexer runs.
+    """
+    rows = [
+        {"paper_id": paper_id, "operation": operation, "organization_id": organization_id}
+        for paper_id in dict.fromkeys(paper_ids)
+    ]
+    if rows:
+        await db.execute(insert(SearchOutboxEntry), rows)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    seconds = settings.SEARCH_OUTBOX_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.SEARCH_OUTBOX_RETRY_MAX_SECONDS))
+
+
+class SearchIndexer:
+    """Drains the search outbox into Typesense in coalesced batches."""
+
+    def __init__(
+        self,
+        search: SearchEngineService | None = None,
+        generations: IndexGeneration | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        self.search = search or SearchEngineService()
+        self.generations = generations or index_generation
+        self.batch_size = batch_size or settings.SEARCH_OUTBOX_BATCH_SIZE
+
+    async def drain(self, max_batches: int | None = None) -> dict[str, int]:
+        """Process outbox batches until the outbox has nothing due.
+
+        Args:
+            max_batches: Stop after this many batches (None = until empty).
+
+        Returns:
+            Dict with entries processed, papers indexed and deleted, and
+            papers whose write failed and was rescheduled.
+        """
+        totals = {"entries": 0, "indexed": 0, "deleted": 0, "failed": 0}
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            stats = await self.drain_batch()
+            if not stats["entries"]:
+                break
+            for key, value in stats.items():
+                totals[key] += value
+            batches += 1
+            if stats["failed"] == stats["entries"]:
+                # Typesense is likely down; leave the rest to the next run
+                break
+        return totals
+
+    async def drain_batch(self) -> dict[str, int]:
+        """Claim, apply and settle one batch of due outbox entries."""
+        targets: set[UUID | None] = set()
+        async with get_db_session() as db:
+            entries = list(
+                (
+                    await db.execute(
+                        select(SearchOutboxEntry)
+                        .where(SearchOutboxEntry.available_at <= func.now())
+                        .order_by(SearchOutboxEntry.id)
+                        .limit(self.batch_size)
+                        .with_for_update(skip_locked=True)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not entries:
+                return {"entries": 0, "indexed": 0, "deleted": 0, "failed": 0}
+
+            # Coalesce: only the latest entry per paper matters
+            latest: dict[UUID, SearchOutboxEntry] = {}
+            for entry in entries:
+                latest[entry.paper_id] = entry
+
+            upsert_ids = [pid for pid, e in latest.items() if e.operation == OUTBOX_UPSERT]
+            rows = {}
+            if upsert_ids:
+                result = await db.execute(
+                    select(*PAPER_DOCUMENT_COLUMNS).where(Paper.id.in_(upsert_ids))
+                )
+                rows = {row.id: row for row in result.all()}
+            # Papers deleted after their upsert was recorded are removed instead
+            delete_ids = [pid for pid in latest if pid not in rows]
+
+            failures = await self._upsert(rows)
+            failures.update(await self._delete(delete_ids))
+
+            for paper_id, entry in latest.items():
+                if paper_id in failures:
+                    continue
+                row = rows.get(paper_id)
+                if row is not None:
+                    targets.add(row.organization_id)
+                    if row.is_global:
+                        targets.add(None)
+                else:
+                    targets.add(entry.organization_id)
+
+            await self._settle(db, entries, latest, failures)
+            await db.commit()
+
+        for organization_id in targets:
+            await self.generations.bump(organization_id)
+
+        return {
+            "entries": len(entries),
+            "indexed": len(rows) - sum(1 for pid in rows if pid in failures),
+            "deleted": len(delete_ids) - sum(1 for pid in delete_ids if pid in failures),
+            "failed": len(failures),
+        }
+
+    async def _upsert(self, rows: dict[UUID, Any]) -> dict[UUID, str]:
+        """Import current paper documents; returns errors by paper ID."""
+        if not rows:
+            return {}
+        documents = [paper_row_to_document(row) for row in rows.values()]
+        try:
+            results = await self.search.index_papers_batch(documents, action="upsert")
+        except Exception as e:
+            logger.warning("Search outbox import of %d papers failed: %s", len(documents), e)
+            return {paper_id: str(e) for paper_id in rows}
+        return {
+            paper_id: str(result.get("error", "unknown error"))
+            for paper_id, result in zip(rows, results, strict=False)
+            if not result.get("success", False)
+        }
+
+    async def _delete(self, paper_ids: list[UUID]) -> dict[UUID, str]:
+        """Delete documents of removed papers; returns errors by paper ID."""
+        if not paper_ids:
+            return {}
+        try:
+            await self.search.delete_papers([str(pid) for pid in paper_ids])
+        except Exception as e:
+            logger.warning("Search outbox delete of %d papers failed: %s", len(paper_ids), e)
+            return {paper_id: str(e) for paper_id in paper_ids}
+        return {}
+
+    @staticmethod
+    async def _settle(
+        db: AsyncSession,
+        entries: list[SearchOutboxEntry],
+        latest: dict[UUID, SearchOutboxEntry],
+        failures: dict[UUID, str],
+    ) -> None:
+        """Delete applied entries; reschedule the latest entry of failed papers."""
+        retry = {latest[paper_id].id for paper_id in failures}
+        done = [entry.id for entry in entries if entry.id not in retry]
+        if done:
+            await db.execute(delete(SearchOutboxEntry).where(SearchOutboxEntry.id.in_(done)))
+        for paper_id, error in failures.items():
+            entry = latest[paper_id]
+            await db.execute(
+                update(SearchOutboxEntry)
+                .where(SearchOutboxEntry.id == entry.id)
+                .values(
+                    attempts=SearchOutboxEntry.attempts + 1,
+                    last_error=error[:1000],
+                    available_at=func.now() + _retry_delay(entry.attempts + 1),
+                )
+            )
+
+    @staticmethod
+    async def lag() -> dict[str, Any]:
+        """Outbox backlog: pending entries, how many are retrying, oldest age."""
+        async with get_db_session() as db:
+            row = (
+                await db.execute(
+                    select(
+                        func.count(),
+                        func.count().filter(SearchOutboxEntry.attempts > 0),
+                        func.extract("epoch", func.now() - func.min(SearchOutboxEntry.created_at)),
+                    )
+                )
+            ).one()
+        return {
+            "pending": row[0],
+            "retrying": row[1],
+            "oldest_age_seconds": float(row[2] or 0.0),
+        }
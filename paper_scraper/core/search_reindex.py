@@ -0,0 +1,273 @@
+"""Zero-downtime rebuild of the Typesense paper collections.
+
+Searches and sync writes address aliases ("papers" and the catalog
+shards). A reindex builds the next version of every collection next to
+the live ones and only then moves the aliases:
+
+1. Create <alias>_v{N+1} for each alias (N = highest live version).
+2. Stream every paper from PostgreSQL with keyset pagination on the
+   primary key, route each document to its collection, serialize each
+   page to JSONL and hand it to a pool of concurrent import_ writers
+   while the next page is read.
+3. Verify each new collection holds exactly the documents streamed to it.
+4. Re-import papers updated since the run started (sync writes during the
+   run went to the old collections), then once more for the papers
+   updated during that catch-up, right before the swap.
+5. Swap the aliases (catalog shards first, then the tenant collection)
+   and drop the previous versions.
+6. Re-import papers updated since the last catch-up began, so writes that
+   reached the old collections between that read and the swap are not lost.
+
+Each swap is atomic. Catalog and library searches never share a
+collection, so they see a consistent index throughout. A reindex is also
+how a new TYPESENSE_CATALOG_SHARDS value takes effect.
+
+If any step fails the aliases are left untouched and the partial
+collections are dropped, so searches keep hitting the previous versions.
+Papers deleted while a reindex runs may survive in the new collection
+until they are deleted again.
+
+Usage:
+    result = await SearchReindexer().run()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import select
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.database import get_db_session
+from paper_scraper.core.search_engine import (
+    PAPERS_ALIAS,
+    SCHEMA_VERSION,
+    SearchEngineService,
+    _collection_name,
+    collection_for_document,
+    collection_version,
+    create_typesense_client,
+    managed_collections,
+)
+from paper_scraper.core.sync import PAPER_DOCUMENT_COLUMNS, paper_row_to_document
+from paper_scraper.modules.papers.models import Paper
+
+logger = logging.getLogger(__name__)
+
+# Failed-document messages kept for the abort message
+MAX_REPORTED_ERRORS = 20
+
+_SENTINEL = None
+
+
+class ReindexError(Exception):
+    """Raised when a reindex is aborted before the alias swap."""
+
+
+@dataclass
+class ReindexResult:
+    """Outcome of a completed reindex."""
+
+    collections: dict[str, str]  # alias -> new collection
+    previous_collections: dict[str, str | None]
+    documents_indexed: int
+    documents_caught_up: int
+    duration_seconds: float
+
+
+class SearchReindexer:
+    """Rebuild the paper collections behind their aliases without a search outage."""
+
+    def __init__(
+        self,
+        search: SearchEngineService | None = None,
+        batch_size: int | None = None,
+        writers: int | None = None,
+    ) -> None:
+        # Own client: JSONL imports need a much longer timeout than searches
+        self.search = search or SearchEngineService(
+            client=create_typesense_client(settings.TYPESENSE_IMPORT_TIMEOUT_SECONDS)
+        )
+        self.batch_size = batch_size or settings.TYPESENSE_REINDEX_BATCH_SIZE
+        self.writers = writers or settings.TYPESENSE_REINDEX_WRITERS
+
+    async def run(self, keep_previous: bool = False) -> ReindexResult:
+        """Build the next collection versions and swap the aliases to them.
+
+        Args:
+            keep_previous: Keep the old collections for a manual rollback
+                (point the aliases back at them) instead of dropping them.
+
+        Returns:
+            ReindexResult for the new collections.
+
+        Raises:
+            ReindexError: If documents failed to import or the counts do not
+                match; the aliases still point at the previous collections.
+        """
+        started_at = datetime.now(UTC)
+        aliases = managed_collections()
+        previous = {alias: await self.search.resolve_collection(alias) for alias in aliases}
+        live_versions = [collection_version(c) for c in previous.values() if c is not None]
+        version = max(SCHEMA_VERSION, max(live_versions, default=0) + 1)
+        targets = {
+            alias: await self.search.create_versioned_collection(version, alias)
+            for alias in aliases
+        }
+        logger.info("Reindexing Typesense papers into version %d (previous: %s)", version, previous)
+
+        try:
+            streamed, errors = await self._stream(targets, action="create")
+            if errors:
+                raise ReindexError(f"Documents failed to import: {errors[:3]}")
+            for alias, target in targets.items():
+                indexed = await self.search.count_documents(target)
+                if indexed != streamed[alias]:
+                    raise ReindexError(
+                        f"{target} holds {indexed} documents, expected {streamed[alias]}; "
+                        "aliases not switched"
+                    )
+
+            # Catch up on writes that landed in the old collections meanwhile,
+            # then again on the (short) window the first catch-up took
+            caught_up = dict.fromkeys(targets, 0)
+            since = started_at
+            for _ in range(2):
+                since = await self._catch_up(targets, since, caught_up)
+        except BaseException:
+            for target in targets.values():
+                await self.search.drop_collection(target)
+            raise
+
+        # Tenant collection last: until then it still holds legacy catalog documents
+        for alias in sorted(aliases, key=lambda a: a == PAPERS_ALIAS):
+            await self.search.point_alias(targets[alias], alias)
+        # Writes between the last catch-up read and the swap went to the old
+        # collections; the new ones are live now, so upserting them is safe
+        try:
+            await self._catch_up(targets, since, caught_up)
+        except ReindexError as e:
+            logger.warning("Post-swap catch-up incomplete: %s", e)
+        if not keep_previous:
+            for alias, old in previous.items():
+                # A legacy collection named like its alias was dropped by point_alias
+                if old is not None and old != targets[alias] and old != _collection_name(alias):
+                    await self.search.drop_collection(old)
+
+        total = sum(streamed.values())
+        duration = (datetime.now(UTC) - started_at).total_seconds()
+        logger.info(
+            "Reindexed %d papers into version %d in %.0fs (%d caught up)",
+            total,
+            version,
+            duration,
+            sum(caught_up.values()),
+        )
+        return ReindexResult(
+            collections=targets,
+            previous_collections=previous,
+            documents_indexed=total,
+            documents_caught_up=sum(caught_up.values()),
+            duration_seconds=duration,
+        )
+
+    async def _catch_up(
+        self,
+        targets: dict[str, str],
+        since: datetime,
+        caught_up: dict[str, int],
+    ) -> datetime:
+        """Re-import papers updated since `since` into the new collections.
+
+        Returns:
+            When this catch-up started reading, for the next catch-up.
+
+        Raises:
+            ReindexError: If documents failed to import.
+        """
+        read_started = datetime.now(UTC)
+        imported, errors = await self._stream(targets, action="upsert", updated_since=since)
+        if errors:
+            raise ReindexError(f"Documents failed to catch up: {errors[:3]}")
+        for alias, count in imported.items():
+            caught_up[alias] += count
+        return read_started
+
+    async def _stream(
+        self,
+        targets: dict[str, str],
+        action: str,
+        updated_since: datetime | None = None,
+    ) -> tuple[dict[str, int], list[str]]:
+        """Read papers in primary-key order and import them with parallel writers.
+
+        Args:
+            targets: Alias name -> collection the documents routed to it go to.
+
+        Returns:
+            Tuple of (documents imported per alias, sample of import error messages).
+        """
+        # Bounded queue: reading runs at most `writers` batches ahead of imports
+        queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize=self.writers)
+        imported = dict.fromkeys(targets, 0)
+        errors: list[str] = []
+
+        async def writer() -> None:
+            while (item := await queue.get()) is not _SENTINEL:
+                alias, jsonl = item
+                ok, failed = await self.search.import_jsonl(targets[alias], jsonl, action)
+                imported[alias] += ok
+                errors.extend(failed[: max(0, MAX_REPORTED_ERRORS - len(errors))])
+
+        writer_tasks = [asyncio.create_task(writer()) for _ in range(self.writers)]
+        try:
+            after_id: UUID | None = None
+            # Stop reading at the first failed document; the run is aborted anyway
+            while not errors:
+                rows = await self._read_page(after_id, updated_since)
+                if not rows:
+                    break
+                after_id = rows[-1].id
+                batches: dict[str, list[str]] = {}
+                for row in rows:
+                    doc = paper_row_to_document(row)
+                    batches.setdefault(collection_for_document(doc), []).append(json.dumps(doc))
+                for alias, lines in batches.items():
+                    await self._put(queue, (alias, "\n".join(lines)), writer_tasks)
+            for _ in writer_tasks:
+                await self._put(queue, _SENTINEL, writer_tasks)
+            await asyncio.gather(*writer_tasks)
+        finally:
+            for task in writer_tasks:
+                task.cancel()
+        return imported, errors
+
+    @staticmethod
+    async def _put(
+        queue: asyncio.Queue[tuple[str, str] | None],
+        item: tuple[str, str] | None,
+        writer_tasks: list[asyncio.Task[None]],
+    ) -> None:
+        """Enqueue a batch, raising a writer's exception instead of blocking forever."""
+        put = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait([put, *writer_tasks], return_when=asyncio.FIRST_COMPLETED)
+        for task in writer_tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                put.cancel()
+                raise task.exception()
+        await put
+
+    async def _read_page(self, after_id: UUID | None, updated_since: datetime | None) -> list:
+        """One keyset page; a short session per page keeps no long transaction open."""
+        query = select(*PAPER_DOCUMENT_COLUMNS).order_by(Paper.id).limit(self.batch_size)
+        if after_id is not None:
+            query = query.where(Paper.id > after_id)
+        if updated_since is not None:
+            query = query.where(Paper.updated_at >= updated_since)
+        async with get_db_session() as db:
+            return list((await db.execute(query)).all())
@@ -3,9 +3,16 @@
 PostgreSQL is the source of truth for all data, including vector embeddings
 (stored via pgvector). Typesense provides fast full-text search.
 
+Every write also bumps the affected search index generation so cached
+search responses for that tenant (or the global catalog) are retired.
+
+Application code records paper changes in the search outbox instead
+(core.search_outbox) so requests never wait on Typesense; SyncService is
+for direct writes from maintenance code and tests.
+
 Usage:
     sync = SyncService()
-    sync.sync_paper(paper_id, organization_id, title, ...)
+    await sync.sync_paper(paper_id, organization_id, title, ...)
 """
 
 from __future__ import annotations
@@ -15,10 +22,30 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from paper_scraper.core.index_generation import IndexGeneration, index_generation
 from paper_scraper.core.search_engine import SearchEngineService
+from paper_scraper.modules.papers.models import Paper
 
 logger = logging.getLogger(__name__)
 
+# Paper columns a search document is built from; full_text and vectors stay in Postgres
+PAPER_DOCUMENT_COLUMNS = (
+    Paper.id,
+    Paper.organization_id,
+    Paper.title,
+    Paper.abstract,
+    Paper.doi,
+    Paper.source,
+    Paper.journal,
+    Paper.paper_type,
+    Paper.keywords,
+    Paper.citations_count,
+    Paper.has_embedding,
+    Paper.is_global,
+    Paper.publication_date,
+    Paper.created_at,
+)
+
 # Transient errors that may resolve on retry
 _TRANSIENT_ERRORS = (ConnectionError, TimeoutError, OSError)
 
@@ -44,6 +71,26 @@ def _classify_sync_error(exc: Exception, service: str, entity: str, entity_id: A
         )
 
 
+def paper_row_to_document(row: Any) -> dict[str, Any]:
+    """Build a search document from a row selected with PAPER_DOCUMENT_COLUMNS."""
+    return SearchEngineService.paper_to_document(
+        paper_id=row.id,
+        organization_id=row.organization_id,
+        title=row.title,
+        abstract=row.abstract,
+        doi=row.doi,
+        source=row.source.value if row.source else None,
+        journal=row.journal,
+        paper_type=row.paper_type.value if row.paper_type else None,
+        keywords=row.keywords,
+        citations_count=row.citations_count,
+        has_embedding=row.has_embedding,
+        is_global=row.is_global,
+        publication_date=row.publication_date,
+        created_at=row.created_at,
+    )
+
+
 class SyncService:
     """Orchestrates sync of entities from PostgreSQL to Typesense.
 
@@ -54,14 +101,28 @@ class SyncService:
     def __init__(
         self,
         search_service: SearchEngineService | None = None,
+        generations: IndexGeneration | None = None,
     ) -> None:
         self.search = search_service or SearchEngineService()
+        self.generations = generations or index_generation
+
+    async def _bump_generations(self, targets: set[UUID | None]) -> None:
+        """Invalidate cached search responses (None targets the global catalog)."""
+        for organization_id in targets:
+            await self.generations.bump(organization_id)
+
+    @staticmethod
+    def _generation_targets(organization_id: UUID | None, is_global: bool) -> set[UUID | None]:
+        targets: set[UUID | None] = {organization_id}
+        if is_global:
+            targets.add(None)
+        return targets
 
     # =========================================================================
     # Paper Sync (Typesense only — embeddings handled via pgvector directly)
     # =========================================================================
 
-    def sync_paper(
+    async def sync_paper(
         self,
         paper_id: UUID,
         organization_id: UUID | None,
@@ -106,33 +167,41 @@ class SyncService:
                 publication_date=publication_date,
                 created_at=created_at,
             )
-            self.search.index_paper(doc)
+            await self.search.index_paper(doc)
         except Exception as exc:
             _classify_sync_error(exc, "Typesense", "paper", paper_id)
+        await self._bump_generations(self._generation_targets(organization_id, is_global))
 
     # =========================================================================
     # Delete Operations
     # =========================================================================
 
-    def delete_paper(self, paper_id: UUID) -> None:
-        """Remove paper from Typesense."""
+    async def delete_paper(self, paper_id: UUID, organization_id: UUID | None = None) -> None:
+        """Remove paper from Typesense.
+
+        Args:
+            paper_id: Paper UUID
+            organization_id: Owning tenant (None for global papers)
+        """
         try:
-            self.search.delete_paper(str(paper_id))
+            await self.search.delete_paper(str(paper_id))
         except Exception as exc:
             _classify_sync_error(exc, "Typesense", "paper_delete", paper_id)
+        await self._bump_generations({organization_id})
 
-    def delete_org_data(self, organization_id: UUID) -> None:
+    async def delete_org_data(self, organization_id: UUID) -> None:
         """Remove all data for an organization from Typesense."""
         try:
-            self.search.delete_papers_by_org(organization_id)
+            await self.search.delete_papers_by_org(organization_id)
         except Exception as exc:
             _classify_sync_error(exc, "Typesense", "org_delete", organization_id)
+        await self._bump_generations({organization_id})
 
     # =========================================================================
     # Bulk Sync (Reindex)
     # =========================================================================
 
-    def bulk_sync_papers(
+    async def bulk_sync_papers(
         self,
         papers: list[dict[str, Any]],
     ) -> dict[str, int]:
@@ -151,7 +220,9 @@ class SyncService:
         errors = 0
 
         search_docs = []
+        targets: set[UUID | None] = set()
         for p in papers:
+            targets |= self._generation_targets(p.get("organization_id"), p.get("is_global", False))
             doc = SearchEngineService.paper_to_document(
                 paper_id=p["paper_id"],
                 organization_id=p.get("organization_id"),
@@ -173,7 +244,7 @@ class SyncService:
 
         if search_docs:
             try:
-                results = self.search.index_papers_batch(search_docs)
+                results = await self.search.index_papers_batch(search_docs)
                 documents_synced = sum(
                     1 for r in results if isinstance(r, dict) and r.get("success", True)
                 )
@@ -181,6 +252,7 @@ class SyncService:
             except Exception as exc:
                 _classify_sync_error(exc, "Typesense", "bulk_papers", f"{len(search_docs)} docs")
                 errors += len(search_docs)
+        await self._bump_generations(targets)
 
         return {
             "documents_synced": documents_synced,
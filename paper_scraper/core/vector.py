@@ -6,21 +6,173 @@ to consolidate infrastructure and reduce costs at scale (15-25M papers).
 The embedding column lives on the papers table directly. Tenant isolation
 is handled via JOIN to organization_papers (for "my library" searches) or
 via the is_global flag (for catalog browsing).
+
+Storage modes (PGVECTOR_STORAGE_MODE): "full" searches the vector(1536)
+HNSW index directly. "halfvec" and "binary" retrieve a candidate shortlist
+from a much smaller HNSW expression index over the half-precision or
+binary-quantized embedding, then re-rank it with exact full-precision
+distances. See scripts/benchmark_vector_search.py for recall/latency.
+Quantized indexes are only built for the mode that is enabled; build one
+with scripts/build_embedding_index.py before switching to its mode.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import select, text, update
+from sqlalchemy import (
+    Float,
+    Uuid,
+    and_,
+    cast,
+    column,
+    delete,
+    exists,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import BIT
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.types import UserDefinedType
+
+from paper_scraper.core.config import settings
+
+if TYPE_CHECKING:
+    from paper_scraper.modules.search.schemas import SearchFilters
 
 logger = logging.getLogger(__name__)
 
-# Embedding dimension (text-embedding-3-small)
-EMBEDDING_DIM = 1536
+# Embedding dimension (text-embedding-3 models can be shortened, Matryoshka-style).
+# Changing it requires resizing the column with scripts/resize_embeddings.py.
+EMBEDDING_DIM = settings.EMBEDDING_DIMENSIONS
+
+# Rows per set-based UPDATE (4 bytes per dimension per row)
+BULK_WRITE_CHUNK_SIZE = 1000
+
+# Storage modes that retrieve kNN candidates from a quantized HNSW index
+QUANTIZED_STORAGE_MODES = ("halfvec", "binary")
+# pgvector's upper bound for hnsw.ef_search
+HNSW_MAX_EF_SEARCH = 1000
+
+# Row i's vector is the i-th :dim-long slice of one flat real[] parameter
+_BULK_UPDATE_SQL = text(
+    """
+    UPDATE papers AS p
+    SET embedding = CAST(
+            (CAST(:embeddings AS real[]))[(v.ord - 1) * :dim + 1 : v.ord * :dim] AS vector
+        ),
+        has_embedding = true,
+        updated_at = now()
+    FROM unnest(CAST(:ids AS uuid[])) WITH ORDINALITY AS v(id, ord)
+    WHERE p.id = v.id
+    """
+)
+
+
+# Top-k neighbours of a batch of library papers, one HNSW probe per paper
+_NEIGHBORS_INSERT_SQL = text(
+    """
+    INSERT INTO paper_neighbors (organization_id, paper_id, neighbor_id, similarity, computed_at)
+    SELECT CAST(:org AS uuid), src.id, nb.id, 1 - nb.distance, now()
+    FROM papers AS src
+    CROSS JOIN LATERAL (
+        SELECT p.id, p.embedding <=> src.embedding AS distance
+        FROM papers AS p
+        JOIN organization_papers AS op ON op.paper_id = p.id
+        WHERE op.organization_id = CAST(:org AS uuid)
+          AND p.embedding IS NOT NULL
+          AND p.id <> src.id
+        ORDER BY p.embedding <=> src.embedding
+        LIMIT :k
+    ) AS nb
+    WHERE src.id = ANY(CAST(:ids AS uuid[])) AND src.embedding IS NOT NULL
+    ON CONFLICT (organization_id, paper_id, neighbor_id)
+    DO UPDATE SET similarity = EXCLUDED.similarity, computed_at = EXCLUDED.computed_at
+    """
+)
+
+# Offer each refreshed paper to its neighbours' lists (similarity is symmetric).
+# Only lists that already exist are touched; a one-row list would otherwise
+# pass for a complete one.
+_NEIGHBORS_REVERSE_SQL = text(
+    """
+    INSERT INTO paper_neighbors (organization_id, paper_id, neighbor_id, similarity, computed_at)
+    SELECT pn.organization_id, pn.neighbor_id, pn.paper_id, pn.similarity, pn.computed_at
+    FROM paper_neighbors AS pn
+    WHERE pn.organization_id = CAST(:org AS uuid)
+      AND pn.paper_id = ANY(CAST(:ids AS uuid[]))
+      AND EXISTS (
+          SELECT 1 FROM paper_neighbors AS q
+          WHERE q.organization_id = pn.organization_id AND q.paper_id = pn.neighbor_id
+      )
+    ON CONFLICT (organization_id, paper_id, neighbor_id)
+    DO UPDATE SET similarity = EXCLUDED.similarity, computed_at = EXCLUDED.computed_at
+    """
+)
+
+# Trim the neighbours' lists back to k after the reverse merge
+_NEIGHBORS_TRIM_SQL = text(
+    """
+    DELETE FROM paper_neighbors AS pn
+    USING (
+        SELECT paper_id, neighbor_id,
+               row_number() OVER (
+                   PARTITION BY paper_id ORDER BY similarity DESC, neighbor_id
+               ) AS rn
+        FROM paper_neighbors
+        WHERE organization_id = CAST(:org AS uuid)
+          AND paper_id IN (
+              SELECT neighbor_id FROM paper_neighbors
+              WHERE organization_id = CAST(:org AS uuid)
+                AND paper_id = ANY(CAST(:ids AS uuid[]))
+          )
+    ) AS ranked
+    WHERE pn.organization_id = CAST(:org AS uuid)
+      AND pn.paper_id = ranked.paper_id
+      AND pn.neighbor_id = ranked.neighbor_id
+      AND ranked.rn > :k
+    """
+)
+
+
+class _HalfVector(UserDefinedType):
+    """pgvector ``halfvec`` type, used only for casts in kNN expressions."""
+
+    cache_ok = True
+
+    def __init__(self, dim: int = EMBEDDING_DIM) -> None:
+        self.dim = dim
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return f"halfvec({self.dim})"
+
+
+def _quantized_distance(column: Any, query_vector: list[float], mode: str) -> Any:
+    """Distance on the quantized representation used by ``mode``'s HNSW index.
+
+    The column side must match the expression indexes created by the
+    quantized_embeddings migration exactly, or the planner falls back to
+    a sequential scan.
+    """
+    # Explicit vector cast: binary_quantize() is overloaded for halfvec
+    query = cast(literal(query_vector, column.type), column.type)
+    if mode == "halfvec":
+        half = _HalfVector()
+        return cast(column, half).op("<=>", return_type=Float())(cast(query, half))
+    bits = BIT(EMBEDDING_DIM)
+    return cast(func.binary_quantize(column), bits).op("<~>", return_type=Float())(
+        cast(func.binary_quantize(query), bits)
+    )
 
 
 class VectorService:
@@ -30,6 +182,9 @@ class VectorService:
     queries, or operate globally for catalog searches.
     """
 
+    # None until probed; False on pgvector < 0.8 (no hnsw.iterative_scan)
+    _iterative_scan_supported: bool | None = None
+
     # ------------------------------------------------------------------
     # Upsert Operations
     # ------------------------------------------------------------------
@@ -45,7 +200,7 @@ class VectorService:
         Args:
             db: Database session
             paper_id: Paper UUID
-            embedding: 1536-dim float vector
+            embedding: EMBEDDING_DIM float vector
         """
         if len(embedding) != EMBEDDING_DIM:
             raise ValueError(
@@ -75,14 +230,13 @@ class VectorService:
                 - embedding (list[float])
 
         Returns:
-            Number of papers updated
+            Number of embeddings written (wrong-dimension rows are skipped)
         """
         if not papers_with_embeddings:
             return 0
 
-        from paper_scraper.modules.papers.models import Paper
-
-        count = 0
+        ids: list[UUID] = []
+        embeddings: list[list[float]] = []
         for item in papers_with_embeddings:
             embedding = item["embedding"]
             if len(embedding) != EMBEDDING_DIM:
@@ -93,16 +247,27 @@ class VectorService:
                     EMBEDDING_DIM,
                 )
                 continue
-
+            ids.append(item["paper_id"])
+            embeddings.append(embedding)
+
+        # One set-based UPDATE per chunk instead of one statement per paper.
+        # Vectors travel as one flat real[] that the driver encodes in binary;
+        # formatting pgvector text literals took over a second of event-loop
+        # CPU per 1000 rows. pgvector's own binary codec is not registered,
+        # since the ORM's Vector column binds text on the same pooled connections.
+        for start in range(0, len(ids), BULK_WRITE_CHUNK_SIZE):
+            end = start + BULK_WRITE_CHUNK_SIZE
             await db.execute(
-                update(Paper)
-                .where(Paper.id == item["paper_id"])
-                .values(embedding=embedding, has_embedding=True)
+                _BULK_UPDATE_SQL,
+                {
+                    "ids": ids[start:end],
+                    "embeddings": [x for vec in embeddings[start:end] for x in vec],
+                    "dim": EMBEDDING_DIM,
+                },
             )
-            count += 1
 
         await db.flush()
-        return count
+        return len(ids)
 
     # ------------------------------------------------------------------
     # Search Operations
@@ -115,6 +280,9 @@ class VectorService:
         organization_id: UUID | None = None,
         limit: int = 20,
         min_score: float | None = None,
+        filters: SearchFilters | None = None,
+        score_organization_id: UUID | None = None,
+        after: tuple[float, UUID] | None = None,
     ) -> list[dict[str, Any]]:
         """Find papers similar to a query vector.
 
@@ -122,16 +290,27 @@ class VectorService:
         that organization (via organization_papers join). Otherwise searches
         the full global catalog.
 
+        Filters are applied inside the kNN query, so a filtered search still
+        returns up to ``limit`` matching rows. With filters present the HNSW
+        scan is switched to iterative mode so the index keeps being walked
+        until enough rows pass the predicates.
+
         Args:
             db: Database session
-            query_vector: 1536-dim query embedding
+            query_vector: EMBEDDING_DIM query embedding
             organization_id: Tenant isolation (None = global catalog)
             limit: Max results (capped at 1000)
             min_score: Minimum cosine similarity (0-1). Note: pgvector uses
                 distance, so we convert: distance < (1 - min_score).
+            filters: Optional search filters (metadata and latest score).
+            score_organization_id: Organization whose scores the score
+                filters apply to. Defaults to organization_id; required for
+                score filters on catalog searches.
+            after: Keyset position (distance, paper ID) of the last row of
+                the previous page; only rows strictly after it are returned.
 
         Returns:
-            List of dicts: {id, score, paper_id, doi, title}
+            List of dicts: {id, score, distance, paper_id, doi, title, source}
         """
         limit = min(limit, 1000)
 
@@ -161,7 +340,45 @@ class VectorService:
             max_distance = 1.0 - min_score
             query = query.where(distance_expr <= max_distance)
 
-        query = query.order_by(distance_expr).limit(limit)
+        if filters is not None:
+            if filters.has_embedding is False:
+                return []
+            query = _apply_search_filters(
+                query,
+                filters,
+                score_organization_id or organization_id,
+            )
+
+        if after is not None:
+            # Keyset predicate; the ID only breaks exact-distance ties
+            last_distance, last_id = after
+            query = query.where(
+                or_(
+                    distance_expr > last_distance,
+                    and_(distance_expr == last_distance, Paper.id > last_id),
+                )
+            )
+
+        if filters is not None or after is not None:
+            await self._enable_iterative_scan(db)
+
+        mode = settings.PGVECTOR_STORAGE_MODE
+        if mode in QUANTIZED_STORAGE_MODES:
+            # Shortlist from the compact quantized index, then re-rank the
+            # shortlist by exact full-precision distance
+            candidates = min(max(limit, settings.PGVECTOR_RERANK_CANDIDATES), HNSW_MAX_EF_SEARCH)
+            await self.set_ef_search(
+                db, max(settings.PGVECTOR_HNSW_EF_SEARCH, candidates), local=True
+            )
+            shortlist = (
+                query.order_by(_quantized_distance(Paper.embedding, query_vector, mode))
+                .limit(candidates)
+                .subquery("shortlist")
+            )
+            query = select(shortlist).order_by(shortlist.c.distance).limit(limit)
+        else:
+            # Order by distance alone so the planner keeps using the HNSW index
+            query = query.order_by(distance_expr).limit(limit)
 
         result = await db.execute(query)
         rows = result.all()
@@ -170,6 +387,7 @@ class VectorService:
             {
                 "id": str(row.id),
                 "score": round(1.0 - float(row.distance), 4),
+                "distance": float(row.distance),
                 "paper_id": str(row.id),
                 "doi": row.doi,
                 "title": row.title,
@@ -185,38 +403,325 @@ class VectorService:
         organization_id: UUID | None = None,
         limit: int = 10,
         min_score: float | None = None,
+        filters: SearchFilters | None = None,
+        query_vector: list[float] | None = None,
     ) -> list[dict[str, Any]]:
         """Find papers similar to an existing paper's embedding.
 
+        Unfiltered library lookups are served from the precomputed
+        neighbour graph when it covers the paper; everything else runs a
+        live kNN query.
+
         Args:
             paper_id: Reference paper UUID
             organization_id: Tenant scope (None = global)
             limit: Max results
             min_score: Minimum cosine similarity
+            filters: Optional search filters, applied inside the kNN query
+            query_vector: The reference paper's embedding, when the caller
+                already loaded it; saves a round trip on the live path
 
         Returns:
             List of similar papers (excluding the reference paper)
         """
         from paper_scraper.modules.papers.models import Paper
 
-        # Fetch the reference paper's embedding
-        ref = await db.execute(select(Paper.embedding).where(Paper.id == paper_id))
-        ref_row = ref.scalar_one_or_none()
-        if ref_row is None:
-            return []
+        if organization_id is not None and filters is None:
+            stored = await self.get_neighbors(db, organization_id, paper_id, limit, min_score)
+            if stored is not None:
+                return stored
+
+        if query_vector is None:
+            # Fetch the reference paper's embedding
+            ref = await db.execute(select(Paper.embedding).where(Paper.id == paper_id))
+            ref_row = ref.scalar_one_or_none()
+            if ref_row is None:
+                return []
+            query_vector = list(ref_row)
 
         # Search with the reference embedding, excluding the paper itself
         results = await self.search_similar(
             db=db,
-            query_vector=list(ref_row),
+            query_vector=query_vector,
             organization_id=organization_id,
             limit=limit + 1,
             min_score=min_score,
+            filters=filters,
         )
 
         # Filter out the reference paper
         return [r for r in results if r["id"] != str(paper_id)][:limit]
 
+    async def search_similar_many(
+        self,
+        db: AsyncSession,
+        paper_ids: list[UUID],
+        organization_id: UUID | None = None,
+        limit: int = 10,
+        min_score: float | None = None,
+    ) -> dict[UUID, list[dict[str, Any]]]:
+        """Find similar papers for many reference papers at once.
+
+        Library lookups are answered from the neighbour graph where
+        possible. The remaining papers are resolved by a single statement:
+        a VALUES list of reference IDs CROSS JOIN LATERAL a per-paper kNN
+        query, so each reference still gets its own HNSW index scan.
+
+        Args:
+            db: Database session
+            paper_ids: Reference paper UUIDs
+            organization_id: Tenant scope (None = global catalog)
+            limit: Max neighbours per reference paper (capped at 1000)
+            min_score: Minimum cosine similarity
+
+        Returns:
+            Neighbour lists (search_similar's result shape, excluding the
+            reference itself) keyed by reference ID. Papers without an
+            embedding are absent; papers with no match map to [].
+        """
+        if not paper_ids:
+            return {}
+        limit = min(limit, 1000)
+
+        results: dict[UUID, list[dict[str, Any]]] = {}
+        if organization_id is not None:
+            results = await self.get_neighbors_many(
+                db, organization_id, paper_ids, limit, min_score
+            )
+        missing = [pid for pid in dict.fromkeys(paper_ids) if pid not in results]
+        if not missing:
+            return results
+
+        from paper_scraper.modules.papers.models import OrganizationPaper, Paper
+
+        refs = values(column("ref_id", Uuid), name="refs").data([(pid,) for pid in missing])
+        src = aliased(Paper, name="src")
+        distance_expr = Paper.embedding.cosine_distance(src.embedding)
+
+        knn = select(
+            Paper.id,
+            Paper.doi,
+            Paper.title,
+            Paper.source,
+            distance_expr.label("distance"),
+        ).where(Paper.embedding.isnot(None), Paper.id != src.id)
+        if organization_id is not None:
+            knn = knn.join(OrganizationPaper, OrganizationPaper.paper_id == Paper.id).where(
+                OrganizationPaper.organization_id == organization_id
+            )
+        else:
+            knn = knn.where(Paper.is_global.is_(True))
+        if min_score is not None:
+            knn = knn.where(distance_expr <= 1.0 - min_score)
+        knn = knn.order_by(distance_expr).limit(limit).lateral("knn")
+
+        query = (
+            select(
+                refs.c.ref_id,
+                knn.c.id,
+                knn.c.doi,
+                knn.c.title,
+                knn.c.source,
+                knn.c.distance,
+            )
+            .select_from(refs)
+            .join(src, src.id == refs.c.ref_id)
+            # Outer join keeps embedded papers without matches in the result
+            .outerjoin(knn, true())
+            .where(src.embedding.isnot(None))
+            .order_by(refs.c.ref_id, knn.c.distance)
+        )
+
+        if organization_id is not None:
+            await self._enable_iterative_scan(db)
+
+        for row in (await db.execute(query)).all():
+            matches = results.setdefault(row.ref_id, [])
+            if row.id is None:
+                continue
+            matches.append(
+                {
+                    "id": str(row.id),
+                    "score": round(1.0 - float(row.distance), 4),
+                    "distance": float(row.distance),
+                    "paper_id": str(row.id),
+                    "doi": row.doi,
+                    "title": row.title,
+                    "source": row.source,
+                }
+            )
+        return results
+
+    # ------------------------------------------------------------------
+    # Neighbour Graph
+    # ------------------------------------------------------------------
+
+    async def get_neighbors(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        paper_id: UUID,
+        limit: int = 10,
+        min_score: float | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Read a paper's precomputed neighbours within a tenant library.
+
+        Returns:
+            Neighbours in search_similar's result shape, most similar first,
+            or None when the graph cannot answer (disabled, limit above the
+            stored k, no neighbours stored for the paper yet, or a stored
+            neighbour has left the library).
+        """
+        stored = await self.get_neighbors_many(db, organization_id, [paper_id], limit, min_score)
+        return stored.get(paper_id)
+
+    async def get_neighbors_many(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        paper_ids: list[UUID],
+        limit: int = 10,
+        min_score: float | None = None,
+    ) -> dict[UUID, list[dict[str, Any]]]:
+        """Read precomputed neighbours for several papers in one query.
+
+        Returns:
+            Neighbour lists keyed by paper ID; papers the graph cannot answer
+            for are absent (see get_neighbors), including papers whose list
+            holds a neighbour that has since left the library.
+        """
+        if (
+            not paper_ids
+            or not settings.PAPER_NEIGHBORS_ENABLED
+            or limit > settings.PAPER_NEIGHBORS_K
+        ):
+            return {}
+
+        from paper_scraper.modules.papers.models import OrganizationPaper, Paper
+        from paper_scraper.modules.search.models import PaperNeighbor
+
+        query = (
+            select(
+                PaperNeighbor.paper_id.label("ref_id"),
+                Paper.id,
+                Paper.doi,
+                Paper.title,
+                Paper.source,
+                PaperNeighbor.similarity,
+                OrganizationPaper.paper_id.label("in_library"),
+            )
+            .join(Paper, Paper.id == PaperNeighbor.neighbor_id)
+            # Outer join flags neighbours that have since left the library
+            .outerjoin(
+                OrganizationPaper,
+                and_(
+                    OrganizationPaper.paper_id == PaperNeighbor.neighbor_id,
+                    OrganizationPaper.organization_id == organization_id,
+                ),
+            )
+            .where(
+                PaperNeighbor.organization_id == organization_id,
+                PaperNeighbor.paper_id.in_(paper_ids),
+            )
+            .order_by(
+                PaperNeighbor.paper_id,
+                PaperNeighbor.similarity.desc(),
+                PaperNeighbor.neighbor_id,
+            )
+        )
+
+        neighbors: dict[UUID, list[dict[str, Any]]] = {}
+        incomplete: set[UUID] = set()
+        for row in (await db.execute(query)).all():
+            # Keyed before the min_score check: a stored list that filters
+            # down to nothing is still an answer
+            matches = neighbors.setdefault(row.ref_id, [])
+            if row.in_library is None:
+                # Serving the rest would silently shorten the list
+                incomplete.add(row.ref_id)
+                continue
+            if len(matches) >= limit or (min_score is not None and row.similarity < min_score):
+                continue
+            matches.append(
+                {
+                    "id": str(row.id),
+                    "score": round(float(row.similarity), 4),
+                    "distance": 1.0 - float(row.similarity),
+                    "paper_id": str(row.id),
+                    "doi": row.doi,
+                    "title": row.title,
+                    "source": row.source,
+                }
+            )
+        for ref_id in incomplete:
+            del neighbors[ref_id]
+        return neighbors
+
+    async def refresh_neighbors(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        paper_ids: list[UUID],
+        k: int | None = None,
+        propagate: bool = True,
+    ) -> int:
+        """Recompute the stored top-k neighbours for papers in a library.
+
+        All papers in the batch are handled by one statement that runs a
+        lateral kNN probe per paper, so no vectors leave the database.
+
+        Args:
+            db: Database session (caller commits)
+            organization_id: Library whose graph is updated
+            paper_ids: Papers whose neighbour lists are rebuilt
+            k: Neighbours kept per paper (default PAPER_NEIGHBORS_K)
+            propagate: Incremental mode. Also rebuild every list that held
+                one of the papers (their embeddings changed) and offer the
+                papers to their new neighbours' lists. Full rebuilds pass
+                False.
+
+        Returns:
+            Number of neighbour rows written, including rebuilt lists
+        """
+        if not paper_ids:
+            return 0
+        k = k or settings.PAPER_NEIGHBORS_K
+
+        from paper_scraper.modules.search.models import PaperNeighbor
+
+        rebuild = list(paper_ids)
+        if propagate:
+            # Dropping a changed paper from a list leaves it at k-1 rows;
+            # recompute those lists whole so they stay complete
+            holders = await db.execute(
+                select(PaperNeighbor.paper_id)
+                .where(
+                    PaperNeighbor.organization_id == organization_id,
+                    PaperNeighbor.neighbor_id.in_(paper_ids),
+                )
+                .distinct()
+            )
+            rebuild = list(dict.fromkeys([*paper_ids, *holders.scalars().all()]))
+        await db.execute(
+            delete(PaperNeighbor).where(
+                PaperNeighbor.organization_id == organization_id,
+                PaperNeighbor.paper_id.in_(rebuild),
+            )
+        )
+
+        # The tenant predicate filters HNSW candidates, so widen the scan
+        await self.set_ef_search(db, max(settings.PGVECTOR_HNSW_EF_SEARCH, k + 1), local=True)
+        await self._enable_iterative_scan(db)
+
+        params = {"org": organization_id, "ids": paper_ids, "k": k}
+        result = await db.execute(_NEIGHBORS_INSERT_SQL, {**params, "ids": rebuild})
+        if propagate:
+            await db.execute(_NEIGHBORS_REVERSE_SQL, params)
+            await db.execute(_NEIGHBORS_TRIM_SQL, params)
+
+        await db.flush()
+        return result.rowcount or 0
+
     # ------------------------------------------------------------------
     # Delete Operations
     # ------------------------------------------------------------------
@@ -275,10 +780,108 @@ class VectorService:
         result = await db.execute(select(Paper.has_embedding).where(Paper.id == paper_id))
         return bool(result.scalar_one_or_none())
 
-    async def set_ef_search(self, db: AsyncSession, ef_search: int = 100) -> None:
+    async def set_ef_search(
+        self, db: AsyncSession, ef_search: int = 100, local: bool = False
+    ) -> None:
         """Tune the HNSW ef_search parameter for the current session.
 
         Higher values improve recall at the cost of latency.
         Default PostgreSQL value is 40; we recommend 100 for production.
+        With ``local`` the setting only lasts until the end of the current
+        transaction, so it does not leak into pooled connections.
         """
-        await db.execute(text(f"SET hnsw.ef_search = {ef_search}"))
+        scope = "LOCAL " if local else ""
+        await db.execute(text(f"SET {scope}hnsw.ef_search = {int(ef_search)}"))
+
+    async def _enable_iterative_scan(self, db: AsyncSession) -> None:
+        """Enable HNSW iterative index scans for the current transaction.
+
+        Without it a filtered kNN query only sees the first ef_search index
+        candidates and silently returns short pages. Requires pgvector 0.8+;
+        on older servers the first probe fails inside a savepoint and the
+        feature is disabled for the process.
+        """
+        mode = settings.PGVECTOR_ITERATIVE_SCAN
+        if mode == "off" or VectorService._iterative_scan_supported is False:
+            return
+
+        stmt = text("SELECT set_config('hnsw.iterative_scan', :mode, true)")
+        if VectorService._iterative_scan_supported:
+            await db.execute(stmt, {"mode": mode})
+            return
+
+        try:
+            async with db.begin_nested():
+                await db.execute(stmt, {"mode": mode})
+            VectorService._iterative_scan_supported = True
+        except Exception as e:
+            VectorService._iterative_scan_supported = False
+            logger.info("hnsw.iterative_scan unavailable, filtered kNN may under-fill: %s", e)
+
+
+def _apply_search_filters(
+    query: Any,
+    filters: SearchFilters,
+    score_organization_id: UUID | None,
+) -> Any:
+    """Push SearchFilters into a papers kNN query as SQL predicates.
+
+    Score filters use the organization's latest PaperScore via a lateral
+    join, a per-candidate probe of the (paper_id, organization_id) index.
+    """
+    from paper_scraper.modules.papers.models import Paper
+    from paper_scraper.modules.scoring.models import PaperScore
+
+    if filters.sources:
+        query = query.where(Paper.source.in_(filters.sources))
+    if filters.date_from:
+        query = query.where(Paper.publication_date >= filters.date_from)
+    if filters.date_to:
+        query = query.where(Paper.publication_date <= filters.date_to)
+    if filters.ingested_from:
+        query = query.where(Paper.created_at >= filters.ingested_from)
+    if filters.ingested_to:
+        query = query.where(Paper.created_at <= filters.ingested_to)
+    if filters.journals:
+        query = query.where(Paper.journal.in_(filters.journals))
+    if filters.keywords:
+        query = query.where(or_(*(Paper.keywords.contains([kw]) for kw in filters.keywords)))
+
+    needs_scores = (
+        filters.has_score is not None
+        or filters.min_score is not None
+        or filters.max_score is not None
+    )
+    if not needs_scores:
+        return query
+    if score_organization_id is None:
+        # Scores are tenant-scoped; without a tenant nothing can match
+        return query.where(false())
+
+    if filters.has_score is not None:
+        scored = exists(
+            select(PaperScore.id).where(
+                PaperScore.paper_id == Paper.id,
+                PaperScore.organization_id == score_organization_id,
+            )
+        )
+        query = query.where(scored if filters.has_score else ~scored)
+
+    if filters.min_score is not None or filters.max_score is not None:
+        latest_score = (
+            select(PaperScore.overall_score)
+            .where(
+                PaperScore.paper_id == Paper.id,
+                PaperScore.organization_id == score_organization_id,
+            )
+            .order_by(PaperScore.created_at.desc())
+            .limit(1)
+            .lateral("latest_score")
+        )
+        query = query.join(latest_score, true())
+        if filters.min_score is not None:
+            query = query.where(latest_score.c.overall_score >= filters.min_score)
+        if filters.max_score is not None:
+            query = query.where(latest_score.c.overall_score <= filters.max_score)
+
+    return query
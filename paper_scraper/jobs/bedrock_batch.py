@@ -17,9 +17,11 @@ from uuid import UUID
 
 from paper_scraper.core.config import settings
 from paper_scraper.core.database import get_db_session
+from paper_scraper.core.index_generation import index_generation
 from paper_scraper.modules.scoring.dimensions.base import PaperContext
+from paper_scraper.modules.scoring.llm_client import join_prompt_prefix
 from paper_scraper.modules.scoring.models import PaperScore
-from paper_scraper.modules.scoring.prompts import render_prompt
+from paper_scraper.modules.scoring.prompts import render_paper_context, render_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +50,9 @@ def _build_system_prompt(dimension: str) -> str:
 def _build_scoring_prompt(paper: PaperContext, dimension: str) -> str:
     """Build the user prompt for scoring a paper on a given dimension."""
     try:
-        return render_prompt(
-            f"{dimension}.jinja2",
-            paper=paper,
+        return join_prompt_prefix(
+            render_paper_context(paper),
+            render_prompt(f"{dimension}.jinja2", knowledge_context=paper.knowledge_context),
         )
     except Exception:
         # Fallback to simple prompt if template fails
@@ -437,6 +439,8 @@ async def poll_bedrock_batch_results_task(
                 failed += 1
 
         await db.commit()
+        if completed:
+            await index_generation.bump(org_uuid)
 
         # Update job status
         final_status = "completed" if failed == 0 else "completed_with_errors"
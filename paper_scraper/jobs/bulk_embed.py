@@ -1,20 +1,34 @@
 """Bulk embedding pipeline for large-scale paper embedding generation.
 
-Embeds papers in parallel batches using OpenAI's batch embedding API,
-writing vectors directly to the Paper.embedding pgvector column.
+Embeds papers with OpenAI's batch embedding API and writes the vectors
+directly to the Paper.embedding pgvector column. The job is a three-stage
+producer/consumer pipeline joined by bounded queues:
 
-Throughput: 8 concurrent x 2000 texts x ~3s/call = ~5,300 papers/sec
+    reader (keyset pagination) -> N embedding workers -> batched DB writer
+
+The reader keeps the next pages buffered while embedding calls are in
+flight. The writer coalesces finished batches into large UPDATEs. The resume
+checkpoint only moves past a batch once it and every earlier batch have been
+written, so a crash never skips unembedded papers.
+
+Throughput is bounded by the ``concurrency`` embedding calls in flight;
+size it to the OpenAI account's rate limit.
 Cost: 15M papers x ~363 tokens x $0.02/1M = ~$109
 """
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import select
 
 from paper_scraper.core.database import get_db_session
+from paper_scraper.core.vector import VectorService
+from paper_scraper.jobs.neighbors import schedule_neighbor_update
+from paper_scraper.modules.embeddings.service import paper_to_text
+from paper_scraper.modules.embeddings.store import EmbeddingStore
 from paper_scraper.modules.papers.models import Paper
 from paper_scraper.modules.scoring.embeddings import EmbeddingClient
 
@@ -23,6 +37,50 @@ logger = logging.getLogger(__name__)
 # OpenAI supports up to 2048 texts per embedding call
 DEFAULT_BATCH_SIZE = 2000
 DEFAULT_CONCURRENCY = 8
+# Rows per DB write; the writer flushes early when its queue runs dry
+DEFAULT_WRITE_BATCH_SIZE = 10_000
+
+
+@dataclass
+class _EmbedBatch:
+    """A contiguous, ID-ordered slice of papers flowing through the pipeline."""
+
+    seq: int
+    paper_ids: list[UUID]
+    texts: list[str]
+    embeddings: list[list[float]] | None = None
+
+
+class _ContiguousCheckpoint:
+    """Tracks the highest paper ID below which every batch has completed.
+
+    Batches finish out of order when several embedding calls are in flight,
+    so the resume point may only advance across an unbroken run of completed
+    sequence numbers. A failed batch is never marked complete and therefore
+    pins the checkpoint; the next run re-reads from there and the
+    ``embedding IS NULL`` filter skips whatever was already written.
+    """
+
+    def __init__(self) -> None:
+        self._next_seq = 0
+        self._done: dict[int, UUID] = {}
+        self._first_failed: int | None = None
+
+    def complete(self, seq: int, last_paper_id: UUID) -> UUID | None:
+        """Mark a batch written; return the new checkpoint if it advanced."""
+        self._done[seq] = last_paper_id
+        advanced: UUID | None = None
+        while self._next_seq in self._done and (
+            self._first_failed is None or self._next_seq < self._first_failed
+        ):
+            advanced = self._done.pop(self._next_seq)
+            self._next_seq += 1
+        return advanced
+
+    def fail(self, seq: int) -> None:
+        """Mark a batch failed, freezing the checkpoint before it."""
+        if self._first_failed is None or seq < self._first_failed:
+            self._first_failed = seq
 
 
 async def bulk_embed_papers_task(
@@ -31,112 +89,174 @@ async def bulk_embed_papers_task(
     concurrency: int = DEFAULT_CONCURRENCY,
     max_papers: int | None = None,
     global_only: bool = True,
+    write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
 ) -> dict[str, Any]:
     """Bulk-embed papers that don't yet have embeddings.
 
     Args:
         ctx: arq context.
         batch_size: Texts per OpenAI embedding API call (max 2048).
-        concurrency: Number of parallel embedding API calls.
+        concurrency: Number of embedding workers with a batch in flight.
         max_papers: Optional limit on total papers to embed.
         global_only: If True, only embed global catalog papers.
+        write_batch_size: Target rows per bulk DB write.
 
     Returns:
         Summary dict with counts.
     """
     batch_size = min(batch_size, 2048)
-    embedded_count = 0
-    error_count = 0
+    concurrency = max(1, concurrency)
+    stats = {"embedded": 0, "errors": 0}
 
-    # Load checkpoint
-    last_paper_id = await _load_checkpoint()
+    start_after = await _load_checkpoint()
 
     logger.info(
         "Starting bulk embedding: batch_size=%d, concurrency=%d, max=%s, resume=%s",
         batch_size,
         concurrency,
         max_papers or "unlimited",
-        bool(last_paper_id),
+        bool(start_after),
     )
 
-    semaphore = asyncio.Semaphore(concurrency)
-    client = EmbeddingClient()
-
-    while True:
-        if max_papers and embedded_count >= max_papers:
-            break
-
-        # Fetch next batch of papers without embeddings
-        remaining = (max_papers - embedded_count) if max_papers else batch_size
-        fetch_limit = min(batch_size, remaining)
-
-        papers = await _fetch_unembedded_papers(
-            limit=fetch_limit,
-            after_id=last_paper_id,
-            global_only=global_only,
-        )
-
-        if not papers:
-            break
-
-        # Build text representations
-        texts = []
-        paper_ids = []
-        for paper_id, title, abstract, keywords in papers:
-            parts = [f"Title: {title or 'Untitled'}"]
-            if abstract:
-                parts.append(f"Abstract: {abstract[:3000]}")
-            if keywords:
-                parts.append(f"Keywords: {', '.join(keywords[:10])}")
-            texts.append("\n\n".join(parts))
-            paper_ids.append(paper_id)
-
-        # Generate embeddings with concurrency control
-        try:
-            async with semaphore:
-                embeddings = await client.embed_texts(texts)
-        except Exception as e:
-            logger.warning("Embedding batch failed: %s", e)
-            error_count += len(paper_ids)
-            # Save checkpoint at last successful paper and continue
-            if paper_ids:
-                last_paper_id = paper_ids[-1]
-                await _save_checkpoint(last_paper_id)
-            await asyncio.sleep(2)  # Brief backoff on error
-            continue
-
-        # Write embeddings to DB in bulk
+    # One pooled connection per worker; the default pool would cap in-flight calls
+    client = EmbeddingClient(max_concurrent_requests=concurrency)
+    store = EmbeddingStore()
+    checkpoint = _ContiguousCheckpoint()
+    # Bounded queues give backpressure: the reader stays at most a couple of
+    # pages ahead of the workers, and workers stall if the writer falls behind.
+    embed_queue: asyncio.Queue[_EmbedBatch | None] = asyncio.Queue(maxsize=concurrency * 2)
+    write_queue: asyncio.Queue[_EmbedBatch | None] = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def read_stage() -> None:
+        after_id = start_after
+        read = 0
+        seq = 0
+        while max_papers is None or read < max_papers:
+            limit = batch_size if max_papers is None else min(batch_size, max_papers - read)
+            papers = await _fetch_unembedded_papers(
+                limit=limit,
+                after_id=after_id,
+                global_only=global_only,
+            )
+            if not papers:
+                break
+
+            batch = _EmbedBatch(
+                seq=seq,
+                paper_ids=[row[0] for row in papers],
+                texts=[
+                    paper_to_text(title, abstract, keywords)
+                    for _, title, abstract, keywords in papers
+                ],
+            )
+            await embed_queue.put(batch)
+
+            seq += 1
+            read += len(papers)
+            after_id = batch.paper_ids[-1]
+            if len(papers) < limit:
+                break
+
+    async def embed_stage() -> None:
+        while (batch := await embed_queue.get()) is not None:
+            try:
+                batch.embeddings = await store.embed_texts_detached(client, batch.texts)
+            except Exception as e:
+                logger.warning(
+                    "Embedding batch %d (%d papers) failed: %s", batch.seq, len(batch.texts), e
+                )
+                stats["errors"] += len(batch.paper_ids)
+                checkpoint.fail(batch.seq)
+                continue
+            await write_queue.put(batch)
+
+    async def write_stage() -> None:
+        finished = False
+        while not finished:
+            batch = await write_queue.get()
+            if batch is None:
+                break
+            pending = [batch]
+            rows = len(batch.paper_ids)
+            # Coalesce whatever else is already waiting, up to the write size
+            while rows < write_batch_size and not write_queue.empty():
+                batch = write_queue.get_nowait()
+                if batch is None:
+                    finished = True
+                    break
+                pending.append(batch)
+                rows += len(batch.paper_ids)
+            await _write_batches(pending, checkpoint, stats)
+
+    async def run_embedders() -> None:
+        await asyncio.gather(*(embed_stage() for _ in range(concurrency)))
+        await write_queue.put(None)
+
+    async def run_reader() -> None:
         try:
-            await _bulk_update_embeddings(paper_ids, embeddings)
-            embedded_count += len(paper_ids)
-        except Exception as e:
-            logger.warning("Bulk embedding DB write failed: %s", e)
-            error_count += len(paper_ids)
-
-        # Update checkpoint
-        last_paper_id = paper_ids[-1]
-        await _save_checkpoint(last_paper_id)
-
-        if len(papers) < fetch_limit:
-            break  # No more papers to process
+            await read_stage()
+        finally:
+            for _ in range(concurrency):
+                await embed_queue.put(None)
+
+    stages = [
+        asyncio.create_task(run_reader()),
+        asyncio.create_task(run_embedders()),
+        asyncio.create_task(write_stage()),
+    ]
+    try:
+        await asyncio.gather(*stages)
+    except BaseException:
+        for task in stages:
+            task.cancel()
+        await asyncio.gather(*stages, return_exceptions=True)
+        raise
 
     # Clear checkpoint on completion
-    if error_count == 0:
+    if stats["errors"] == 0:
         await _clear_checkpoint()
 
     logger.info(
         "Bulk embedding complete: %d embedded, %d errors",
-        embedded_count,
-        error_count,
+        stats["embedded"],
+        stats["errors"],
     )
 
     return {
-        "status": "completed" if error_count == 0 else "completed_with_errors",
-        "papers_embedded": embedded_count,
-        "errors": error_count,
+        "status": "completed" if stats["errors"] == 0 else "completed_with_errors",
+        "papers_embedded": stats["embedded"],
+        "errors": stats["errors"],
     }
 
 
+async def _write_batches(
+    batches: list[_EmbedBatch],
+    checkpoint: _ContiguousCheckpoint,
+    stats: dict[str, int],
+) -> None:
+    """Persist embedded batches in one write and advance the checkpoint."""
+    paper_ids = [pid for batch in batches for pid in batch.paper_ids]
+    embeddings = [vec for batch in batches for vec in batch.embeddings or []]
+    try:
+        written = await _bulk_update_embeddings(paper_ids, embeddings)
+    except Exception as e:
+        logger.warning("Bulk embedding DB write failed: %s", e)
+        stats["errors"] += len(paper_ids)
+        for batch in batches:
+            checkpoint.fail(batch.seq)
+        return
+
+    # Rows with a dimension mismatch are skipped by the write
+    stats["embedded"] += written
+    stats["errors"] += len(paper_ids) - written
+    await schedule_neighbor_update(paper_ids)
+    advanced: UUID | None = None
+    for batch in batches:
+        advanced = checkpoint.complete(batch.seq, batch.paper_ids[-1]) or advanced
+    if advanced is not None:
+        await _save_checkpoint(advanced)
+
+
 async def _fetch_unembedded_papers(
     limit: int,
     after_id: UUID | None = None,
@@ -167,24 +287,26 @@ async def _fetch_unembedded_papers(
 async def _bulk_update_embeddings(
     paper_ids: list[UUID],
     embeddings: list[list[float]],
-) -> None:
-    """Bulk-update paper embedding columns.
+) -> int:
+    """Bulk-update paper embedding columns with set-based UPDATEs.
 
     Args:
         paper_ids: Paper UUIDs to update.
         embeddings: Corresponding embedding vectors.
+
+    Returns:
+        Number of embeddings written.
     """
     async with get_db_session() as db:
-        for paper_id, embedding in zip(paper_ids, embeddings, strict=False):
-            await db.execute(
-                update(Paper)
-                .where(Paper.id == paper_id)
-                .values(
-                    embedding=embedding,
-                    has_embedding=True,
-                )
-            )
+        written = await VectorService().upsert_batch(
+            db,
+            [
+                {"paper_id": paper_id, "embedding": embedding}
+                for paper_id, embedding in zip(paper_ids, embeddings, strict=True)
+            ],
+        )
         await db.commit()
+    return written
 
 
 async def _load_checkpoint() -> UUID | None:
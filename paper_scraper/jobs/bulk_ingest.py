@@ -17,8 +17,10 @@ import json
 import logging
 from datetime import UTC, datetime
 from typing import Any
+from uuid import UUID
 
 from paper_scraper.core.database import get_db_session
+from paper_scraper.core.search_outbox import enqueue_paper_sync
 from paper_scraper.modules.ingestion.connectors import get_source_connector
 from paper_scraper.modules.papers.models import Paper, PaperSource
 
@@ -234,6 +236,7 @@ async def _bulk_upsert_global_papers(
 
     created = 0
     skipped = 0
+    created_ids: list[UUID] = []
 
     async with get_db_session() as db:
         for record in records:
@@ -284,17 +287,22 @@ async def _bulk_upsert_global_papers(
                         index_elements=["doi"],
                         index_where=Paper.is_global.is_(True),
                     )
+                    .returning(Paper.id)
                 )
             else:
                 # For non-DOI records, skip if same source_id exists
-                stmt = pg_insert(Paper).values(**values).on_conflict_do_nothing()
+                stmt = (
+                    pg_insert(Paper).values(**values).on_conflict_do_nothing().returning(Paper.id)
+                )
 
-            result = await db.execute(stmt)
-            if result.rowcount and result.rowcount > 0:
+            paper_id = (await db.execute(stmt)).scalar_one_or_none()
+            if paper_id is not None:
                 created += 1
+                created_ids.append(paper_id)
             else:
                 skipped += 1
 
+        await enqueue_paper_sync(db, created_ids)
         await db.commit()
 
     return created, skipped
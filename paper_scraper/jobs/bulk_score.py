@@ -13,9 +13,17 @@ import logging
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from paper_scraper.core.config import settings
 from paper_scraper.core.database import get_db_session
+from paper_scraper.core.vector import VectorService
+from paper_scraper.modules.papers.models import Paper, PaperAuthor, PaperSource
+from paper_scraper.modules.scoring.author_profile_client import prewarm_orcid_profiles
+from paper_scraper.modules.scoring.citation_graph import prewarm_citation_graphs
 from paper_scraper.modules.scoring.schemas import ScoringWeightsSchema
-from paper_scraper.modules.scoring.service import ScoringService
+from paper_scraper.modules.scoring.service import SIMILAR_PAPERS_LIMIT, ScoringService
 
 logger = logging.getLogger(__name__)
 
@@ -72,8 +80,12 @@ async def score_papers_parallel_task(
     chunk_size = min(max_concurrent_papers * 5, 200)
     for chunk_start in range(0, len(remaining_ids), chunk_size):
         chunk = remaining_ids[chunk_start : chunk_start + chunk_size]
+        similar_by_paper = await _prefetch_similar_papers(chunk, org_uuid)
+        await _prewarm_enrichment(chunk)
 
-        async def _score_one(paper_id_str: str) -> tuple[bool, str | None]:
+        async def _score_one(
+            paper_id_str: str, similar_paper_ids: list[UUID] | None
+        ) -> tuple[bool, str | None]:
             async with semaphore:
                 try:
                     async with get_db_session() as db:
@@ -83,13 +95,14 @@ async def score_papers_parallel_task(
                             organization_id=org_uuid,
                             weights=weights_schema,
                             force_rescore=True,
+                            similar_paper_ids=similar_paper_ids,
                         )
                     return True, None
                 except Exception as e:
                     return False, f"Paper {paper_id_str}: {e}"
 
         results = await asyncio.gather(
-            *[_score_one(pid) for pid in chunk],
+            *[_score_one(pid, similar_by_paper.get(UUID(pid))) for pid in chunk],
             return_exceptions=True,
         )
 
@@ -147,6 +160,69 @@ async def score_papers_parallel_task(
     }
 
 
+async def _prefetch_similar_papers(
+    paper_ids: list[str],
+    organization_id: UUID,
+) -> dict[UUID, list[UUID]]:
+    """Resolve similar papers for a whole chunk with one batched kNN query.
+
+    Papers missing from the result (no embedding yet, or a failed
+    prefetch) fall back to the per-paper lookup inside score_paper.
+    """
+    try:
+        async with get_db_session() as db:
+            neighbors = await VectorService().search_similar_many(
+                db,
+                [UUID(pid) for pid in paper_ids],
+                organization_id=organization_id,
+                limit=SIMILAR_PAPERS_LIMIT,
+            )
+    except Exception as e:
+        logger.warning("Similar-paper prefetch failed for %d papers: %s", len(paper_ids), e)
+        return {}
+    return {pid: [UUID(r["id"]) for r in results] for pid, results in neighbors.items()}
+
+
+async def _prewarm_enrichment(paper_ids: list[str]) -> None:
+    """Fill the enrichment cache for a chunk with batched external requests.
+
+    Scoring then reads citation graphs and ORCID records from the cache
+    instead of calling OpenAlex and ORCID once per paper. Failures only
+    cost the cache hits; score_paper fetches whatever is missing.
+    """
+    if not settings.ENRICHMENT_CACHE_ENABLED:
+        return
+    try:
+        async with get_db_session() as db:
+            result = await db.execute(
+                select(Paper)
+                .where(Paper.id.in_([UUID(pid) for pid in paper_ids]))
+                .options(selectinload(Paper.authors).selectinload(PaperAuthor.author))
+            )
+            papers = list(result.scalars().all())
+            lookups = [
+                (
+                    p.doi,
+                    p.source_id if p.source == PaperSource.OPENALEX else None,
+                    p.raw_metadata,
+                )
+                for p in papers
+            ]
+            # Same authors the context builder enriches: the first five by position
+            orcids = [
+                author.orcid
+                for p in papers
+                for author in [
+                    pa.author for pa in sorted(p.authors, key=lambda pa: pa.position) if pa.author
+                ][:5]
+                if author.orcid
+            ]
+        await prewarm_citation_graphs(lookups)
+        await prewarm_orcid_profiles(orcids)
+    except Exception as e:
+        logger.warning("Enrichment pre-warm failed for %d papers: %s", len(paper_ids), e)
+
+
 async def shard_scoring_job_task(
     ctx: dict[str, Any],
     job_id: str,
@@ -0,0 +1,160 @@
+"""Maintenance of the precomputed paper k-nearest-neighbour graph.
+
+"Similar papers" lookups (the search endpoints and the scoring context)
+read each paper's top-k library neighbours from ``paper_neighbors``
+instead of running a live HNSW query. Two jobs keep the table current:
+
+    build_paper_neighbors_task   full (re)build for one organization, queued
+                                 after embedding backfills and by
+                                 scripts/build_paper_neighbors.py
+    update_paper_neighbors_task  incremental refresh after embeddings change
+                                 or a paper joins a library
+
+Both process papers in batches; each batch is one set-based statement that
+runs a lateral kNN probe per paper inside PostgreSQL.
+"""
+
+import logging
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+
+from paper_scraper.core.database import get_db_session
+from paper_scraper.core.vector import VectorService
+from paper_scraper.modules.papers.models import OrganizationPaper, Paper
+
+logger = logging.getLogger(__name__)
+
+# Papers per kNN batch statement
+DEFAULT_BATCH_SIZE = 200
+
+
+async def build_paper_neighbors_task(
+    ctx: dict[str, Any],
+    organization_id: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Rebuild the neighbour lists of every embedded paper in a library.
+
+    Args:
+        ctx: arq context.
+        organization_id: UUID string of the organization.
+        batch_size: Papers per kNN batch (one commit each).
+
+    Returns:
+        Result dict with paper and neighbour row counts.
+    """
+    org_id = UUID(organization_id)
+    vector = VectorService()
+    papers = 0
+    rows = 0
+    after_id: UUID | None = None
+
+    while True:
+        async with get_db_session() as db:
+            query = (
+                select(Paper.id)
+                .join(OrganizationPaper, OrganizationPaper.paper_id == Paper.id)
+                .where(
+                    OrganizationPaper.organization_id == org_id,
+                    Paper.embedding.isnot(None),
+                )
+                .order_by(Paper.id)
+                .limit(batch_size)
+            )
+            if after_id is not None:
+                query = query.where(Paper.id > after_id)
+            paper_ids = list((await db.execute(query)).scalars().all())
+            if not paper_ids:
+                break
+
+            rows += await vector.refresh_neighbors(db, org_id, paper_ids, propagate=False)
+            await db.commit()
+
+        papers += len(paper_ids)
+        after_id = paper_ids[-1]
+
+    logger.info(
+        "Built neighbour graph for org %s: %d papers, %d edges", organization_id, papers, rows
+    )
+    return {"status": "completed", "papers_processed": papers, "neighbors_written": rows}
+
+
+async def update_paper_neighbors_task(
+    ctx: dict[str, Any],
+    paper_ids: list[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Refresh neighbour lists after the given papers' embeddings changed.
+
+    Updates every library that contains one of the papers: the papers'
+    own lists are recomputed, so is every list built against their old
+    embeddings, and they are offered to their new neighbours' lists.
+
+    Args:
+        ctx: arq context.
+        paper_ids: UUID strings of papers with new embeddings.
+        batch_size: Papers per kNN batch (one commit each).
+
+    Returns:
+        Result dict with organization and paper counts.
+    """
+    ids = [UUID(pid) for pid in paper_ids]
+    vector = VectorService()
+    by_org: dict[UUID, list[UUID]] = {}
+
+    async with get_db_session() as db:
+        result = await db.execute(
+            select(OrganizationPaper.organization_id, OrganizationPaper.paper_id).where(
+                OrganizationPaper.paper_id.in_(ids)
+            )
+        )
+        for org_id, paper_id in result.all():
+            by_org.setdefault(org_id, []).append(paper_id)
+
+        for org_id, org_paper_ids in by_org.items():
+            for start in range(0, len(org_paper_ids), batch_size):
+                await vector.refresh_neighbors(
+                    db, org_id, org_paper_ids[start : start + batch_size]
+                )
+                await db.commit()
+
+    return {
+        "status": "completed",
+        "organizations": len(by_org),
+        "papers_refreshed": sum(len(v) for v in by_org.values()),
+    }
+
+
+async def schedule_neighbor_update(paper_ids: list[UUID]) -> None:
+    """Enqueue an incremental neighbour refresh; failures are only logged.
+
+    Call after the new embeddings are committed. Papers the graph has not
+    caught up with yet fall back to live kNN queries.
+    """
+    if not paper_ids:
+        return
+    from paper_scraper.jobs.worker import enqueue_job
+
+    try:
+        await enqueue_job("update_paper_neighbors_task", [str(pid) for pid in paper_ids])
+    except Exception as e:
+        logger.warning("Failed to schedule neighbour refresh for %d papers: %s", len(paper_ids), e)
+
+
+async def schedule_neighbor_build(organization_id: UUID) -> None:
+    """Enqueue a full neighbour-graph rebuild for a library; failures are only logged.
+
+    At most one build per library is queued at a time.
+    """
+    from paper_scraper.jobs.worker import enqueue_job
+
+    try:
+        await enqueue_job(
+            "build_paper_neighbors_task",
+            str(organization_id),
+            job_id=f"paper_neighbors:{organization_id}",
+        )
+    except Exception as e:
+        logger.warning("Failed to schedule neighbour build for org %s: %s", organization_id, e)
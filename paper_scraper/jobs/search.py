@@ -1,11 +1,22 @@
 """Background tasks for search operations."""
 
+import logging
+from dataclasses import asdict
 from typing import Any
 from uuid import UUID
 
+from paper_scraper.core.config import settings
 from paper_scraper.core.database import get_db_session
+from paper_scraper.core.search_outbox import SearchIndexer
+from paper_scraper.core.search_reindex import SearchReindexer
+from paper_scraper.jobs.neighbors import schedule_neighbor_build
 from paper_scraper.modules.search.service import SearchService
 
+logger = logging.getLogger(__name__)
+
+# Outbox batches per drain run; the next cron tick picks up the rest
+MAX_OUTBOX_BATCHES_PER_RUN = 100
+
 
 async def backfill_embeddings_task(
     ctx: dict[str, Any],
@@ -16,7 +27,8 @@ async def backfill_embeddings_task(
     """Backfill embeddings for papers that don't have them.
 
     Generates embeddings for all papers in an organization that don't
-    currently have vector embeddings.
+    currently have vector embeddings, then queues a full rebuild of the
+    organization's neighbour graph.
 
     Args:
         ctx: arq context.
@@ -35,6 +47,10 @@ async def backfill_embeddings_task(
             max_papers=max_papers,
         )
 
+    # Rebuild the whole library's similar-papers graph once it is embedded
+    if result.papers_succeeded:
+        await schedule_neighbor_build(UUID(organization_id))
+
     return {
         "status": "completed",
         "papers_processed": result.papers_processed,
@@ -42,3 +58,64 @@ async def backfill_embeddings_task(
         "papers_failed": result.papers_failed,
         "errors": result.errors,
     }
+
+
+async def reindex_search_task(
+    ctx: dict[str, Any],
+    batch_size: int | None = None,
+    writers: int | None = None,
+    keep_previous: bool = False,
+) -> dict[str, Any]:
+    """Rebuild the Typesense paper collections and swap the aliases to them.
+
+    Searches keep using the current collections until the swap. See
+    paper_scraper.core.search_reindex for the full workflow.
+
+    Args:
+        ctx: arq context.
+        batch_size: Documents per JSONL import (default from settings).
+        writers: Concurrent import requests (default from settings).
+        keep_previous: Keep the old collections for rollback.
+
+    Returns:
+        Result dict with the new collections and document counts.
+    """
+    reindexer = SearchReindexer(batch_size=batch_size, writers=writers)
+    result = await reindexer.run(keep_previous=keep_previous)
+    return {"status": "completed", **asdict(result)}
+
+
+async def drain_search_outbox_task(ctx: dict[str, Any]) -> dict[str, Any]:
+    """Apply pending search outbox entries to Typesense and report lag.
+
+    Runs every few seconds; several workers may drain concurrently since
+    batches are claimed with SKIP LOCKED.
+
+    Args:
+        ctx: arq context.
+
+    Returns:
+        Result dict with drain counts and the remaining outbox lag.
+    """
+    indexer = SearchIndexer()
+    stats = await indexer.drain(max_batches=MAX_OUTBOX_BATCHES_PER_RUN)
+    lag = await indexer.lag()
+
+    if lag["oldest_age_seconds"] > settings.SEARCH_OUTBOX_LAG_WARN_SECONDS:
+        logger.warning(
+            "Search outbox lagging: %d pending (%d retrying), oldest %.0fs old",
+            lag["pending"],
+            lag["retrying"],
+            lag["oldest_age_seconds"],
+        )
+    elif stats["entries"]:
+        logger.info(
+            "Search outbox drained %d entries (%d indexed, %d deleted, %d failed); %d pending",
+            stats["entries"],
+            stats["indexed"],
+            stats["deleted"],
+            stats["failed"],
+            lag["pending"],
+        )
+
+    return {"status": "completed", **stats, "lag": lag}
@@ -7,6 +7,8 @@ import arq
 from arq.connections import ArqRedis, RedisSettings
 
 from paper_scraper.core.config import settings
+from paper_scraper.core.http_clients import HTTPClientManager
+from paper_scraper.core.search_engine import shutdown_typesense_executor
 from paper_scraper.jobs.alerts import (
     process_daily_alerts_task,
     process_immediate_alert_task,
@@ -29,6 +31,7 @@ from paper_scraper.jobs.discovery import (
     run_discovery_task,
 )
 from paper_scraper.jobs.ingestion import ingest_source_task
+from paper_scraper.jobs.neighbors import build_paper_neighbors_task, update_paper_neighbors_task
 from paper_scraper.jobs.reports import (
     process_daily_reports_task,
     process_monthly_reports_task,
@@ -50,7 +53,11 @@ from paper_scraper.jobs.scoring import (
     score_paper_task,
     score_papers_batch_task,
 )
-from paper_scraper.jobs.search import backfill_embeddings_task
+from paper_scraper.jobs.search import (
+    backfill_embeddings_task,
+    drain_search_outbox_task,
+    reindex_search_task,
+)
 from paper_scraper.jobs.webhooks import dispatch_webhook_task
 
 
@@ -60,6 +67,8 @@ async def startup(ctx: dict[str, Any]) -> None:
 
 async def shutdown(ctx: dict[str, Any]) -> None:
     """Cleanup shared resources when worker shuts down."""
+    shutdown_typesense_executor()
+    await HTTPClientManager.close_all()
 
 
 def get_redis_settings() -> RedisSettings:
@@ -115,8 +124,13 @@ class WorkerSettings:
         poll_bedrock_batch_results_task,
         bulk_ingest_task,
         bulk_embed_papers_task,
+        build_paper_neighbors_task,
+        update_paper_neighbors_task,
         score_papers_parallel_task,
         shard_scoring_job_task,
+        # Full reindex of large catalogs outlasts the default job timeout
+        arq.func(reindex_search_task, timeout=6 * 3600),
+        drain_search_outbox_task,
     ]
 
     # Cron jobs for scheduled tasks
@@ -141,6 +155,8 @@ class WorkerSettings:
         arq.cron(process_discovery_weekly_task, weekday=0, hour=5, minute=0),
         # Daily cleanup of expired global score cache at 3:30 AM UTC
         arq.cron(cleanup_expired_score_cache_task, hour=3, minute=30),
+        # Search outbox → Typesense every 5 seconds
+        arq.cron(drain_search_outbox_task, second=set(range(0, 60, 5))),
     ]
 
     # Redis connection settings
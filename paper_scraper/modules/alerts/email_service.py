@@ -3,9 +3,8 @@
 import logging
 from typing import Any
 
-import httpx
-
 from paper_scraper.core.config import settings
+from paper_scraper.core.http_clients import HTTPClientManager
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +53,7 @@ class EmailService:
         if text:
             payload["text"] = text
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientManager.get_client(self.base_url, timeout=30.0) as client:
             response = await client.post(
                 f"{self.base_url}/emails",
                 json=payload,
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from paper_scraper.api.dependencies import CurrentUser
 from paper_scraper.core.database import get_db
+from paper_scraper.jobs.neighbors import schedule_neighbor_update
 from paper_scraper.modules.catalog.schemas import (
     CatalogListResponse,
     CatalogPaperDetail,
@@ -87,6 +88,9 @@ async def claim_paper(
         organization_id=current_user.organization_id,
         user_id=current_user.id,
     )
+    # Commit before the worker reads the library for the neighbour refresh
+    await catalog_service.db.commit()
+    await schedule_neighbor_update([paper_id])
     return ClaimPaperResponse(
         paper_id=paper_id,
         organization_id=current_user.organization_id,
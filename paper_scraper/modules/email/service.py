@@ -4,10 +4,9 @@ import html as html_escape
 import logging
 from typing import Any
 
-import httpx
-
 from paper_scraper.core.config import settings
 from paper_scraper.core.exceptions import EmailError
+from paper_scraper.core.http_clients import HTTPClientManager
 
 logger = logging.getLogger(__name__)
 
@@ -123,7 +122,7 @@ class EmailService:
         if text_content:
             payload["text"] = text_content
 
-        async with httpx.AsyncClient() as client:
+        async with HTTPClientManager.get_client(self.RESEND_API_URL, timeout=30.0) as client:
             response = await client.post(
                 f"{self.RESEND_API_URL}/emails",
                 json=payload,
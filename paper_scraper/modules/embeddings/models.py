@@ -0,0 +1,33 @@
+"""SQLAlchemy models for the shared embedding store."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+try:
+    from pgvector.sqlalchemy import Vector
+except ImportError:
+    Vector = None  # type: ignore[assignment,misc]
+
+from paper_scraper.core.database import Base
+
+
+class StoredEmbedding(Base):
+    """Content-addressed embedding shared across all tenants.
+
+    Rows are keyed by the embedding model (with its output dimension) and
+    the SHA-256 of the exact text that was embedded, so duplicate copies of
+    the same paper (one per importing organization plus the global catalog
+    row) only ever cost one embedding API call. The vector column is left
+    undimensioned so rows for different dimensions can coexist.
+    """
+
+    __tablename__ = "embedding_store"
+
+    model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    embedding = mapped_column(Vector() if Vector else String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
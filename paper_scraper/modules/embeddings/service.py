@@ -10,7 +10,8 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from paper_scraper.core.exceptions import NotFoundError
-from paper_scraper.core.sync import SyncService
+from paper_scraper.core.search_outbox import enqueue_paper_sync
+from paper_scraper.modules.embeddings.store import EmbeddingStore
 from paper_scraper.modules.papers.models import Paper
 from paper_scraper.modules.projects.models import ProjectPaper
 from paper_scraper.modules.scoring.embeddings import EmbeddingClient
@@ -44,7 +45,7 @@ class EmbeddingService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
         self.embedding_client = EmbeddingClient()
-        self.sync = SyncService()
+        self.store = EmbeddingStore()
 
     async def generate_for_paper(
         self,
@@ -52,7 +53,10 @@ class EmbeddingService:
         organization_id: UUID,
         force_regenerate: bool = False,
     ) -> bool:
-        """Generate embedding for one paper."""
+        """Generate embedding for one paper.
+
+        Commits, so the neighbour-graph refresh it queues sees the new vector.
+        """
         result = await self.db.execute(
             select(Paper).where(
                 Paper.id == paper_id,
@@ -66,15 +70,17 @@ class EmbeddingService:
         if paper.has_embedding and not force_regenerate:
             return False
 
-        embedding = await self.embedding_client.embed_text(self._paper_to_text(paper))
+        embedding = await self._embed_one(self._paper_to_text(paper))
 
         # Store embedding directly on the paper row (pgvector)
         paper.embedding = embedding
         paper.has_embedding = True
         await self.db.flush()
 
-        # Sync metadata to Typesense (embedding stored in pgvector, not Typesense)
-        self._sync_paper_metadata(paper)
+        # Queue the search document refresh (embedding stays in pgvector)
+        await enqueue_paper_sync(self.db, [paper.id])
+        await self.db.commit()
+        await self._schedule_neighbor_update([paper.id])
 
         return True
 
@@ -193,27 +199,32 @@ class EmbeddingService:
             chunk = papers[start : start + safe_batch_size]
             texts = [self._paper_to_text(paper) for paper in chunk]
             try:
-                embeddings = await self.embedding_client.embed_texts(texts)
+                embeddings = await self.store.embed_texts(self.db, self.embedding_client, texts)
                 for paper, embedding in zip(chunk, embeddings, strict=False):
+                    paper.embedding = embedding
                     paper.has_embedding = True
-                    await self._sync_paper_to_external(paper, embedding)
                     succeeded += 1
+                await enqueue_paper_sync(self.db, [paper.id for paper in chunk])
                 await self.db.commit()
+                await self._schedule_neighbor_update([paper.id for paper in chunk])
                 continue
             except Exception as chunk_exc:
                 errors.append(f"Batch {start // safe_batch_size + 1}: {str(chunk_exc)[:120]}")
 
             # Fallback to per-paper embedding when batch call fails.
+            embedded_ids: list[UUID] = []
             for paper in chunk:
                 try:
-                    embedding = await self.embedding_client.embed_text(self._paper_to_text(paper))
+                    paper.embedding = await self._embed_one(self._paper_to_text(paper))
                     paper.has_embedding = True
-                    await self._sync_paper_to_external(paper, embedding)
                     succeeded += 1
+                    embedded_ids.append(paper.id)
                 except Exception as exc:
                     failed += 1
                     errors.append(f"Paper {paper.id}: {str(exc)[:120]}")
+            await enqueue_paper_sync(self.db, embedded_ids)
             await self.db.commit()
+            await self._schedule_neighbor_update(embedded_ids)
 
         return EmbeddingBackfillSummary(
             papers_processed=len(papers),
@@ -222,52 +233,43 @@ class EmbeddingService:
             errors=errors[:20],
         )
 
-    async def _sync_paper_to_external(
-        self,
-        paper: Paper,
-        embedding: list[float],
-    ) -> None:
-        """Store embedding on paper row (pgvector) and sync metadata to Typesense.
-
-        Failures are logged but never raised — the PostgreSQL write is the
-        authoritative operation and must not be blocked by external service
-        errors.
-        """
-        try:
-            # Store embedding directly on paper row (pgvector)
-            paper.embedding = embedding
-            paper.has_embedding = True
-            # Sync metadata to Typesense
-            self._sync_paper_metadata(paper)
-        except Exception:
-            logger.exception("Failed to sync paper %s to external services", paper.id)
-
-    def _sync_paper_metadata(self, paper: Paper) -> None:
-        """Sync paper metadata to Typesense (no embedding — that's in pgvector)."""
-        try:
-            self.sync.sync_paper(
-                paper_id=paper.id,
-                organization_id=paper.organization_id,
-                title=paper.title,
-                abstract=paper.abstract,
-                doi=paper.doi,
-                source=paper.source.value if paper.source else None,
-                journal=paper.journal,
-                paper_type=paper.paper_type.value if paper.paper_type else None,
-                keywords=paper.keywords,
-                citations_count=paper.citations_count,
-                has_embedding=paper.has_embedding,
-                is_global=getattr(paper, "is_global", False),
-                publication_date=paper.publication_date,
-                created_at=paper.created_at,
-            )
-        except Exception:
-            logger.exception("Failed to sync paper %s to Typesense", paper.id)
+    @staticmethod
+    async def _schedule_neighbor_update(paper_ids: list[UUID]) -> None:
+        """Queue a refresh of the precomputed similar-papers graph."""
+        # Imported lazily: the jobs package imports this module via the worker
+        from paper_scraper.jobs.neighbors import schedule_neighbor_update
+
+        await schedule_neighbor_update(paper_ids)
+
+    async def _embed_one(self, text: str) -> list[float]:
+        """Embed one text, reusing a stored embedding of identical content."""
+        model = self.embedding_client.model_key
+        stored = (await self.store.get_many(self.db, model, [text]))[0]
+        if stored is not None:
+            return stored
+        # embed_texts, not embed_text: paper texts stay out of the query cache
+        embedding = (await self.embedding_client.embed_texts([text]))[0]
+        await self.store.put_many(self.db, model, [text], [embedding])
+        return embedding
 
     def _paper_to_text(self, paper: Paper) -> str:
-        parts = [f"Title: {paper.title}"]
-        if paper.abstract:
-            parts.append(f"Abstract: {paper.abstract}")
-        if paper.keywords:
-            parts.append(f"Keywords: {', '.join(paper.keywords)}")
-        return "\n\n".join(parts)
+        return paper_to_text(paper.title, paper.abstract, paper.keywords)
+
+
+def paper_to_text(
+    title: str | None,
+    abstract: str | None,
+    keywords: list[str] | None,
+) -> str:
+    """Build the text embedded for a paper.
+
+    Every paper embedding path must use this so that identical literature
+    hashes to the same embedding store key regardless of which tenant (or
+    the global catalog) owns the row.
+    """
+    parts = [f"Title: {title}"]
+    if abstract:
+        parts.append(f"Abstract: {abstract}")
+    if keywords:
+        parts.append(f"Keywords: {', '.join(keywords)}")
+    return "\n\n".join(parts)
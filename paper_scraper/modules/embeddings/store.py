@@ -0,0 +1,163 @@
+"""Content-addressed embedding store shared across tenants.
+
+The same literature is imported by many organizations, and each copy gets its
+own ``Paper`` row. Embeddings are a pure function of (model, dimensions, text),
+so they are stored once under the SHA-256 of the text and looked up in bulk
+before any embedding API call. ``model`` arguments are EmbeddingClient.model_key
+values, which include the output dimension.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.database import get_db_session
+from paper_scraper.modules.embeddings.models import StoredEmbedding
+from paper_scraper.modules.scoring.embeddings import EmbeddingClient
+
+logger = logging.getLogger(__name__)
+
+# Keeps IN lists and multi-row INSERTs at a sensible statement size
+_CHUNK_SIZE = 500
+
+
+def content_hash(text: str) -> str:
+    """Return the store key for an embedding input text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """Bulk get/put access to the ``embedding_store`` table.
+
+    Store failures never fail the caller: lookups degrade to misses and
+    writes are dropped. Both run inside a SAVEPOINT so a failed statement
+    does not poison the caller's transaction.
+    """
+
+    def __init__(self, enabled: bool | None = None) -> None:
+        self.enabled = settings.EMBEDDING_STORE_ENABLED if enabled is None else enabled
+
+    async def get_many(
+        self,
+        db: AsyncSession,
+        model: str,
+        texts: list[str],
+    ) -> list[list[float] | None]:
+        """Look up stored embeddings for texts, preserving input order.
+
+        Returns:
+            One entry per text: the stored vector, or None on a miss.
+        """
+        if not self.enabled or not texts:
+            return [None] * len(texts)
+
+        hashes = [content_hash(text) for text in texts]
+        unique = list(dict.fromkeys(hashes))
+        found: dict[str, list[float]] = {}
+        try:
+            async with db.begin_nested():
+                for start in range(0, len(unique), _CHUNK_SIZE):
+                    result = await db.execute(
+                        select(StoredEmbedding.content_hash, StoredEmbedding.embedding).where(
+                            StoredEmbedding.model == model,
+                            StoredEmbedding.content_hash.in_(unique[start : start + _CHUNK_SIZE]),
+                        )
+                    )
+                    for row in result.all():
+                        found[row.content_hash] = [float(x) for x in row.embedding]
+        except Exception as e:
+            logger.warning("Embedding store lookup failed: %s", e)
+            return [None] * len(texts)
+
+        return [found.get(h) for h in hashes]
+
+    async def put_many(
+        self,
+        db: AsyncSession,
+        model: str,
+        texts: list[str],
+        embeddings: list[list[float]],
+    ) -> None:
+        """Store embeddings for texts; existing entries are left untouched."""
+        if not self.enabled or not texts:
+            return
+
+        rows = {
+            content_hash(text): embedding for text, embedding in zip(texts, embeddings, strict=True)
+        }
+        values = [
+            {"model": model, "content_hash": h, "embedding": embedding}
+            for h, embedding in rows.items()
+        ]
+        try:
+            async with db.begin_nested():
+                for start in range(0, len(values), _CHUNK_SIZE):
+                    await db.execute(
+                        insert(StoredEmbedding)
+                        .values(values[start : start + _CHUNK_SIZE])
+                        .on_conflict_do_nothing(index_elements=["model", "content_hash"])
+                    )
+        except Exception as e:
+            logger.warning("Embedding store write failed: %s", e)
+
+    async def embed_texts(
+        self,
+        db: AsyncSession,
+        client: EmbeddingClient,
+        texts: list[str],
+    ) -> list[list[float]]:
+        """Embed texts, calling the API only for texts not already stored.
+
+        Duplicate texts within the batch are embedded once.
+        """
+        vectors = await self.get_many(db, client.model_key, texts)
+        missing = _missing_texts(texts, vectors)
+        if missing:
+            embedded = await client.embed_texts(missing)
+            await self.put_many(db, client.model_key, missing, embedded)
+            vectors = _fill_missing(texts, vectors, missing, embedded)
+        return vectors  # type: ignore[return-value]
+
+    async def embed_texts_detached(
+        self,
+        client: EmbeddingClient,
+        texts: list[str],
+    ) -> list[list[float]]:
+        """Like embed_texts, but without holding a session during the API call.
+
+        The lookup and the write each run in their own short session, so
+        concurrent callers do not pin pooled DB connections while waiting
+        on the embedding provider.
+        """
+        async with get_db_session() as db:
+            vectors = await self.get_many(db, client.model_key, texts)
+        missing = _missing_texts(texts, vectors)
+        if missing:
+            embedded = await client.embed_texts(missing)
+            async with get_db_session() as db:
+                await self.put_many(db, client.model_key, missing, embedded)
+                await db.commit()
+            vectors = _fill_missing(texts, vectors, missing, embedded)
+        return vectors  # type: ignore[return-value]
+
+
+def _missing_texts(texts: list[str], vectors: list[list[float] | None]) -> list[str]:
+    """Distinct texts without a stored vector, in input order."""
+    return list(dict.fromkeys(t for t, v in zip(texts, vectors, strict=True) if v is None))
+
+
+def _fill_missing(
+    texts: list[str],
+    vectors: list[list[float] | None],
+    missing: list[str],
+    embedded: list[list[float]],
+) -> list[list[float] | None]:
+    """Fill store misses with freshly embedded vectors."""
+    by_text = dict(zip(missing, embedded, strict=True))
+    return [v if v is not None else by_text[t] for t, v in zip(texts, vectors, strict=True)]
@@ -45,6 +45,8 @@ class ModelConfiguration(Base):
     max_tokens: Mapped[int] = mapped_column(Integer, nullable=False, server_default="4096")
     temperature: Mapped[float] = mapped_column(Float, nullable=False, server_default="0.3")
     workflow: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # per_dimension | combined; None uses SCORING_STRATEGY
+    scoring_strategy: Mapped[str | None] = mapped_column(String(20), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
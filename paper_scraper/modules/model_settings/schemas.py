@@ -1,7 +1,7 @@
 """Pydantic schemas for model settings module."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -35,6 +35,11 @@ class ModelConfigurationCreate(BaseModel):
         max_length=50,
         description="AI workflow assignment (scoring, summary, classification, embedding)",
     )
+    scoring_strategy: Literal["per_dimension", "combined"] | None = Field(
+        default=None,
+        description="Scoring call strategy: one LLM call per dimension, or one combined "
+        "call for all dimensions (default: platform setting)",
+    )
 
 
 class ModelConfigurationUpdate(BaseModel):
@@ -48,6 +53,7 @@ class ModelConfigurationUpdate(BaseModel):
     max_tokens: int | None = Field(default=None, ge=1, le=128000)
     temperature: float | None = Field(default=None, ge=0.0, le=2.0)
     workflow: str | None = Field(default=None, max_length=50)
+    scoring_strategy: Literal["per_dimension", "combined"] | None = None
 
 
 class ModelConfigurationResponse(BaseModel):
@@ -63,6 +69,7 @@ class ModelConfigurationResponse(BaseModel):
     max_tokens: int
     temperature: float
     workflow: str | None = None
+    scoring_strategy: str | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -64,6 +64,7 @@ class ModelSettingsService:
             max_tokens=data.max_tokens,
             temperature=data.temperature,
             workflow=data.workflow,
+            scoring_strategy=data.scoring_strategy,
         )
         self.db.add(config)
         await self.db.flush()
@@ -97,6 +98,8 @@ class ModelSettingsService:
             config.temperature = data.temperature
         if data.workflow is not None:
             config.workflow = data.workflow if data.workflow != "" else None
+        if data.scoring_strategy is not None:
+            config.scoring_strategy = data.scoring_strategy
 
         await self.db.flush()
         await self.db.refresh(config)
@@ -285,6 +288,7 @@ class ModelSettingsService:
             max_tokens=config.max_tokens,
             temperature=config.temperature,
             workflow=config.workflow,
+            scoring_strategy=config.scoring_strategy,
             created_at=config.created_at,
             updated_at=config.updated_at,
         )
@@ -25,6 +25,7 @@ try:
 except ImportError:
     Vector = None  # type: ignore[assignment,misc]
 
+from paper_scraper.core.config import settings
 from paper_scraper.core.database import Base
 
 if TYPE_CHECKING:
@@ -113,8 +114,10 @@ class Paper(Base):
     pdf_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
     full_text: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    # Vector embedding (pgvector, 1536d from text-embedding-3-small)
-    embedding = mapped_column(Vector(1536) if Vector else Text, nullable=True)
+    # Vector embedding (pgvector, EMBEDDING_DIMENSIONS from text-embedding-3)
+    embedding = mapped_column(
+        Vector(settings.EMBEDDING_DIMENSIONS) if Vector else Text, nullable=True
+    )
 
     # Whether this paper has a vector embedding
     has_embedding: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from paper_scraper.api.dependencies import CurrentUser, require_permission
 from paper_scraper.core.database import get_db
 from paper_scraper.core.exceptions import NotFoundError
+from paper_scraper.core.index_generation import index_generation
 from paper_scraper.core.permissions import Permission
 from paper_scraper.core.uploads import read_upload_content, validate_pdf_structure
 from paper_scraper.jobs.badges import trigger_badge_check
@@ -162,6 +163,10 @@ async def delete_paper(
     deleted = await paper_service.delete_paper(paper_id, current_user.organization_id)
     if not deleted:
         raise NotFoundError("Paper", str(paper_id))
+    # Bump only once the delete is visible; a search between the two would
+    # otherwise cache the paper under the new generation
+    await paper_service.db.commit()
+    await index_generation.bump(current_user.organization_id)
 
 
 @router.post(
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from paper_scraper.core.exceptions import DuplicateError, NotFoundError
+from paper_scraper.core.search_outbox import OUTBOX_DELETE, enqueue_paper_sync
 from paper_scraper.core.sql_utils import escape_like
 from paper_scraper.modules.papers.clients.crossref import CrossrefClient
 from paper_scraper.modules.papers.clients.openalex import OpenAlexClient
@@ -125,6 +126,9 @@ class PaperService:
     async def delete_paper(self, paper_id: UUID, organization_id: UUID) -> bool:
         """Delete paper by ID.
 
+        The caller commits and then bumps the organization's search index
+        generation, so cached search responses drop the paper.
+
         Args:
             paper_id: Paper UUID.
             organization_id: Organization UUID for tenant isolation.
@@ -136,6 +140,9 @@ class PaperService:
         if not paper:
             return False
         await self.db.delete(paper)
+        await enqueue_paper_sync(
+            self.db, [paper_id], OUTBOX_DELETE, organization_id=organization_id
+        )
         await self.db.flush()
         return True
 
@@ -297,6 +304,7 @@ class PaperService:
             )
             self.db.add(paper_author)
 
+        await enqueue_paper_sync(self.db, [paper.id])
         await self.db.flush()
         return paper
 
@@ -10,6 +10,7 @@ from uuid import UUID
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from paper_scraper.core.search_outbox import enqueue_paper_sync
 from paper_scraper.modules.ingestion.interfaces import NormalizedAuthor, NormalizedPaperBundle
 from paper_scraper.modules.papers.models import Author, Paper, PaperAuthor, PaperSource
 
@@ -150,6 +151,7 @@ class PaperUpsertService:
                 )
             )
 
+        await enqueue_paper_sync(self.db, [r.paper.id for r in results if r.created or r.merged])
         await self.db.flush()
         return results
 
@@ -6,18 +6,25 @@ LLM prompt alongside existing signals (h-index, affiliations, etc.).
 
 GitHub: search by author name → top repos, languages, followers.
 ORCID:  fetch by ORCID ID   → employment, education, funding, peer reviews.
+
+Both lookups go through the shared enrichment cache (GitHub keyed by the
+normalized author name and affiliations, ORCID by iD);
+prewarm_orcid_profiles() fills it ahead of bulk scoring.
 """
 
 import asyncio
+import hashlib
 import logging
 import re
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from difflib import SequenceMatcher
 from typing import Any
 
 import httpx
 
 from paper_scraper.core.config import settings
+from paper_scraper.core.http_clients import HTTPClientManager
+from paper_scraper.modules.scoring.enrichment_cache import enrichment_cache
 
 logger = logging.getLogger(__name__)
 
@@ -183,11 +190,32 @@ async def fetch_author_profiles(
     return AuthorProfileResult(profiles=profiles, errors=errors)
 
 
+async def prewarm_orcid_profiles(orcids: list[str]) -> int:
+    """Fill the enrichment cache with ORCID records, skipping cached ones.
+
+    ORCID has no batch endpoint, so records are fetched with bounded
+    concurrency. Returns the number of distinct iDs covered.
+    """
+    unique = list(dict.fromkeys(o for o in orcids if o))
+    semaphore = asyncio.Semaphore(settings.ENRICHMENT_PREWARM_CONCURRENCY)
+
+    async def _one(orcid: str) -> None:
+        async with semaphore:
+            await _fetch_orcid_profile(orcid)
+
+    await asyncio.gather(*[_one(o) for o in unique])
+    return len(unique)
+
+
 # ---------------------------------------------------------------------------
 # GitHub
 # ---------------------------------------------------------------------------
 
 
+class _GitHubRateLimitedError(Exception):
+    """The remaining GitHub quota is below GITHUB_RATE_LIMIT_FLOOR."""
+
+
 def _github_headers() -> dict[str, str]:
     """Build GitHub API request headers."""
     headers = {
@@ -213,80 +241,108 @@ async def _search_github_user(
         return None
 
     clean_name = name.strip()[:100]
-    query = f"{clean_name} type:user"
-    url = f"{settings.GITHUB_API_BASE_URL}/search/users"
+    cache_key = _github_cache_key(clean_name, affiliations)
+    hit, cached = await enrichment_cache.get("github", cache_key)
+    if hit:
+        return GitHubProfile(**cached) if cached else None
 
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            resp = await client.get(
-                url,
-                params={"q": query, "per_page": 3},
-                headers=_github_headers(),
-            )
+        profile = await _lookup_github_user(clean_name, affiliations)
+    except _GitHubRateLimitedError:
+        return None
+    except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException) as e:
+        logger.warning("GitHub search failed for '%s': %s", clean_name, e)
+        return None
+    except (ValueError, KeyError) as e:
+        logger.warning("GitHub response parsing error for '%s': %s", clean_name, e)
+        return None
 
-            # Check rate limit (safe int conversion)
-            remaining = resp.headers.get("X-RateLimit-Remaining")
-            if remaining:
-                try:
-                    remaining_int = int(remaining)
-                except (TypeError, ValueError):
-                    remaining_int = 0
-                if remaining_int < GITHUB_RATE_LIMIT_FLOOR:
-                    logger.warning("GitHub rate limit low (%s remaining), skipping", remaining)
-                    return None
+    # No match is cached too, as a negative entry
+    await enrichment_cache.set("github", cache_key, asdict(profile) if profile else None)
+    return profile
 
-            resp.raise_for_status()
-            data = resp.json()
 
-            items = data.get("items", [])
-            if not items:
-                return None
+def _github_cache_key(clean_name: str, affiliations: list[str] | None) -> str:
+    """Cache key for a GitHub match; the affiliations feed the match, so they key it too."""
+    key = " ".join(clean_name.split()).casefold()
+    normalized = sorted({" ".join(a.split()).casefold() for a in affiliations or []} - {""})
+    if normalized:
+        digest = hashlib.sha256("|".join(normalized).encode("utf-8")).hexdigest()[:16]
+        key = f"{key}:{digest}"
+    return key
 
-            # Find best match by name similarity
-            best_match = _pick_best_github_match(clean_name, items, affiliations)
-            if not best_match:
-                return None
 
-            username = best_match.get("login", "")
-            if not _GITHUB_LOGIN_PATTERN.match(username):
-                logger.warning("GitHub returned unexpected login format, discarding")
-                return None
+async def _lookup_github_user(
+    clean_name: str,
+    affiliations: list[str] | None,
+) -> GitHubProfile | None:
+    """Search GitHub and fetch the best match; None when nothing matches."""
+    query = f"{clean_name} type:user"
+    url = f"{settings.GITHUB_API_BASE_URL}/search/users"
 
-            # Fetch full profile + repos
-            profile_resp = await client.get(
-                f"{settings.GITHUB_API_BASE_URL}/users/{username}",
-                headers=_github_headers(),
-            )
-            profile_resp.raise_for_status()
-            profile_data = profile_resp.json()
+    async with HTTPClientManager.get_client(url, timeout=REQUEST_TIMEOUT) as client:
+        resp = await client.get(
+            url,
+            params={"q": query, "per_page": 3},
+            headers=_github_headers(),
+        )
+
+        # Check rate limit (safe int conversion)
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        if remaining:
+            try:
+                remaining_int = int(remaining)
+            except (TypeError, ValueError):
+                remaining_int = 0
+            if remaining_int < GITHUB_RATE_LIMIT_FLOOR:
+                logger.warning("GitHub rate limit low (%s remaining), skipping", remaining)
+                raise _GitHubRateLimitedError
+
+        resp.raise_for_status()
+        data = resp.json()
+
+        items = data.get("items", [])
+        if not items:
+            return None
 
-            repos_resp = await client.get(
-                f"{settings.GITHUB_API_BASE_URL}/users/{username}/repos",
-                params={"sort": "stars", "direction": "desc", "per_page": 5},
-                headers=_github_headers(),
-            )
-            repos_resp.raise_for_status()
-            repos_data = repos_resp.json()
-
-            top_languages = _extract_top_languages(repos_data)
-            popular_repos = _format_popular_repos(repos_data)
-
-            return GitHubProfile(
-                username=username,
-                bio=_safe_str(profile_data.get("bio"), 200),
-                company=_safe_str(profile_data.get("company"), 100),
-                public_repos=min(int(profile_data.get("public_repos", 0)), 500_000),
-                followers=min(int(profile_data.get("followers", 0)), 10_000_000),
-                top_languages=top_languages,
-                popular_repos=popular_repos,
-            )
+        # Find best match by name similarity
+        best_match = _pick_best_github_match(clean_name, items, affiliations)
+        if not best_match:
+            return None
 
-    except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException) as e:
-        logger.warning("GitHub search failed for '%s': %s", clean_name, e)
-        return None
-    except (ValueError, KeyError) as e:
-        logger.warning("GitHub response parsing error for '%s': %s", clean_name, e)
-        return None
+        username = best_match.get("login", "")
+        if not _GITHUB_LOGIN_PATTERN.match(username):
+            logger.warning("GitHub returned unexpected login format, discarding")
+            return None
+
+        # Fetch full profile + repos
+        profile_resp = await client.get(
+            f"{settings.GITHUB_API_BASE_URL}/users/{username}",
+            headers=_github_headers(),
+        )
+        profile_resp.raise_for_status()
+        profile_data = profile_resp.json()
+
+        repos_resp = await client.get(
+            f"{settings.GITHUB_API_BASE_URL}/users/{username}/repos",
+            params={"sort": "stars", "direction": "desc", "per_page": 5},
+            headers=_github_headers(),
+        )
+        repos_resp.raise_for_status()
+        repos_data = repos_resp.json()
+
+        top_languages = _extract_top_languages(repos_data)
+        popular_repos = _format_popular_repos(repos_data)
+
+        return GitHubProfile(
+            username=username,
+            bio=_safe_str(profile_data.get("bio"), 200),
+            company=_safe_str(profile_data.get("company"), 100),
+            public_repos=min(int(profile_data.get("public_repos", 0)), 500_000),
+            followers=min(int(profile_data.get("followers", 0)), 10_000_000),
+            top_languages=top_languages,
+            popular_repos=popular_repos,
+        )
 
 
 def _pick_best_github_match(
@@ -382,11 +438,18 @@ async def _fetch_orcid_profile(orcid: str) -> OrcidProfile | None:
         logger.warning("Invalid ORCID format, skipping: %s", clean_orcid[:20])
         return None
 
+    hit, cached = await enrichment_cache.get("orcid", clean_orcid)
+    if hit:
+        return OrcidProfile(**cached) if cached else None
+
     url = f"{settings.ORCID_API_BASE_URL}/{clean_orcid}/record"
 
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        async with HTTPClientManager.get_client(url, timeout=REQUEST_TIMEOUT) as client:
             resp = await client.get(url, headers={"Accept": "application/json"})
+            if resp.status_code == 404:
+                await enrichment_cache.set("orcid", clean_orcid, None)
+                return None
             resp.raise_for_status()
             data = resp.json()
 
@@ -397,7 +460,9 @@ async def _fetch_orcid_profile(orcid: str) -> OrcidProfile | None:
         logger.warning("ORCID returned invalid JSON for '%s': %s", clean_orcid, e)
         return None
 
-    return _parse_orcid_record(clean_orcid, data)
+    profile = _parse_orcid_record(clean_orcid, data)
+    await enrichment_cache.set("orcid", clean_orcid, asdict(profile))
+    return profile
 
 
 def _parse_orcid_record(orcid_id: str, data: dict) -> OrcidProfile:
@@ -20,6 +20,8 @@ from langfuse.decorators import observe
 from paper_scraper.core.config import settings
 from paper_scraper.core.exceptions import ExternalAPIError
 from paper_scraper.modules.scoring.llm_client import (
+    CACHE_WRITE_PRICE_FACTOR,
+    CACHED_INPUT_PRICE_FACTOR,
     BaseLLMClient,
     LLMResponse,
     TokenUsage,
@@ -109,14 +111,18 @@ class BedrockClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> dict[str, Any]:
         """Call the Bedrock Converse API with retry logic."""
-        messages = [
-            {
-                "role": "user",
-                "content": [{"text": prompt}],
-            }
-        ]
+        content: list[dict[str, Any]] = []
+        if prefix:
+            # Shared prefix first; a cachePoint after it lets later calls
+            # with the same system prompt and prefix read it from the cache
+            content.append({"text": prefix})
+            if settings.AWS_BEDROCK_PROMPT_CACHING:
+                content.append({"cachePoint": {"type": "default"}})
+        content.append({"text": prompt})
+        messages = [{"role": "user", "content": content}]
 
         inference_config: dict[str, Any] = {
             "temperature": temperature if temperature is not None else settings.LLM_TEMPERATURE,
@@ -192,24 +198,32 @@ class BedrockClient(BaseLLMClient):
         usage = None
         usage_data = response.get("usage", {})
         if usage_data:
+            # inputTokens excludes tokens read from or written to the prompt cache
             input_tokens = usage_data.get("inputTokens", 0)
             output_tokens = usage_data.get("outputTokens", 0)
+            cache_read = usage_data.get("cacheReadInputTokens", 0)
+            cache_write = usage_data.get("cacheWriteInputTokens", 0)
+            prompt_tokens = input_tokens + cache_read + cache_write
             usage = TokenUsage(
-                prompt_tokens=input_tokens,
+                prompt_tokens=prompt_tokens,
                 completion_tokens=output_tokens,
-                total_tokens=input_tokens + output_tokens,
+                total_tokens=prompt_tokens + output_tokens,
                 model=self.model,
+                cached_prompt_tokens=cache_read,
+                cache_creation_tokens=cache_write,
             )
 
             # Log with Bedrock-specific pricing
             pricing = BEDROCK_PRICING.get(self.model, {"input": 1.0, "output": 3.0})
             cost = (
-                input_tokens * pricing["input"] / 1_000_000
-                + output_tokens * pricing["output"] / 1_000_000
-            )
+                input_tokens
+                + cache_read * CACHED_INPUT_PRICE_FACTOR
+                + cache_write * CACHE_WRITE_PRICE_FACTOR
+            ) * pricing["input"] / 1_000_000 + output_tokens * pricing["output"] / 1_000_000
             logger.info(
-                "Bedrock request completed: %d tokens, ~$%.6f (%s)",
+                "Bedrock request completed: %d tokens (%d cached), ~$%.6f (%s)",
                 usage.total_tokens,
+                cache_read,
                 cost,
                 self.model,
             )
@@ -228,6 +242,7 @@ class BedrockClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> str:
         """Generate completion using Bedrock Converse API, tracked by Langfuse."""
         response = await self.complete_with_usage(
@@ -236,6 +251,7 @@ class BedrockClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=json_mode,
+            prefix=prefix,
         )
         return response.content
 
@@ -246,6 +262,7 @@ class BedrockClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> LLMResponse:
         """Generate completion with token usage tracking."""
         response = await self._converse(
@@ -254,6 +271,7 @@ class BedrockClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=json_mode,
+            prefix=prefix,
         )
         return self._parse_response(response)
 
@@ -263,6 +281,7 @@ class BedrockClient(BaseLLMClient):
         system: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prefix: str | None = None,
     ) -> dict[str, Any]:
         """Generate JSON completion using Bedrock Converse API."""
         response = await self.complete(
@@ -271,6 +290,7 @@ class BedrockClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=True,
+            prefix=prefix,
         )
 
         # Clean up markdown-wrapped JSON
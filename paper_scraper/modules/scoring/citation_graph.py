@@ -1,12 +1,18 @@
-"""Citation graph data fetching from OpenAlex for scoring context."""
+"""Citation graph data fetching from OpenAlex for scoring context.
 
+DOI resolutions, work metadata and citing papers are kept in the shared
+enrichment cache; prewarm_citation_graphs() fills it for many papers with
+batched OpenAlex requests ahead of bulk scoring.
+"""
+
+import asyncio
 import logging
 import re
-from dataclasses import dataclass, field
-
-import httpx
+from dataclasses import asdict, dataclass, field
 
 from paper_scraper.core.config import settings
+from paper_scraper.core.http_clients import HTTPClientManager
+from paper_scraper.modules.scoring.enrichment_cache import enrichment_cache
 
 DOI_PATTERN = re.compile(r"^10\.\d{4,9}/\S+$")
 OPENALEX_ID_PATTERN = re.compile(r"^W\d+$")
@@ -16,6 +22,8 @@ logger = logging.getLogger(__name__)
 MAX_REFERENCES = 10
 MAX_CITING_PAPERS = 10
 REQUEST_TIMEOUT = 15.0
+OPENALEX_BATCH_SIZE = 50  # IDs per OpenAlex filter request
+WORK_SELECT = "id,title,doi,publication_year,cited_by_count"
 
 
 @dataclass
@@ -108,59 +116,162 @@ def _extract_reference_ids(raw_metadata: dict | None) -> list[str]:
     return [str(r) for r in referenced if r and isinstance(r, str)]
 
 
-async def _resolve_openalex_id(doi: str) -> str | None:
-    """Resolve a DOI to an OpenAlex work ID."""
+async def prewarm_citation_graphs(
+    papers: list[tuple[str | None, str | None, dict | None]],
+) -> dict[str, int]:
+    """Fill the enrichment cache for the citation graphs of many papers.
+
+    DOIs are resolved and referenced works fetched with batched OpenAlex
+    filter requests; citing papers (one request per work) are fetched with
+    bounded concurrency. Entries that are already cached are skipped.
+
+    Args:
+        papers: (doi, openalex_id, raw_metadata) per paper, as passed to
+            fetch_citation_graph().
+
+    Returns:
+        Dict with the number of papers, referenced works and citing-paper
+        lists covered.
+    """
+    openalex_ids = [oid for _, oid, _ in papers if oid]
+    dois = [
+        clean
+        for doi, oid, _ in papers
+        if doi and not oid and (clean := _clean_doi(doi)) and "|" not in clean
+    ]
+    resolved = await _resolve_openalex_ids(dois)
+    openalex_ids.extend(oid for oid in resolved.values() if oid)
+
+    reference_ids = list(
+        dict.fromkeys(
+            wid for _, _, raw in papers for wid in _extract_reference_ids(raw)[:MAX_REFERENCES]
+        )
+    )
+    await _fetch_works_batch(reference_ids)
+
+    semaphore = asyncio.Semaphore(settings.ENRICHMENT_PREWARM_CONCURRENCY)
+
+    async def _citing(openalex_id: str) -> None:
+        async with semaphore:
+            await _fetch_citing_papers(openalex_id)
+
+    unique_ids = list(dict.fromkeys(openalex_ids))
+    await asyncio.gather(*[_citing(oid) for oid in unique_ids])
+    return {"papers": len(papers), "works": len(reference_ids), "citing": len(unique_ids)}
+
+
+def _clean_doi(doi: str) -> str | None:
+    """Normalize a DOI for lookups and cache keys; None if malformed."""
     clean_doi = doi.replace("https://doi.org/", "").replace("http://dx.doi.org/", "")
     clean_doi = clean_doi.split("?")[0].split("#")[0]  # Strip query/fragment
     if not DOI_PATTERN.match(clean_doi):
         logger.warning("Invalid DOI format, skipping resolution: %s", doi[:100])
         return None
+    return clean_doi.lower()
+
+
+def _bare_work_id(work_id: str) -> str | None:
+    bare_id = work_id.rstrip("/").rsplit("/", 1)[-1]
+    return bare_id if OPENALEX_ID_PATTERN.match(bare_id) else None
+
+
+async def _resolve_openalex_id(doi: str) -> str | None:
+    """Resolve a DOI to an OpenAlex work ID."""
+    clean_doi = _clean_doi(doi)
+    if not clean_doi:
+        return None
+    hit, cached = await enrichment_cache.get("openalex_id", clean_doi)
+    if hit:
+        return cached
+
     url = f"{settings.OPENALEX_BASE_URL}/works/doi:{clean_doi}"
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        async with HTTPClientManager.get_client(url, timeout=REQUEST_TIMEOUT) as client:
             response = await client.get(url, params={"mailto": settings.OPENALEX_EMAIL})
-            if response.status_code == 200:
-                return response.json().get("id")
+            if response.status_code == 404:
+                await enrichment_cache.set("openalex_id", clean_doi, None)
+            elif response.status_code == 200:
+                openalex_id = response.json().get("id")
+                await enrichment_cache.set("openalex_id", clean_doi, openalex_id)
+                return openalex_id
     except Exception as e:
         logger.warning("Failed to resolve OpenAlex ID for DOI %s: %s", doi, e)
     return None
 
 
+async def _resolve_openalex_ids(clean_dois: list[str]) -> dict[str, str | None]:
+    """Resolve normalized DOIs to OpenAlex IDs, batching uncached ones."""
+    resolved = await enrichment_cache.get_many("openalex_id", clean_dois)
+    missing = [doi for doi in dict.fromkeys(clean_dois) if doi not in resolved]
+    for start in range(0, len(missing), OPENALEX_BATCH_SIZE):
+        batch = missing[start : start + OPENALEX_BATCH_SIZE]
+        params = {
+            "filter": f"doi:{'|'.join(batch)}",
+            "select": "id,doi",
+            "per_page": len(batch),
+            "mailto": settings.OPENALEX_EMAIL,
+        }
+        try:
+            async with HTTPClientManager.get_client(
+                settings.OPENALEX_BASE_URL, timeout=REQUEST_TIMEOUT
+            ) as client:
+                response = await client.get(f"{settings.OPENALEX_BASE_URL}/works", params=params)
+                response.raise_for_status()
+                results = response.json().get("results", [])
+        except Exception as e:
+            logger.warning("Failed to resolve OpenAlex IDs for %d DOIs: %s", len(batch), e)
+            continue
+        found = {
+            (w.get("doi") or "").replace("https://doi.org/", "").lower(): w.get("id")
+            for w in results
+        }
+        # DOIs OpenAlex does not know are cached as negative entries
+        batch_ids = {doi: found.get(doi) for doi in batch}
+        await enrichment_cache.set_many("openalex_id", batch_ids)
+        resolved.update(batch_ids)
+    return resolved
+
+
 async def _fetch_works_batch(work_ids: list[str]) -> list[CitationPaper]:
     """Fetch minimal data for a batch of OpenAlex work IDs.
 
-    Uses the OpenAlex filter API to batch up to 50 IDs in a single request.
+    Cached works are served from the enrichment cache; the rest are fetched
+    with the OpenAlex filter API, up to 50 IDs per request.
     """
-    if not work_ids:
-        return []
-
-    bare_ids = []
-    for wid in work_ids:
-        bid = wid.split("/")[-1] if "/" in wid else wid
-        if OPENALEX_ID_PATTERN.match(bid):
-            bare_ids.append(bid)
+    bare_ids = [bid for wid in work_ids if (bid := _bare_work_id(wid))]
     if not bare_ids:
         return []
 
-    filter_value = "|".join(f"https://openalex.org/{wid}" for wid in bare_ids)
-    url = f"{settings.OPENALEX_BASE_URL}/works"
-    params = {
-        "filter": f"openalex:{filter_value}",
-        "select": "title,doi,publication_year,cited_by_count",
-        "per_page": len(bare_ids),
-        "mailto": settings.OPENALEX_EMAIL,
-    }
-
-    try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            results = data.get("results", [])
-            return [_work_to_citation_paper(w) for w in results]
-    except Exception as e:
-        logger.warning("Failed to fetch reference works batch: %s", e)
-        return []
+    works = await enrichment_cache.get_many("works", bare_ids)
+    missing = list(dict.fromkeys(wid for wid in bare_ids if wid not in works))
+    for start in range(0, len(missing), OPENALEX_BATCH_SIZE):
+        batch = missing[start : start + OPENALEX_BATCH_SIZE]
+        filter_value = "|".join(f"https://openalex.org/{wid}" for wid in batch)
+        params = {
+            "filter": f"openalex:{filter_value}",
+            "select": WORK_SELECT,
+            "per_page": len(batch),
+            "mailto": settings.OPENALEX_EMAIL,
+        }
+        try:
+            async with HTTPClientManager.get_client(
+                settings.OPENALEX_BASE_URL, timeout=REQUEST_TIMEOUT
+            ) as client:
+                response = await client.get(f"{settings.OPENALEX_BASE_URL}/works", params=params)
+                response.raise_for_status()
+                results = response.json().get("results", [])
+        except Exception as e:
+            logger.warning("Failed to fetch reference works batch: %s", e)
+            continue
+        fetched: dict[str, dict | None] = dict.fromkeys(batch)
+        for work in results:
+            work_id = _bare_work_id(work.get("id") or "")
+            if work_id:
+                fetched[work_id] = asdict(_work_to_citation_paper(work))
+        await enrichment_cache.set_many("works", fetched)
+        works.update(fetched)
+
+    return [CitationPaper(**works[wid]) for wid in bare_ids if works.get(wid)]
 
 
 async def _fetch_citing_papers(
@@ -168,30 +279,43 @@ async def _fetch_citing_papers(
     limit: int = MAX_CITING_PAPERS,
 ) -> tuple[list[CitationPaper], int]:
     """Fetch papers that cite the given work, sorted by citation count."""
+    cache_key = f"{openalex_id.rstrip('/').rsplit('/', 1)[-1]}:{limit}"
+    hit, cached = await enrichment_cache.get("citing", cache_key)
+    if hit and cached is not None:
+        return [CitationPaper(**p) for p in cached["papers"]], cached["total"]
+
     if not openalex_id.startswith("https://"):
         openalex_id = f"https://openalex.org/{openalex_id}"
 
     url = f"{settings.OPENALEX_BASE_URL}/works"
     params = {
         "filter": f"cites:{openalex_id}",
-        "select": "title,doi,publication_year,cited_by_count",
+        "select": WORK_SELECT,
         "sort": "cited_by_count:desc",
         "per_page": limit,
         "mailto": settings.OPENALEX_EMAIL,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        async with HTTPClientManager.get_client(url, timeout=REQUEST_TIMEOUT) as client:
             response = await client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             total = (data.get("meta") or {}).get("count", 0)
             results = data.get("results", [])
-            return [_work_to_citation_paper(w) for w in results], total
     except Exception as e:
         logger.warning("Failed to fetch citing papers for %s: %s", openalex_id, e)
         return [], 0
 
+    papers = [_work_to_citation_paper(w) for w in results]
+    await enrichment_cache.set(
+        "citing",
+        cache_key,
+        {"papers": [asdict(p) for p in papers], "total": total},
+        negative=not papers,
+    )
+    return papers, total
+
 
 def _work_to_citation_paper(work: dict) -> CitationPaper:
     """Convert an OpenAlex work dict to CitationPaper."""
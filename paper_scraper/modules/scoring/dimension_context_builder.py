@@ -3,14 +3,25 @@
 Replaces the monolithic DefaultScoreContextAssembler with per-dimension
 context strings, each tailored to the dimension's scoring criteria and
 truncated within a token budget.
+
+The external sources (citation graph, JSTOR, author profiles) are fetched
+concurrently with each other and with the database sources, each under its
+own timeout; a source that fails or times out contributes an empty result.
+Per-source latency is reported in DimensionContexts.metadata["_source_timings"]
+and stored with the score metadata as "source_timings".
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from typing import TypeVar
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from paper_scraper.core.config import settings
 from paper_scraper.modules.knowledge.models import KnowledgeType
 from paper_scraper.modules.knowledge.service import KnowledgeService
 from paper_scraper.modules.papers.context_service import PaperContextService
@@ -38,6 +49,8 @@ from paper_scraper.modules.scoring.token_budget import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 DIMENSION_KNOWLEDGE_MAP: dict[str, list[KnowledgeType]] = {
     "novelty": [KnowledgeType.RESEARCH_FOCUS, KnowledgeType.DOMAIN_EXPERTISE],
     "ip_potential": [KnowledgeType.EVALUATION_CRITERIA, KnowledgeType.INDUSTRY_CONTEXT],
@@ -110,14 +123,43 @@ class DimensionContextBuilder:
         target_dims = dimensions or list(DIMENSION_BUDGETS.keys())
         result = DimensionContexts()
 
-        # Fetch shared data sources once
-        snapshot_data = await self._get_snapshot_data(paper.id, organization_id)
-        knowledge_sources = await self._get_knowledge_sources(
-            organization_id, user_id, paper.keywords or []
+        # Fetch shared data sources once, concurrently
+        timings: dict[str, dict] = {}
+        (
+            (snapshot_data, knowledge_sources),
+            citation_graph,
+            jstor_result,
+            author_profile_result,
+        ) = await asyncio.gather(
+            self._get_database_sources(paper, organization_id, user_id, timings),
+            self._timed(
+                "citation_graph",
+                self._get_citation_graph(paper),
+                settings.SCORING_CONTEXT_CITATION_TIMEOUT_SECONDS,
+                lambda: CitationGraph(errors=["timeout"]),
+                timings,
+            ),
+            self._timed(
+                "jstor",
+                self._get_jstor_references(paper),
+                settings.SCORING_CONTEXT_JSTOR_TIMEOUT_SECONDS,
+                lambda: JstorSearchResult(errors=["timeout"]),
+                timings,
+            ),
+            self._timed(
+                "author_profiles",
+                self._get_author_profiles(paper),
+                settings.SCORING_CONTEXT_AUTHOR_PROFILES_TIMEOUT_SECONDS,
+                lambda: AuthorProfileResult(errors=["timeout"]),
+                timings,
+            ),
+        )
+        result.metadata["_source_timings"] = timings
+        logger.debug(
+            "Context sources for paper %s: %s",
+            paper.id,
+            ", ".join(f"{name}={t['latency_ms']:.0f}ms" for name, t in timings.items()),
         )
-        citation_graph = await self._get_citation_graph(paper)
-        jstor_result = await self._get_jstor_references(paper)
-        author_profile_result = await self._get_author_profiles(paper)
 
         if knowledge_sources:
             result.has_knowledge_context = True
@@ -388,6 +430,58 @@ class DimensionContextBuilder:
 
         return truncate_to_tokens(formatted, budget_tokens) if formatted else ""
 
+    async def _get_database_sources(
+        self,
+        paper: Paper,
+        organization_id: UUID,
+        user_id: UUID | None,
+        timings: dict[str, dict],
+    ) -> tuple[dict, list]:
+        """Snapshot and knowledge sources, one after the other on the session.
+
+        An AsyncSession cannot run queries concurrently, and cancelling a query
+        midway would leave the caller's session unusable, so these two run
+        without a timeout while the external sources are fetched alongside.
+        """
+        snapshot_data = await self._timed(
+            "snapshot",
+            self._get_snapshot_data(paper.id, organization_id),
+            None,
+            dict,
+            timings,
+        )
+        knowledge_sources = await self._timed(
+            "knowledge",
+            self._get_knowledge_sources(organization_id, user_id, paper.keywords or []),
+            None,
+            list,
+            timings,
+        )
+        return snapshot_data, knowledge_sources
+
+    @staticmethod
+    async def _timed(
+        source: str,
+        fetch: Awaitable[T],
+        timeout: float | None,
+        fallback: Callable[[], T],
+        timings: dict[str, dict],
+    ) -> T:
+        """Await a context source, recording its latency and falling back on timeout."""
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return await asyncio.wait_for(fetch, timeout)
+        except TimeoutError:
+            timed_out = True
+            logger.warning("Context source %s timed out after %.1fs", source, timeout)
+            return fallback()
+        finally:
+            timings[source] = {
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                "timed_out": timed_out,
+            }
+
     async def _get_snapshot_data(
         self,
         paper_id: UUID,
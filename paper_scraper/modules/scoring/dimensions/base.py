@@ -7,7 +7,7 @@ from uuid import UUID
 
 from paper_scraper.core.exceptions import ScoringError
 from paper_scraper.modules.scoring.llm_client import BaseLLMClient, get_llm_client
-from paper_scraper.modules.scoring.prompts import render_prompt
+from paper_scraper.modules.scoring.prompts import render_paper_context, render_prompt
 
 
 @dataclass
@@ -67,7 +67,13 @@ class BaseDimension(ABC):
     # Subclasses must define these
     dimension_name: str
     template_name: str
-    system_prompt: str = "You are an expert scientific analyst."
+    # Shared by all dimensions so the system prompt and paper context form a
+    # cacheable prefix; each dimension's role is set in its template
+    system_prompt: str = (
+        "You are an expert analyst assessing research papers for technology transfer "
+        "and commercialization potential. Each request gives the paper first, then "
+        "your role, the dimension to score and its rubric."
+    )
 
     def __init__(self, llm_client: BaseLLMClient | None = None):
         """
@@ -99,12 +105,13 @@ class BaseDimension(ABC):
             ScoringError: If scoring fails
         """
         try:
-            # Render the prompt template
+            # Render the shared paper context and the dimension-specific prompt;
+            # organization knowledge stands in for a missing dimension context
+            prefix = render_paper_context(paper, similar_papers)
             prompt = render_prompt(
                 self.template_name,
-                paper=paper,
-                similar_papers=similar_papers or [],
                 dimension_context=dimension_context,
+                knowledge_context=paper.knowledge_context,
             )
 
             # Get LLM response as JSON
@@ -112,6 +119,7 @@ class BaseDimension(ABC):
                 prompt=prompt,
                 system=self.system_prompt,
                 temperature=0.3,
+                prefix=prefix,
             )
 
             # Parse and validate response
@@ -15,11 +15,6 @@ class CommercializationDimension(BaseDimension):
 
     dimension_name = "commercialization"
     template_name = "commercialization.jinja2"
-    system_prompt = (
-        "You are an expert commercialization strategist with experience advising "
-        "technology transfer offices, startups, and corporate innovation teams. "
-        "You specialize in identifying optimal paths to market for research innovations."
-    )
 
     def _parse_response(self, response: dict[str, Any]) -> DimensionResult:
         """Parse commercialization-specific response fields."""
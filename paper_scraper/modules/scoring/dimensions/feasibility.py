@@ -15,11 +15,6 @@ class FeasibilityDimension(BaseDimension):
 
     dimension_name = "feasibility"
     template_name = "feasibility.jinja2"
-    system_prompt = (
-        "You are an expert technology assessment specialist with experience in "
-        "R&D management and product development. You specialize in evaluating "
-        "the technical readiness and feasibility of bringing research to market."
-    )
 
     def _parse_response(self, response: dict[str, Any]) -> DimensionResult:
         """Parse feasibility-specific response fields."""
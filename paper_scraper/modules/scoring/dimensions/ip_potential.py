@@ -16,11 +16,6 @@ class IPPotentialDimension(BaseDimension):
 
     dimension_name = "ip_potential"
     template_name = "ip_potential.jinja2"
-    system_prompt = (
-        "You are an expert intellectual property analyst with experience in patent "
-        "law and technology transfer. You specialize in assessing the patentability "
-        "of scientific innovations and identifying white space opportunities."
-    )
 
     def _parse_response(self, response: dict[str, Any]) -> DimensionResult:
         """Parse IP potential-specific response fields."""
@@ -15,11 +15,6 @@ class MarketabilityDimension(BaseDimension):
 
     dimension_name = "marketability"
     template_name = "marketability.jinja2"
-    system_prompt = (
-        "You are an expert market analyst with experience in technology markets "
-        "and venture capital. You specialize in identifying commercial potential "
-        "of emerging technologies and assessing market readiness."
-    )
 
     def _parse_response(self, response: dict[str, Any]) -> DimensionResult:
         """Parse marketability-specific response fields."""
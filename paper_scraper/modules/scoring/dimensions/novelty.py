@@ -16,11 +16,6 @@ class NoveltyDimension(BaseDimension):
 
     dimension_name = "novelty"
     template_name = "novelty.jinja2"
-    system_prompt = (
-        "You are an expert scientific reviewer with deep knowledge across multiple "
-        "research domains. You specialize in identifying truly novel research that "
-        "advances the state-of-the-art versus incremental improvements."
-    )
 
     def _parse_response(self, response: dict[str, Any]) -> DimensionResult:
         """Parse novelty-specific response fields."""
@@ -16,11 +16,6 @@ class TeamReadinessDimension(BaseDimension):
 
     dimension_name = "team_readiness"
     template_name = "team_readiness.jinja2"
-    system_prompt = (
-        "You are an expert in evaluating research teams for technology transfer "
-        "and commercialization readiness. You assess team composition, track records, "
-        "industry connections, and institutional support to determine commercialization potential."
-    )
 
     def _parse_response(self, response: dict[str, Any]) -> DimensionResult:
         """Parse team readiness-specific response fields."""
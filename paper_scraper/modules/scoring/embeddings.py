@@ -1,11 +1,126 @@
 """Embedding generation for papers and semantic search."""
 
+import asyncio
+import base64
+import hashlib
+import logging
+import time
+from array import array
+from collections import OrderedDict
 from typing import Any
 
 import httpx
 
 from paper_scraper.core.config import settings
 from paper_scraper.core.exceptions import ExternalAPIError
+from paper_scraper.core.http_clients import HTTPClientManager
+from paper_scraper.core.redis_base import RedisService
+from paper_scraper.modules.scoring.llm_client import retry_with_backoff
+from paper_scraper.modules.scoring.token_budget import get_encoding
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for cached query embeddings
+EMBEDDING_CACHE_PREFIX = "embedding:query:"
+
+
+class QueryEmbeddingCache(RedisService):
+    """Two-tier cache for query embeddings: in-process LRU + shared Redis.
+
+    Entries are keyed by (model, sha256 of the normalized text). Vectors are
+    stored in Redis as base64-encoded float32 arrays. Redis failures fail
+    open — the caller simply re-embeds.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        super().__init__()
+        self.max_entries = max_entries or settings.EMBEDDING_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or settings.EMBEDDING_CACHE_TTL_SECONDS
+        self._local: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """Build the cache key for a (model, text) pair.
+
+        Whitespace is collapsed so trivially different spacings of the same
+        query share one vector. Case is kept: embedding models are case
+        sensitive.
+        """
+        normalized = " ".join(text.split())
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{EMBEDDING_CACHE_PREFIX}{model}:{digest}"
+
+    async def get(self, model: str, text: str) -> list[float] | None:
+        """Look up a cached embedding, promoting Redis hits into the LRU."""
+        key = self.make_key(model, text)
+
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, vector = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                self.local_hits += 1
+                return vector
+            del self._local[key]
+
+        try:
+            redis = await self._get_redis()
+            encoded = await redis.get(key)
+        except Exception as e:
+            logger.warning("Embedding cache lookup failed: %s", e)
+            encoded = None
+
+        if encoded is None:
+            self.misses += 1
+            return None
+
+        vector = array("f", base64.b64decode(encoded)).tolist()
+        self._remember(key, vector)
+        self.redis_hits += 1
+        return vector
+
+    async def set(self, model: str, text: str, vector: list[float]) -> None:
+        """Store an embedding in both tiers."""
+        key = self.make_key(model, text)
+        self._remember(key, vector)
+
+        try:
+            redis = await self._get_redis()
+            encoded = base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+            await redis.setex(key, self.ttl_seconds, encoded)
+        except Exception as e:
+            logger.warning("Embedding cache write failed: %s", e)
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters for monitoring (served on /health/ready)."""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((lookups - self.misses) / lookups, 4) if lookups else 0.0,
+            "local_size": len(self._local),
+        }
+
+    def clear_local(self) -> None:
+        """Drop the in-process tier and reset counters."""
+        self._local.clear()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        self._local[key] = (time.monotonic() + self.ttl_seconds, vector)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
 
 
 class EmbeddingClient:
@@ -15,42 +130,146 @@ class EmbeddingClient:
         self,
         api_key: str | None = None,
         model: str | None = None,
+        cache: QueryEmbeddingCache | None = None,
+        dimensions: int | None = None,
+        max_concurrent_requests: int | None = None,
     ):
         self.api_key = api_key or settings.OPENAI_API_KEY.get_secret_value()
         self.model = model or settings.LLM_EMBEDDING_MODEL
+        self.dimensions = dimensions or settings.EMBEDDING_DIMENSIONS
+        # Bounds sub-batch fan-out and sizes the HTTP pool shared by all calls
+        self.max_concurrent_requests = (
+            max_concurrent_requests or settings.EMBEDDING_MAX_CONCURRENT_REQUESTS
+        )
         self.base_url = "https://api.openai.com/v1"
+        if cache is None and settings.EMBEDDING_CACHE_ENABLED:
+            cache = query_embedding_cache
+        self.cache = cache
+
+    @property
+    def supports_dimensions(self) -> bool:
+        """Whether the model accepts a shortened output size (text-embedding-3+)."""
+        return not self.model.startswith("text-embedding-ada")
+
+    @property
+    def model_key(self) -> str:
+        """Identifies the embedding space: vectors are only comparable within one.
+
+        Used as the model part of cache and embedding-store keys, so a
+        change of output dimension never serves vectors of the old size.
+        """
+        if not self.supports_dimensions:
+            return self.model
+        return f"{self.model}@{self.dimensions}"
 
     async def embed_text(self, text: str) -> list[float]:
         """
         Generate embedding vector for a single text.
 
+        Served from the query embedding cache when possible, so repeated
+        queries, paginated requests and saved-search alerts reuse vectors.
+        Paper texts go through embed_texts instead and stay out of the cache.
+
         Args:
             text: Text to embed
 
         Returns:
-            Embedding vector (1536 dimensions for text-embedding-3-small)
+            Embedding vector of ``self.dimensions`` floats
         """
+        if self.cache is not None:
+            cached = await self.cache.get(self.model_key, text)
+            if cached is not None:
+                return cached
+
         embeddings = await self.embed_texts([text])
+
+        if self.cache is not None:
+            await self.cache.set(self.model_key, text, embeddings[0])
         return embeddings[0]
 
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """
         Generate embedding vectors for multiple texts.
 
+        Inputs are truncated to the per-input token limit and split into
+        sub-batches that respect the provider's per-request token and input
+        limits. Sub-batches run concurrently (bounded by
+        max_concurrent_requests) over a shared pooled client, and
+        429/5xx responses are retried with backoff honoring Retry-After.
+
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in input order
         """
         if not texts:
             return []
 
-        # Truncate texts to max token limit (approximately)
-        # text-embedding-3-small has 8191 token limit
-        max_chars = 30000  # Rough estimate, safe limit
-        truncated_texts = [text[:max_chars] if len(text) > max_chars else text for text in texts]
+        # Tokenizing thousands of abstracts is CPU-bound; keep it off the loop
+        prepared, token_counts = await asyncio.to_thread(self._prepare_inputs, texts)
+        batches = self._plan_batches(token_counts)
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def run_batch(start: int, end: int) -> list[list[float]]:
+            async with semaphore:
+                return await self._request_embeddings(prepared[start:end])
 
+        results = await asyncio.gather(
+            *(run_batch(start, end) for start, end in batches),
+            return_exceptions=True,
+        )
+
+        embeddings: list[list[float]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            embeddings.extend(result)
+        return embeddings
+
+    def _prepare_inputs(self, texts: list[str]) -> tuple[list[str], list[int]]:
+        """Truncate each text to the per-input token limit and count tokens."""
+        max_tokens = settings.EMBEDDING_MAX_INPUT_TOKENS
+        prepared: list[str] = []
+        token_counts: list[int] = []
+        try:
+            enc = get_encoding()
+            for text in texts:
+                tokens = enc.encode(text, disallowed_special=())
+                if len(tokens) > max_tokens:
+                    tokens = tokens[:max_tokens]
+                    text = enc.decode(tokens)
+                prepared.append(text)
+                token_counts.append(len(tokens))
+        except Exception:
+            # Encoding unavailable: fall back to a ~4 chars/token estimate
+            max_chars = max_tokens * 4
+            prepared = [text[:max_chars] for text in texts]
+            token_counts = [len(text) // 4 + 1 for text in prepared]
+        return prepared, token_counts
+
+    @staticmethod
+    def _plan_batches(token_counts: list[int]) -> list[tuple[int, int]]:
+        """Split inputs into contiguous [start, end) ranges under request limits."""
+        max_inputs = settings.EMBEDDING_MAX_BATCH_INPUTS
+        max_tokens = settings.EMBEDDING_MAX_BATCH_TOKENS
+
+        batches: list[tuple[int, int]] = []
+        start = 0
+        batch_tokens = 0
+        for index, count in enumerate(token_counts):
+            batch_size = index - start
+            if batch_size and (batch_size >= max_inputs or batch_tokens + count > max_tokens):
+                batches.append((start, index))
+                start = index
+                batch_tokens = 0
+            batch_tokens += count
+        batches.append((start, len(token_counts)))
+        return batches
+
+    async def _request_embeddings(self, inputs: list[str]) -> list[list[float]]:
+        """Send one embeddings request, retrying transient failures."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -58,27 +277,38 @@ class EmbeddingClient:
 
         payload: dict[str, Any] = {
             "model": self.model,
-            "input": truncated_texts,
+            "input": inputs,
         }
+        if self.supports_dimensions:
+            payload["dimensions"] = self.dimensions
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/embeddings",
-                headers=headers,
-                json=payload,
-            )
+        url = f"{self.base_url}/embeddings"
+
+        async def make_request() -> dict[str, Any]:
+            async with HTTPClientManager.get_client(
+                url,
+                timeout=60.0,
+                max_connections=self.max_concurrent_requests,
+            ) as client:
+                response = await client.post(url, headers=headers, json=payload)
+                response.raise_for_status()
+                return response.json()
 
-            if response.status_code != 200:
-                raise ExternalAPIError(
-                    service="OpenAI Embeddings",
-                    message=response.text,
-                    status_code=response.status_code,
-                )
+        try:
+            data = await retry_with_backoff(
+                make_request,
+                max_retries=settings.EMBEDDING_MAX_RETRIES,
+            )
+        except httpx.HTTPStatusError as e:
+            raise ExternalAPIError(
+                service="OpenAI Embeddings",
+                message=e.response.text,
+                status_code=e.response.status_code,
+            ) from e
 
-            data = response.json()
-            # Sort by index to ensure correct order
-            sorted_data = sorted(data["data"], key=lambda x: x["index"])
-            return [item["embedding"] for item in sorted_data]
+        # Sort by index to ensure correct order
+        sorted_data = sorted(data["data"], key=lambda x: x["index"])
+        return [item["embedding"] for item in sorted_data]
 
 
 async def generate_paper_embedding(
@@ -97,7 +327,7 @@ async def generate_paper_embedding(
         keywords: Paper keywords (optional)
 
     Returns:
-        Embedding vector (1536 dimensions)
+        Embedding vector (EMBEDDING_DIMENSIONS floats)
     """
     parts = [f"Title: {title}"]
 
@@ -109,5 +339,10 @@ async def generate_paper_embedding(
 
     text = "\n\n".join(parts)
 
+    # Paper text, not a query: bypass the query embedding cache
     client = EmbeddingClient()
-    return await client.embed_text(text)
+    return (await client.embed_texts([text]))[0]
+
+
+# Singleton instance
+query_embedding_cache = QueryEmbeddingCache()
@@ -0,0 +1,112 @@
+"""Shared cache for external scoring enrichment lookups.
+
+The citation graph (OpenAlex), JSTOR (Crossref) and author profile
+(GitHub, ORCID) clients look up every key here before calling out, so
+rescoring a paper, or scoring the same DOI in another tenant, makes no
+outbound enrichment calls while the entries are fresh.
+
+Entries are JSON in Redis under ``enrichment:<source>:<key>``:
+
+- openalex_id: normalized DOI -> OpenAlex work ID
+- works:       OpenAlex work ID -> minimal work metadata
+- citing:      OpenAlex work ID -> top citing works and total count
+- jstor:       hash of the JSTOR query -> search results
+- orcid:       ORCID iD -> parsed ORCID record
+- github:      normalized author name -> matched GitHub profile
+
+Each source has its own TTL. A lookup that succeeded but found nothing is
+stored as a negative entry (JSON null) with the shorter negative TTL;
+failed requests are never cached. Redis failures fail open, so the
+caller simply calls the API.
+"""
+
+import json
+import logging
+from typing import Any
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.redis_base import RedisService
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for cached enrichment lookups
+ENRICHMENT_CACHE_PREFIX = "enrichment:"
+
+
+def _source_ttls() -> dict[str, int]:
+    return {
+        "openalex_id": settings.ENRICHMENT_CACHE_OPENALEX_TTL_SECONDS,
+        "works": settings.ENRICHMENT_CACHE_OPENALEX_TTL_SECONDS,
+        "citing": settings.ENRICHMENT_CACHE_CITING_TTL_SECONDS,
+        "jstor": settings.ENRICHMENT_CACHE_JSTOR_TTL_SECONDS,
+        "orcid": settings.ENRICHMENT_CACHE_PROFILE_TTL_SECONDS,
+        "github": settings.ENRICHMENT_CACHE_PROFILE_TTL_SECONDS,
+    }
+
+
+class EnrichmentCache(RedisService):
+    """Redis cache of enrichment lookups with per-source and negative TTLs."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(source: str, key: str) -> str:
+        return f"{ENRICHMENT_CACHE_PREFIX}{source}:{key}"
+
+    async def get(self, source: str, key: str) -> tuple[bool, Any]:
+        """Look up one entry.
+
+        Returns:
+            Tuple of (hit, value); value is None for a cached negative entry.
+        """
+        found = await self.get_many(source, [key])
+        return (key in found, found.get(key))
+
+    async def get_many(self, source: str, keys: list[str]) -> dict[str, Any]:
+        """Look up several entries with one MGET; absent keys are omitted."""
+        if not settings.ENRICHMENT_CACHE_ENABLED or not keys:
+            return {}
+        try:
+            redis = await self._get_redis()
+            raw = await redis.mget([self.make_key(source, k) for k in keys])
+        except Exception as e:
+            logger.warning("Enrichment cache lookup failed: %s", e)
+            raw = [None] * len(keys)
+
+        found = {key: json.loads(value) for key, value in zip(keys, raw, strict=True) if value}
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    async def set(self, source: str, key: str, value: Any, negative: bool = False) -> None:
+        """Store one entry; ``negative`` (or a None value) uses the negative TTL."""
+        await self.set_many(source, {key: value}, negative=negative)
+
+    async def set_many(self, source: str, values: dict[str, Any], negative: bool = False) -> None:
+        """Store several entries in one pipeline."""
+        if not settings.ENRICHMENT_CACHE_ENABLED or not values:
+            return
+        ttl = _source_ttls()[source]
+        try:
+            redis = await self._get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    is_negative = negative or value is None
+                    pipe.setex(
+                        self.make_key(source, key),
+                        settings.ENRICHMENT_CACHE_NEGATIVE_TTL_SECONDS if is_negative else ttl,
+                        json.dumps(value),
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Enrichment cache write failed: %s", e)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters for monitoring."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+enrichment_cache = EnrichmentCache()
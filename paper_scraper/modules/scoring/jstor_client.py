@@ -6,16 +6,20 @@ prefix ``10.2307``, which covers ~3.4M scholarly works.
 
 The results are used as additional context in the scoring pipeline to
 produce more nuanced assessments that account for the broader JSTOR
-scholarly library.
+scholarly library. Results are kept in the shared enrichment cache, keyed
+by a hash of the normalized query.
 """
 
+import hashlib
 import logging
 import re
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
 import httpx
 
 from paper_scraper.core.config import settings
+from paper_scraper.core.http_clients import HTTPClientManager
+from paper_scraper.modules.scoring.enrichment_cache import enrichment_cache
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +91,16 @@ async def search_jstor(
         return JstorSearchResult(query_used=query)
 
     clean_query = query.strip()[:500]
+    normalized = " ".join(clean_query.split()).casefold()
+    cache_key = f"{hashlib.sha256(normalized.encode('utf-8')).hexdigest()}:{max_results}"
+    hit, cached = await enrichment_cache.get("jstor", cache_key)
+    if hit and cached is not None:
+        return JstorSearchResult(
+            papers=[JstorPaper(**p) for p in cached["papers"]],
+            total_results=cached["total_results"],
+            query_used=clean_query,
+        )
+
     url = f"{settings.CROSSREF_BASE_URL}/prefixes/{JSTOR_DOI_PREFIX}/works"
     params = {
         "query": clean_query,
@@ -96,7 +110,7 @@ async def search_jstor(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        async with HTTPClientManager.get_client(url, timeout=REQUEST_TIMEOUT) as client:
             response = await client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
@@ -112,6 +126,12 @@ async def search_jstor(
     items = message.get("items", [])
 
     papers = [_crossref_item_to_jstor_paper(item) for item in items]
+    await enrichment_cache.set(
+        "jstor",
+        cache_key,
+        {"papers": [asdict(p) for p in papers], "total_results": total},
+        negative=not papers,
+    )
 
     return JstorSearchResult(
         papers=papers,
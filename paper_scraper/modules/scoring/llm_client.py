@@ -5,8 +5,9 @@ import json
 import logging
 import re
 from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
@@ -15,6 +16,7 @@ from langfuse.decorators import observe
 
 from paper_scraper.core.config import settings
 from paper_scraper.core.exceptions import ExternalAPIError
+from paper_scraper.core.http_clients import HTTPClientManager
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +36,27 @@ langfuse = Langfuse(
 # =============================================================================
 
 
+# Price of prompt tokens served from / written to a provider prompt cache,
+# relative to the model's input price (approximate across providers)
+CACHED_INPUT_PRICE_FACTOR = 0.1
+CACHE_WRITE_PRICE_FACTOR = 1.25
+
+
 @dataclass
 class TokenUsage:
-    """Token usage statistics from LLM response."""
+    """Token usage statistics from LLM response.
+
+    ``prompt_tokens`` counts all input tokens, including those read from
+    (``cached_prompt_tokens``) or written to (``cache_creation_tokens``) the
+    provider's prompt cache.
+    """
 
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
     model: str
+    cached_prompt_tokens: int = 0
+    cache_creation_tokens: int = 0
 
     @property
     def estimated_cost_usd(self) -> float:
@@ -64,8 +79,16 @@ class TokenUsage:
             "anthropic.claude-3-5-sonnet-20241022-v2:0": {"input": 3.00, "output": 15.00},
         }
         model_pricing = pricing.get(self.model, {"input": 1.0, "output": 3.0})
+        uncached_tokens = (
+            self.prompt_tokens - self.cached_prompt_tokens - self.cache_creation_tokens
+        )
+        input_tokens = (
+            uncached_tokens
+            + self.cached_prompt_tokens * CACHED_INPUT_PRICE_FACTOR
+            + self.cache_creation_tokens * CACHE_WRITE_PRICE_FACTOR
+        )
         return (
-            self.prompt_tokens * model_pricing["input"] / 1_000_000
+            input_tokens * model_pricing["input"] / 1_000_000
             + self.completion_tokens * model_pricing["output"] / 1_000_000
         )
 
@@ -95,6 +118,29 @@ BASE_RETRY_DELAY = 1.0
 MAX_RETRY_DELAY = 30.0
 
 
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Parse the server-requested retry delay from response headers, if any."""
+    retry_after_ms = response.headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = response.headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+        return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
 async def retry_with_backoff(
     func,
     max_retries: int = MAX_RETRIES,
@@ -137,6 +183,12 @@ async def retry_with_backoff(
                 jitter = delay * 0.1 * (0.5 - asyncio.get_event_loop().time() % 1)
                 actual_delay = delay + jitter
 
+                # Honor a server-requested delay (429/503 Retry-After)
+                if isinstance(e, httpx.HTTPStatusError):
+                    retry_after = _retry_after_seconds(e.response)
+                    if retry_after is not None:
+                        actual_delay = min(max(retry_after, actual_delay), max_delay)
+
                 logger.warning(
                     f"LLM request failed (attempt {attempt + 1}/{max_retries + 1}), "
                     f"retrying in {actual_delay:.2f}s: {type(e).__name__}: {e}"
@@ -201,42 +253,19 @@ def sanitize_text_for_prompt(text: str | None, max_length: int = 2000) -> str:
     return sanitized
 
 
-# =============================================================================
-# Shared HTTP Client Manager
-# =============================================================================
-
-
-class HTTPClientManager:
-    """Manages shared HTTP clients for connection pooling."""
-
-    _clients: dict[str, httpx.AsyncClient] = {}
-
-    @classmethod
-    @asynccontextmanager
-    async def get_client(cls, base_url: str, timeout: float = 120.0):
-        """
-        Get or create a shared HTTP client for the given base URL.
+def join_prompt_prefix(prefix: str | None, prompt: str) -> str:
+    """Place a shared prompt prefix ahead of the prompt in one user message.
 
-        Args:
-            base_url: Base URL for the API
-            timeout: Request timeout in seconds
+    Providers with automatic prefix caching (OpenAI, Azure OpenAI, Gemini,
+    Ollama's KV cache) reuse the prefix when consecutive requests start with
+    the same system prompt and prefix.
+    """
+    return f"{prefix}\n\n{prompt}" if prefix else prompt
 
-        Yields:
-            Shared AsyncClient instance
-        """
-        if base_url not in cls._clients:
-            cls._clients[base_url] = httpx.AsyncClient(
-                timeout=timeout,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            )
-        yield cls._clients[base_url]
 
-    @classmethod
-    async def close_all(cls):
-        """Close all HTTP clients."""
-        for client in cls._clients.values():
-            await client.aclose()
-        cls._clients.clear()
+def _openai_cached_tokens(usage: dict[str, Any]) -> int:
+    """Prompt tokens served from the OpenAI/Azure prompt cache."""
+    return (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
 
 
 # =============================================================================
@@ -255,6 +284,7 @@ class BaseLLMClient(ABC):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> str:
         """
         Generate a completion from the LLM.
@@ -265,6 +295,8 @@ class BaseLLMClient(ABC):
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
             json_mode: If True, request JSON output
+            prefix: Optional stable leading part of the prompt, shared across
+                calls and sent ahead of it so providers can cache it
 
         Returns:
             The LLM response text
@@ -279,6 +311,7 @@ class BaseLLMClient(ABC):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> LLMResponse:
         """
         Generate a completion with token usage tracking.
@@ -289,6 +322,8 @@ class BaseLLMClient(ABC):
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
             json_mode: If True, request JSON output
+            prefix: Optional stable leading part of the prompt, shared across
+                calls and sent ahead of it so providers can cache it
 
         Returns:
             LLMResponse with content and usage statistics
@@ -302,6 +337,7 @@ class BaseLLMClient(ABC):
         system: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prefix: str | None = None,
     ) -> dict[str, Any]:
         """
         Generate a JSON completion from the LLM.
@@ -311,6 +347,8 @@ class BaseLLMClient(ABC):
             system: Optional system prompt
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
+            prefix: Optional stable leading part of the prompt, shared across
+                calls and sent ahead of it so providers can cache it
 
         Returns:
             Parsed JSON response as dict
@@ -345,6 +383,7 @@ class OpenAIClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> str:
         """Generate completion using OpenAI API, tracked by Langfuse."""
         response = await self.complete_with_usage(
@@ -353,6 +392,7 @@ class OpenAIClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=json_mode,
+            prefix=prefix,
         )
         return response.content
 
@@ -363,12 +403,13 @@ class OpenAIClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> LLMResponse:
         """Generate completion with token usage tracking."""
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages.append({"role": "user", "content": join_prompt_prefix(prefix, prompt)})
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -415,10 +456,11 @@ class OpenAIClient(BaseLLMClient):
                 completion_tokens=data["usage"]["completion_tokens"],
                 total_tokens=data["usage"]["total_tokens"],
                 model=self.model,
+                cached_prompt_tokens=_openai_cached_tokens(data["usage"]),
             )
             logger.info(
-                f"OpenAI request completed: {usage.total_tokens} tokens, "
-                f"~${usage.estimated_cost_usd:.6f}"
+                f"OpenAI request completed: {usage.total_tokens} tokens "
+                f"({usage.cached_prompt_tokens} cached), ~${usage.estimated_cost_usd:.6f}"
             )
 
         return LLMResponse(content=content, usage=usage)
@@ -429,6 +471,7 @@ class OpenAIClient(BaseLLMClient):
         system: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prefix: str | None = None,
     ) -> dict[str, Any]:
         """Generate JSON completion using OpenAI API."""
         response = await self.complete(
@@ -437,6 +480,7 @@ class OpenAIClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=True,
+            prefix=prefix,
         )
 
         try:
@@ -476,6 +520,7 @@ class AnthropicClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> str:
         """Generate completion using Anthropic API, tracked by Langfuse."""
         response = await self.complete_with_usage(
@@ -484,6 +529,7 @@ class AnthropicClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=json_mode,
+            prefix=prefix,
         )
         return response.content
 
@@ -494,6 +540,7 @@ class AnthropicClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> LLMResponse:
         """Generate completion with token usage tracking."""
         headers = {
@@ -508,10 +555,19 @@ class AnthropicClient(BaseLLMClient):
                 system or ""
             ) + "\n\nYou MUST respond with valid JSON only. No other text."
 
+        content: str | list[dict[str, Any]] = prompt
+        if prefix:
+            # Cache breakpoint after the shared prefix: later calls with the same
+            # system prompt and prefix read it from the cache
+            prefix_block: dict[str, Any] = {"type": "text", "text": prefix}
+            if settings.LLM_PROMPT_CACHING:
+                prefix_block["cache_control"] = {"type": "ephemeral"}
+            content = [prefix_block, {"type": "text", "text": prompt}]
+
         payload: dict[str, Any] = {
             "model": self.model,
             "max_tokens": max_tokens or settings.LLM_MAX_TOKENS,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": [{"role": "user", "content": content}],
         }
 
         if actual_system:
@@ -541,15 +597,21 @@ class AnthropicClient(BaseLLMClient):
         content = data["content"][0]["text"]
         usage = None
         if "usage" in data:
+            # input_tokens excludes tokens read from or written to the cache
+            cache_read = data["usage"].get("cache_read_input_tokens") or 0
+            cache_write = data["usage"].get("cache_creation_input_tokens") or 0
+            prompt_tokens = data["usage"]["input_tokens"] + cache_read + cache_write
             usage = TokenUsage(
-                prompt_tokens=data["usage"]["input_tokens"],
+                prompt_tokens=prompt_tokens,
                 completion_tokens=data["usage"]["output_tokens"],
-                total_tokens=data["usage"]["input_tokens"] + data["usage"]["output_tokens"],
+                total_tokens=prompt_tokens + data["usage"]["output_tokens"],
                 model=self.model,
+                cached_prompt_tokens=cache_read,
+                cache_creation_tokens=cache_write,
             )
             logger.info(
-                f"Anthropic request completed: {usage.total_tokens} tokens, "
-                f"~${usage.estimated_cost_usd:.6f}"
+                f"Anthropic request completed: {usage.total_tokens} tokens "
+                f"({usage.cached_prompt_tokens} cached), ~${usage.estimated_cost_usd:.6f}"
             )
 
         return LLMResponse(content=content, usage=usage)
@@ -560,6 +622,7 @@ class AnthropicClient(BaseLLMClient):
         system: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prefix: str | None = None,
     ) -> dict[str, Any]:
         """Generate JSON completion using Anthropic API."""
         response = await self.complete(
@@ -568,6 +631,7 @@ class AnthropicClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=True,
+            prefix=prefix,
         )
 
         # Try to extract JSON from response
@@ -623,6 +687,7 @@ class AzureOpenAIClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> str:
         """Generate completion using Azure OpenAI API, tracked by Langfuse."""
         response = await self.complete_with_usage(
@@ -631,6 +696,7 @@ class AzureOpenAIClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=json_mode,
+            prefix=prefix,
         )
         return response.content
 
@@ -641,12 +707,13 @@ class AzureOpenAIClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> LLMResponse:
         """Generate completion with token usage tracking."""
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages.append({"role": "user", "content": join_prompt_prefix(prefix, prompt)})
 
         headers = {
             "api-key": self.api_key,
@@ -689,10 +756,11 @@ class AzureOpenAIClient(BaseLLMClient):
                 completion_tokens=data["usage"]["completion_tokens"],
                 total_tokens=data["usage"]["total_tokens"],
                 model=self.deployment,
+                cached_prompt_tokens=_openai_cached_tokens(data["usage"]),
             )
             logger.info(
-                f"Azure OpenAI request completed: {usage.total_tokens} tokens, "
-                f"~${usage.estimated_cost_usd:.6f}"
+                f"Azure OpenAI request completed: {usage.total_tokens} tokens "
+                f"({usage.cached_prompt_tokens} cached), ~${usage.estimated_cost_usd:.6f}"
             )
 
         return LLMResponse(content=content, usage=usage)
@@ -703,6 +771,7 @@ class AzureOpenAIClient(BaseLLMClient):
         system: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prefix: str | None = None,
     ) -> dict[str, Any]:
         """Generate JSON completion using Azure OpenAI API."""
         response = await self.complete(
@@ -711,6 +780,7 @@ class AzureOpenAIClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=True,
+            prefix=prefix,
         )
 
         try:
@@ -747,6 +817,7 @@ class OllamaClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> str:
         """Generate completion using Ollama API, tracked by Langfuse."""
         response = await self.complete_with_usage(
@@ -755,6 +826,7 @@ class OllamaClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=json_mode,
+            prefix=prefix,
         )
         return response.content
 
@@ -765,11 +837,12 @@ class OllamaClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> LLMResponse:
         """Generate completion with token usage tracking."""
         payload: dict[str, Any] = {
             "model": self.model,
-            "prompt": prompt,
+            "prompt": join_prompt_prefix(prefix, prompt),
             "stream": False,
         }
 
@@ -824,6 +897,7 @@ class OllamaClient(BaseLLMClient):
         system: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prefix: str | None = None,
     ) -> dict[str, Any]:
         """Generate JSON completion using Ollama API."""
         response = await self.complete(
@@ -832,6 +906,7 @@ class OllamaClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=True,
+            prefix=prefix,
         )
 
         try:
@@ -871,6 +946,7 @@ class GeminiClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> str:
         """Generate completion using Gemini API, tracked by Langfuse."""
         response = await self.complete_with_usage(
@@ -879,6 +955,7 @@ class GeminiClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=json_mode,
+            prefix=prefix,
         )
         return response.content
 
@@ -889,10 +966,11 @@ class GeminiClient(BaseLLMClient):
         temperature: float | None = None,
         max_tokens: int | None = None,
         json_mode: bool = False,
+        prefix: str | None = None,
     ) -> LLMResponse:
         """Generate completion with token usage tracking."""
         payload: dict[str, Any] = {
-            "contents": [{"parts": [{"text": prompt}]}],
+            "contents": [{"parts": [{"text": join_prompt_prefix(prefix, prompt)}]}],
             "generationConfig": {},
         }
 
@@ -954,10 +1032,11 @@ class GeminiClient(BaseLLMClient):
                 completion_tokens=completion_tokens,
                 total_tokens=prompt_tokens + completion_tokens,
                 model=self.model,
+                cached_prompt_tokens=usage_meta.get("cachedContentTokenCount", 0),
             )
             logger.info(
-                f"Gemini request completed: {usage.total_tokens} tokens, "
-                f"~${usage.estimated_cost_usd:.6f}"
+                f"Gemini request completed: {usage.total_tokens} tokens "
+                f"({usage.cached_prompt_tokens} cached), ~${usage.estimated_cost_usd:.6f}"
             )
 
         return LLMResponse(content=content, usage=usage)
@@ -968,6 +1047,7 @@ class GeminiClient(BaseLLMClient):
         system: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prefix: str | None = None,
     ) -> dict[str, Any]:
         """Generate JSON completion using Gemini API."""
         response = await self.complete(
@@ -976,6 +1056,7 @@ class GeminiClient(BaseLLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
             json_mode=True,
+            prefix=prefix,
         )
 
         # Clean up response if needed
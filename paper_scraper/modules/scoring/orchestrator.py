@@ -17,7 +17,8 @@ from paper_scraper.modules.scoring.dimensions import (
     TeamReadinessDimension,
 )
 from paper_scraper.modules.scoring.dimensions.base import PaperContext
-from paper_scraper.modules.scoring.llm_client import BaseLLMClient, TokenUsage
+from paper_scraper.modules.scoring.llm_client import BaseLLMClient, TokenUsage, get_llm_client
+from paper_scraper.modules.scoring.prompts import render_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -135,13 +136,38 @@ class AggregatedScore:
 # Default concurrency limit for LLM calls (across all scoring dimensions)
 DEFAULT_CONCURRENCY_LIMIT = 5
 
+# Scoring strategies: one LLM call per dimension, or one call for all of them
+STRATEGY_PER_DIMENSION = "per_dimension"
+STRATEGY_COMBINED = "combined"
+SCORING_STRATEGIES = (STRATEGY_PER_DIMENSION, STRATEGY_COMBINED)
+
+# Section headings for the combined prompt
+DIMENSION_TITLES = {
+    "novelty": "Novelty",
+    "ip_potential": "IP Potential",
+    "marketability": "Marketability",
+    "feasibility": "Feasibility",
+    "commercialization": "Commercialization",
+    "team_readiness": "Team Readiness",
+}
+
+COMBINED_SYSTEM_PROMPT = (
+    "You are a panel of expert analysts in scientific review, intellectual property, "
+    "market analysis, engineering, commercialization and venture investment. You "
+    "assess research papers for technology transfer potential, scoring each "
+    "dimension independently against its own rubric."
+)
+
 
 class ScoringOrchestrator:
     """
     Orchestrates multi-dimensional paper scoring.
 
     Runs all dimension scorers in parallel (with concurrency limits) and
-    aggregates results using configurable weights.
+    aggregates results using configurable weights. With the "combined"
+    strategy, all dimensions are scored by a single LLM call that sends the
+    paper once; dimensions missing from that response are scored
+    individually.
     """
 
     def __init__(
@@ -150,6 +176,7 @@ class ScoringOrchestrator:
         model_version: str = "v1.0.0",
         max_concurrent_llm_calls: int = DEFAULT_CONCURRENCY_LIMIT,
         llm_client: BaseLLMClient | None = None,
+        scoring_strategy: str = STRATEGY_PER_DIMENSION,
     ):
         """
         Initialize the orchestrator.
@@ -158,9 +185,15 @@ class ScoringOrchestrator:
             weights: Scoring weights for each dimension
             model_version: Version identifier for scoring model
             max_concurrent_llm_calls: Maximum concurrent LLM calls (default: 5)
+            llm_client: Optional LLM client (uses default if not provided)
+            scoring_strategy: "per_dimension" (one call per dimension) or
+                "combined" (one call for all dimensions)
         """
+        if scoring_strategy not in SCORING_STRATEGIES:
+            raise ValueError(f"Unknown scoring strategy: {scoring_strategy}")
         self.weights = weights or ScoringWeights()
         self.model_version = model_version
+        self.scoring_strategy = scoring_strategy
         self._semaphore = asyncio.Semaphore(max_concurrent_llm_calls)
         self._llm_client = llm_client
 
@@ -201,7 +234,14 @@ class ScoringOrchestrator:
 
         logger.info(f"Scoring paper {paper.id} on dimensions: {dims_to_score}")
 
-        # Score all dimensions in parallel with concurrency limiting
+        combined: dict[str, DimensionResult] = {}
+        if self.scoring_strategy == STRATEGY_COMBINED and dims_to_score:
+            combined = await self._score_combined(
+                paper, similar_papers, dims_to_score, dimension_contexts
+            )
+
+        # Score remaining dimensions in parallel with concurrency limiting
+        remaining = [name for name in dims_to_score if name not in combined]
         tasks = [
             self._score_dimension_with_semaphore(
                 name,
@@ -209,9 +249,12 @@ class ScoringOrchestrator:
                 similar_papers,
                 dimension_context=(dimension_contexts.get(name) if dimension_contexts else None),
             )
-            for name in dims_to_score
+            for name in remaining
         ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        scored = dict(
+            zip(remaining, await asyncio.gather(*tasks, return_exceptions=True), strict=True)
+        )
+        results = [combined[name] if name in combined else scored[name] for name in dims_to_score]
 
         # Process results
         dimension_results: dict[str, DimensionResult] = {}
@@ -257,6 +300,70 @@ class ScoringOrchestrator:
             usage=usage,
         )
 
+    async def _score_combined(
+        self,
+        paper: PaperContext,
+        similar_papers: list[PaperContext] | None,
+        dims_to_score: list[str],
+        dimension_contexts: dict[str, str] | None,
+    ) -> dict[str, DimensionResult]:
+        """
+        Score several dimensions with a single LLM call.
+
+        Args:
+            paper: Paper context to score
+            similar_papers: Optional list of similar papers for comparison
+            dims_to_score: Dimensions to request
+            dimension_contexts: Optional per-dimension context strings
+
+        Returns:
+            Results for the dimensions the response covered; empty if the call
+            failed, so the caller falls back to per-dimension scoring.
+        """
+        prompt = render_prompt(
+            "combined.jinja2",
+            paper=paper,
+            similar_papers=similar_papers or [],
+            dimensions=[
+                {
+                    "name": name,
+                    "title": DIMENSION_TITLES.get(name, name),
+                    "context": dimension_contexts.get(name) if dimension_contexts else None,
+                }
+                for name in dims_to_score
+            ],
+        )
+        llm_client = self._llm_client or get_llm_client()
+        try:
+            async with self._semaphore:
+                response = await llm_client.complete_json(
+                    prompt=prompt,
+                    system=COMBINED_SYSTEM_PROMPT,
+                    temperature=0.3,
+                )
+        except Exception as e:
+            logger.warning(
+                f"Combined scoring failed for paper {paper.id}, scoring per dimension: {e}"
+            )
+            return {}
+
+        results: dict[str, DimensionResult] = {}
+        for name in dims_to_score:
+            section = response.get(name) if isinstance(response, dict) else None
+            if not isinstance(section, dict):
+                continue
+            try:
+                results[name] = self.dimensions[name]._parse_response(section)
+            except Exception as e:
+                logger.warning(f"Combined response for {name} on paper {paper.id} invalid: {e}")
+
+        missing = [name for name in dims_to_score if name not in results]
+        if missing:
+            logger.warning(
+                f"Combined response for paper {paper.id} lacked {missing}, scoring them separately"
+            )
+        return results
+
     async def _score_dimension_with_semaphore(
         self,
         dimension_name: str,
@@ -333,6 +440,7 @@ class ScoringOrchestrator:
             model_version=self.model_version,
             max_concurrent_llm_calls=self._semaphore._value,  # type: ignore
             llm_client=self._llm_client,
+            scoring_strategy=self.scoring_strategy,
         )
 
 
@@ -30,6 +30,9 @@ MAX_SIMILAR_ABSTRACT_LENGTH = 300
 # Maximum number of similar papers to include
 MAX_SIMILAR_PAPERS = 5
 
+# Paper context shared by all per-dimension scoring prompts
+PAPER_CONTEXT_TEMPLATE = "paper_context.jinja2"
+
 
 # =============================================================================
 # Sanitized Paper Context for Prompts
@@ -95,6 +98,12 @@ def render_prompt(template_name: str, **kwargs) -> str:
     if "paper" in kwargs and kwargs["paper"] is not None:
         kwargs["paper"] = SanitizedPaperContext.from_paper_context(kwargs["paper"])
 
+    # Sanitize organization knowledge if passed on its own
+    if kwargs.get("knowledge_context"):
+        kwargs["knowledge_context"] = sanitize_text_for_prompt(
+            kwargs["knowledge_context"], max_length=3000
+        )
+
     # Sanitize similar papers if provided
     if "similar_papers" in kwargs and kwargs["similar_papers"]:
         sanitized_similar = []
@@ -108,3 +117,26 @@ def render_prompt(template_name: str, **kwargs) -> str:
 
     template = jinja_env.get_template(template_name)
     return template.render(**kwargs)
+
+
+def render_paper_context(paper, similar_papers: list | None = None) -> str:
+    """
+    Render the paper context that leads every per-dimension scoring prompt.
+
+    The output depends only on the paper, so it is identical across the
+    dimension calls for a paper and providers can serve it from their
+    prompt cache. Organization knowledge is left out: only dimensions
+    without their own context use it, so it goes in the dimension prompt.
+
+    Args:
+        paper: Paper context to render
+        similar_papers: Optional similar papers for comparison
+
+    Returns:
+        Rendered paper context
+    """
+    return render_prompt(
+        PAPER_CONTEXT_TEMPLATE,
+        paper=paper,
+        similar_papers=similar_papers or [],
+    ).rstrip()
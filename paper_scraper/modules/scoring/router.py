@@ -321,7 +321,7 @@ async def generate_embedding(
     return EmbeddingResponse(
         paper_id=paper_id,
         has_embedding=True,
-        embedding_dimensions=1536,
+        embedding_dimensions=settings.EMBEDDING_DIMENSIONS,
         message="Embedding generated" if generated else "Embedding already exists",
     )
 
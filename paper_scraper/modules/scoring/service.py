@@ -10,7 +10,9 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from paper_scraper.core.config import settings
 from paper_scraper.core.exceptions import NotFoundError
+from paper_scraper.core.index_generation import index_generation
 from paper_scraper.core.secrets import decrypt_secret
 from paper_scraper.core.vector import VectorService
 from paper_scraper.modules.embeddings.service import EmbeddingService
@@ -18,7 +20,7 @@ from paper_scraper.modules.model_settings.models import ModelConfiguration, Mode
 from paper_scraper.modules.papers.models import Paper, PaperAuthor
 from paper_scraper.modules.scoring.dimension_context_builder import DimensionContextBuilder
 from paper_scraper.modules.scoring.dimensions.base import PaperContext
-from paper_scraper.modules.scoring.llm_client import get_llm_client
+from paper_scraper.modules.scoring.llm_client import BaseLLMClient, get_llm_client
 from paper_scraper.modules.scoring.models import (
     GlobalScoreCache,
     PaperScore,
@@ -40,6 +42,8 @@ from paper_scraper.modules.scoring.schemas import (
 logger = logging.getLogger(__name__)
 
 GLOBAL_CACHE_TTL_DAYS = 90
+# Similar papers passed to the scorers as context
+SIMILAR_PAPERS_LIMIT = 5
 
 
 class ScoringService:
@@ -62,6 +66,7 @@ class ScoringService:
         force_rescore: bool = False,
         use_knowledge_context: bool = True,
         user_id: UUID | None = None,
+        similar_paper_ids: list[UUID] | None = None,
     ) -> PaperScore:
         """
         Score a paper across all dimensions.
@@ -74,6 +79,9 @@ class ScoringService:
             force_rescore: If True, rescore even if recent score exists
             use_knowledge_context: If True, inject org knowledge into prompts
             user_id: Optional user ID for personal knowledge context
+            similar_paper_ids: Prefetched similar papers (e.g. from
+                VectorService.search_similar_many); skips the per-paper
+                vector lookup when given
 
         Returns:
             PaperScore model with results
@@ -105,7 +113,9 @@ class ScoringService:
             await self.db.refresh(paper)
 
         # Find similar papers for context
-        similar_papers = await self._find_similar_papers(paper, organization_id)
+        similar_papers = await self._find_similar_papers(
+            paper, organization_id, similar_paper_ids=similar_paper_ids
+        )
 
         # Create paper context
         paper_context = PaperContext.from_paper(paper)
@@ -116,6 +126,7 @@ class ScoringService:
         dimension_contexts = None
         jstor_references: list[dict] = []
         author_profiles: list[dict] = []
+        source_timings: dict[str, dict] = {}
         if use_knowledge_context:
             builder = DimensionContextBuilder(self.db)
             dim_result = await builder.build_all(
@@ -128,6 +139,7 @@ class ScoringService:
             dimension_contexts = dim_result.contexts
             jstor_references = dim_result.metadata.get("_jstor_references", [])
             author_profiles = dim_result.metadata.get("_author_profiles", [])
+            source_timings = dim_result.metadata.get("_source_timings", {})
             if dim_result.has_knowledge_context:
                 # Sentinel: org-specific knowledge was used — skip global cache write
                 knowledge_context = "dimension_specific"
@@ -142,8 +154,15 @@ class ScoringService:
                 )
 
         # Resolve tenant-specific scoring policy (provider/model) if configured.
-        llm_client = await self._resolve_llm_client(organization_id, workflow="scoring")
-        orchestrator = ScoringOrchestrator(llm_client=llm_client)
+        llm_client, model_config = await self._resolve_llm_client(
+            organization_id, workflow="scoring"
+        )
+        # The strategy comes from the same configuration as the model that runs
+        strategy = model_config.scoring_strategy if model_config else None
+        orchestrator = ScoringOrchestrator(
+            llm_client=llm_client,
+            scoring_strategy=strategy or settings.SCORING_STRATEGY,
+        )
         if weights:
             scoring_weights = ScoringWeights(
                 novelty=weights.novelty,
@@ -180,6 +199,7 @@ class ScoringService:
             knowledge_context,
             jstor_references,
             author_profiles,
+            source_timings,
         )
 
         # Log usage if tracked
@@ -482,8 +502,15 @@ class ScoringService:
         await self.db.commit()
         return summary.papers_succeeded
 
-    async def _resolve_llm_client(self, organization_id: UUID, workflow: str | None = None):
-        """Resolve LLM client from workflow config, model config, or global defaults."""
+    async def _resolve_llm_client(
+        self, organization_id: UUID, workflow: str | None = None
+    ) -> tuple[BaseLLMClient, ModelConfiguration | None]:
+        """Resolve LLM client from workflow config, model config, or global defaults.
+
+        Returns:
+            Tuple of (client, the model configuration it was built from or
+            None for the global defaults).
+        """
         # 0) Workflow-specific model configuration
         if workflow:
             workflow_query = (
@@ -498,11 +525,12 @@ class ScoringService:
             if wf_config:
                 api_key = self._decrypt_model_key(wf_config.api_key_encrypted)
                 try:
-                    return get_llm_client(
+                    client = get_llm_client(
                         provider=wf_config.provider,
                         model=wf_config.model_name,
                         api_key=api_key,
                     )
+                    return client, wf_config
                 except Exception as exc:
                     logger.warning(
                         "Failed to resolve workflow LLM client for %s: %s", workflow, exc
@@ -519,16 +547,17 @@ class ScoringService:
         if config:
             api_key = self._decrypt_model_key(config.api_key_encrypted)
             try:
-                return get_llm_client(
+                client = get_llm_client(
                     provider=config.provider,
                     model=config.model_name,
                     api_key=api_key,
                 )
+                return client, config
             except Exception as exc:
                 logger.warning("Failed to resolve model configuration LLM client: %s", exc)
 
         # 2) fallback to global settings
-        return get_llm_client()
+        return get_llm_client(), None
 
     @staticmethod
     def _decrypt_model_key(encrypted_value: str | None) -> str | None:
@@ -567,28 +596,35 @@ class ScoringService:
         self,
         paper: Paper,
         organization_id: UUID,
-        limit: int = 5,
+        limit: int = SIMILAR_PAPERS_LIMIT,
+        similar_paper_ids: list[UUID] | None = None,
     ) -> list[Paper]:
-        """Find similar papers using pgvector cosine similarity."""
-        if not paper.has_embedding:
-            return []
+        """Find similar papers using pgvector cosine similarity.
 
-        vector_service = VectorService()
-        results = await vector_service.search_by_paper_id(
-            db=self.db,
-            paper_id=paper.id,
-            organization_id=organization_id,
-            limit=limit,
-        )
+        When ``similar_paper_ids`` were prefetched only the hydration query
+        runs.
+        """
+        if similar_paper_ids is None:
+            if not paper.has_embedding:
+                return []
+
+            vector_service = VectorService()
+            results = await vector_service.search_by_paper_id(
+                db=self.db,
+                paper_id=paper.id,
+                organization_id=organization_id,
+                limit=limit,
+                query_vector=list(paper.embedding) if paper.embedding is not None else None,
+            )
+            similar_paper_ids = [UUID(r["id"]) for r in results]
 
-        if not results:
+        if not similar_paper_ids:
             return []
 
         # Hydrate full Paper objects from PostgreSQL (with tenant isolation)
-        paper_ids = [UUID(r["id"]) for r in results]
         db_result = await self.db.execute(
             select(Paper).where(
-                Paper.id.in_(paper_ids),
+                Paper.id.in_(similar_paper_ids[:limit]),
                 Paper.organization_id == organization_id,
             )
         )
@@ -602,6 +638,7 @@ class ScoringService:
         knowledge_context: str = "",
         jstor_references: list[dict] | None = None,
         author_profiles: list[dict] | None = None,
+        source_timings: dict[str, dict] | None = None,
     ) -> PaperScore:
         """Save scoring result to database."""
         # Extract dimension details for storage
@@ -625,6 +662,8 @@ class ScoringService:
         if author_profiles:
             metadata["author_profiles"] = author_profiles
             metadata["author_profiles_count"] = len(author_profiles)
+        if source_timings:
+            metadata["source_timings"] = source_timings
         if metadata:
             dimension_details["_metadata"] = metadata
 
@@ -647,6 +686,8 @@ class ScoringService:
         self.db.add(score)
         await self.db.commit()
         await self.db.refresh(score)
+        # Score filters and summaries appear in search results
+        await index_generation.bump(organization_id)
         return score
 
     # =========================================================================
@@ -817,6 +858,8 @@ class ScoringService:
         self.db.add(score)
         await self.db.commit()
         await self.db.refresh(score)
+        # Score filters and summaries appear in search results
+        await index_generation.bump(organization_id)
         return score
 
     async def _log_usage(
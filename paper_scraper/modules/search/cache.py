@@ -0,0 +1,126 @@
+"""Redis-backed caches for the search module."""
+
+import hashlib
+import json
+import logging
+import secrets
+from typing import Any
+from uuid import UUID
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.index_generation import IndexGeneration, index_generation
+from paper_scraper.core.redis_base import RedisService
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for fused hybrid result lists
+HYBRID_RESULTS_PREFIX = "search:hybrid:"
+# Redis key prefix for whole search responses
+SEARCH_RESPONSE_PREFIX = "search:resp:"
+
+
+class HybridResultCache(RedisService):
+    """Short-lived store for fused hybrid rankings behind a search cursor.
+
+    The first page of a hybrid search runs both legs and fuses them; the
+    fused list (IDs plus per-item scores and highlights) is parked here so
+    following pages only hydrate their own slice. Keys are scoped by
+    organization. Redis failures fail open: no cursor is issued on save,
+    and a lost list reads as an expired cursor.
+    """
+
+    def __init__(self, ttl_seconds: int | None = None) -> None:
+        super().__init__()
+        self.ttl_seconds = ttl_seconds or settings.SEARCH_CURSOR_TTL_SECONDS
+
+    @staticmethod
+    def _key(organization_id: UUID, token: str) -> str:
+        return f"{HYBRID_RESULTS_PREFIX}{organization_id}:{token}"
+
+    async def save(self, organization_id: UUID, entries: list[dict[str, Any]]) -> str | None:
+        """Store a fused result list and return its token (None on failure)."""
+        token = secrets.token_urlsafe(12)
+        try:
+            redis = await self._get_redis()
+            await redis.setex(
+                self._key(organization_id, token),
+                self.ttl_seconds,
+                json.dumps(entries, separators=(",", ":")),
+            )
+        except Exception as e:
+            logger.warning("Failed to cache hybrid results: %s", e)
+            return None
+        return token
+
+    async def load(self, organization_id: UUID, token: str) -> list[dict[str, Any]] | None:
+        """Fetch a fused result list, or None if it expired or is missing."""
+        try:
+            redis = await self._get_redis()
+            data = await redis.get(self._key(organization_id, token))
+        except Exception as e:
+            logger.warning("Failed to read cached hybrid results: %s", e)
+            return None
+        return json.loads(data) if data else None
+
+
+class SearchResponseCache(RedisService):
+    """Cache of complete search responses, invalidated by index generation.
+
+    Keys combine the organization, its current index generation (plus the
+    global catalog generation for catalog searches) and a hash of the
+    canonical request. Any write that bumps the generation therefore
+    retires every cached response for that tenant at once; the TTL only
+    bounds memory. Redis failures fail open and the search runs uncached.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int | None = None,
+        generations: IndexGeneration | None = None,
+    ) -> None:
+        super().__init__()
+        self.ttl_seconds = ttl_seconds or settings.SEARCH_RESPONSE_CACHE_TTL_SECONDS
+        self.generations = generations or index_generation
+
+    @staticmethod
+    def request_hash(request: dict[str, Any]) -> str:
+        """Hash a JSON-serialisable request in canonical (sorted-key) form."""
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def key_for(
+        self,
+        organization_id: UUID,
+        request: dict[str, Any],
+        include_global: bool = False,
+    ) -> str | None:
+        """Build the cache key for a request, or None if Redis is unavailable."""
+        generation = await self.generations.current(organization_id, include_global)
+        if generation is None:
+            return None
+        return (
+            f"{SEARCH_RESPONSE_PREFIX}{organization_id}:{generation}:{self.request_hash(request)}"
+        )
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Fetch a cached response payload."""
+        try:
+            redis = await self._get_redis()
+            data = await redis.get(key)
+        except Exception as e:
+            logger.warning("Failed to read cached search response: %s", e)
+            return None
+        return json.loads(data) if data else None
+
+    async def set(self, key: str, response: dict[str, Any]) -> None:
+        """Store a response payload under a key from ``key_for``."""
+        try:
+            redis = await self._get_redis()
+            await redis.setex(key, self.ttl_seconds, json.dumps(response, separators=(",", ":")))
+        except Exception as e:
+            logger.warning("Failed to cache search response: %s", e)
+
+
+# Module-level singletons
+hybrid_result_cache = HybridResultCache()
+search_response_cache = SearchResponseCache()
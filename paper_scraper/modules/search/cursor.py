@@ -0,0 +1,58 @@
+"""Opaque keyset cursors for paginated search.
+
+A cursor is URL-safe base64 of a compact JSON payload. It is bound to the
+request that produced it through a fingerprint of the query, mode, scope,
+filters and weights, so it cannot be replayed against a different search.
+"""
+
+import base64
+import hashlib
+import json
+from typing import Any
+
+from paper_scraper.core.exceptions import ValidationError
+from paper_scraper.modules.search.schemas import SearchRequest, SearchScope
+
+
+def request_fingerprint(request: SearchRequest) -> str:
+    """Hash the parts of a request that determine its result ordering."""
+    scope = request.scope if hasattr(request, "scope") else SearchScope.LIBRARY
+    material = json.dumps(
+        {
+            "q": request.query,
+            "m": request.mode.value,
+            "s": scope.value,
+            "f": request.filters.model_dump(mode="json") if request.filters else None,
+            "w": request.semantic_weight,
+            "n": request.page_size,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """Serialize a cursor payload into an opaque token."""
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, request: SearchRequest) -> dict[str, Any]:
+    """Parse a cursor token and check it belongs to this request.
+
+    Raises:
+        ValidationError: If the cursor is malformed or was issued for a
+            different search.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid search cursor", field="cursor") from e
+
+    if not isinstance(payload, dict) or payload.get("fp") != request_fingerprint(request):
+        raise ValidationError(
+            "Search cursor does not match this query; restart from the first page",
+            field="cursor",
+        )
+    return payload
@@ -3,7 +3,18 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Uuid, func
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from paper_scraper.core.database import Base
@@ -42,3 +53,70 @@ class SearchActivity(Base):
 
     def __repr__(self) -> str:
         return f"<SearchActivity user={self.user_id} query='{self.query[:30]}'>"
+
+
+class PaperNeighbor(Base):
+    """Precomputed k-nearest-neighbour edge within an organization's library.
+
+    Each paper keeps its top ``PAPER_NEIGHBORS_K`` most similar library
+    papers, so "similar papers" becomes a primary-key range scan instead
+    of a live HNSW query. Maintained by the paper neighbour jobs.
+    """
+
+    __tablename__ = "paper_neighbors"
+
+    organization_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    paper_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("papers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    neighbor_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("papers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    similarity: Mapped[float] = mapped_column(Float, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (Index("ix_paper_neighbors_org_neighbor", "organization_id", "neighbor_id"),)
+
+    def __repr__(self) -> str:
+        return f"<PaperNeighbor {self.paper_id} -> {self.neighbor_id} ({self.similarity:.3f})>"
+
+
+class SearchOutboxEntry(Base):
+    """Pending change to a paper's search document (transactional outbox).
+
+    Rows are written in the same transaction as the paper change and
+    drained into Typesense by the search indexer job, so an index write can
+    neither block the request nor be lost when Typesense is down. No
+    foreign key on paper_id: delete entries outlive their paper.
+    """
+
+    __tablename__ = "search_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    paper_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    # Owning tenant, kept for deletes whose paper row is already gone
+    organization_id: Mapped[UUID | None] = mapped_column(Uuid, nullable=True)
+    operation: Mapped[str] = mapped_column(String(10), nullable=False, default="upsert")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (Index("ix_search_outbox_available", "available_at", "id"),)
+
+    def __repr__(self) -> str:
+        return f"<SearchOutboxEntry {self.operation} {self.paper_id} attempts={self.attempts}>"
@@ -117,6 +117,9 @@ async def semantic_search(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     scope: SearchScope = Query(default=SearchScope.LIBRARY, description="Search scope"),
+    cursor: str | None = Query(
+        default=None, max_length=512, description="next_cursor from the previous page"
+    ),
 ) -> SearchResponse:
     """
     Perform semantic search using vector embeddings.
@@ -124,6 +127,7 @@ async def semantic_search(
     The query is embedded and compared to paper embeddings using
     cosine similarity. Only papers with embeddings are returned.
     Use scope='catalog' to search the global paper catalog.
+    Pass the response's next_cursor to fetch the following page.
     """
     request = SearchRequest(
         query=q,
@@ -131,6 +135,7 @@ async def semantic_search(
         scope=scope,
         page=page,
         page_size=page_size,
+        cursor=cursor,
     )
     return await search_service.search(
         request=request,
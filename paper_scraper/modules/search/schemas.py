@@ -65,6 +65,12 @@ class SearchRequest(BaseModel):
     filters: SearchFilters | None = Field(default=None, description="Optional search filters")
     page: int = Field(default=1, ge=1, le=100, description="Page number")
     page_size: int = Field(default=20, ge=1, le=100, description="Results per page")
+    cursor: str | None = Field(
+        default=None,
+        max_length=512,
+        description="Opaque next_cursor from a previous semantic/hybrid response; "
+        "takes precedence over page",
+    )
     include_highlights: bool = Field(
         default=True, description="Include text highlights for fulltext search"
     )
@@ -161,6 +167,15 @@ class SearchResponse(BaseModel):
     query: str
     mode: SearchMode
     search_time_ms: float = Field(default=0.0, description="Search execution time in ms")
+    degraded: bool = Field(
+        default=False,
+        description="True when a hybrid search backend failed or timed out and results "
+        "come from the remaining backend only",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (semantic/hybrid); null when no more results",
+    )
 
 
 class SimilarPaperItem(BaseModel):
@@ -4,22 +4,26 @@ Uses pgvector (PostgreSQL HNSW) for semantic search and Typesense for
 full-text search. PostgreSQL is used for paper hydration and score lookups.
 """
 
+import asyncio
 import logging
 import time
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, exists, func, select
+from sqlalchemy import and_, exists, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
-from paper_scraper.core.exceptions import NotFoundError
+from paper_scraper.core.config import settings
+from paper_scraper.core.exceptions import NotFoundError, ValidationError
 from paper_scraper.core.search_engine import SearchEngineService
 from paper_scraper.core.vector import VectorService
 from paper_scraper.modules.embeddings.service import EmbeddingService
 from paper_scraper.modules.papers.models import Paper
 from paper_scraper.modules.scoring.embeddings import EmbeddingClient
 from paper_scraper.modules.scoring.models import PaperScore
+from paper_scraper.modules.search.cache import hybrid_result_cache, search_response_cache
+from paper_scraper.modules.search.cursor import decode_cursor, encode_cursor, request_fingerprint
 from paper_scraper.modules.search.models import SearchActivity
 from paper_scraper.modules.search.schemas import (
     EmbeddingBackfillResult,
@@ -85,6 +89,54 @@ class SearchService:
         start_time = time.time()
         scope = request.scope if hasattr(request, "scope") else SearchScope.LIBRARY
 
+        cache_key = None
+        response = None
+        if settings.SEARCH_RESPONSE_CACHE_ENABLED:
+            cache_key = await search_response_cache.key_for(
+                organization_id,
+                request.model_dump(mode="json"),
+                include_global=scope != SearchScope.LIBRARY,
+            )
+            cached = await search_response_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                response = SearchResponse.model_validate(cached)
+
+        if response is None:
+            response = await self._execute_search(request, organization_id, scope)
+            # Degraded responses are missing a backend; let the next request retry it
+            if cache_key and not response.degraded:
+                await search_response_cache.set(cache_key, response.model_dump(mode="json"))
+
+        search_time_ms = (time.time() - start_time) * 1000
+        response.search_time_ms = round(search_time_ms, 2)
+
+        # Log search activity for gamification tracking
+        if user_id is not None:
+            activity = SearchActivity(
+                user_id=user_id,
+                organization_id=organization_id,
+                query=request.query[:1000],
+                mode=request.mode.value,
+                results_count=response.total,
+                search_time_ms=response.search_time_ms,
+            )
+            self.db.add(activity)
+            await self.db.flush()
+
+        return response
+
+    async def _execute_search(
+        self,
+        request: SearchRequest,
+        organization_id: UUID,
+        scope: SearchScope,
+    ) -> SearchResponse:
+        """Run a search against the backends (the uncached path of ``search``)."""
+        degraded = False
+        cursor = decode_cursor(request.cursor, request) if request.cursor else None
+        page = cursor["p"] if cursor else request.page
+        next_state: dict[str, Any] | None = None
+
         if request.mode == SearchMode.FULLTEXT:
             results, total = await self._fulltext_search(
                 query=request.query,
@@ -96,50 +148,44 @@ class SearchService:
                 scope=scope,
             )
         elif request.mode == SearchMode.SEMANTIC:
-            results, total = await self._semantic_search(
+            results, total, next_state = await self._semantic_search(
                 query=request.query,
                 organization_id=organization_id,
                 filters=request.filters,
-                page=request.page,
+                page=page,
                 page_size=request.page_size,
                 scope=scope,
+                cursor=cursor,
             )
         else:  # HYBRID
-            results, total = await self._hybrid_search(
+            results, total, degraded, next_state = await self._hybrid_search(
                 query=request.query,
                 organization_id=organization_id,
                 filters=request.filters,
-                page=request.page,
+                page=page,
                 page_size=request.page_size,
                 semantic_weight=request.semantic_weight,
                 include_highlights=request.include_highlights,
                 scope=scope,
+                cursor=cursor,
             )
 
-        search_time_ms = (time.time() - start_time) * 1000
-
-        # Log search activity for gamification tracking
-        if user_id is not None:
-            activity = SearchActivity(
-                user_id=user_id,
-                organization_id=organization_id,
-                query=request.query[:1000],
-                mode=request.mode.value,
-                results_count=total,
-                search_time_ms=round(search_time_ms, 2),
+        next_cursor = None
+        if next_state is not None:
+            next_cursor = encode_cursor(
+                {"fp": request_fingerprint(request), "p": page + 1, **next_state}
             )
-            self.db.add(activity)
-            await self.db.flush()
 
         return SearchResponse(
             items=results,
             total=total,
-            page=request.page,
+            page=page,
             page_size=request.page_size,
             pages=(total + request.page_size - 1) // request.page_size if total > 0 else 0,
             query=request.query,
             mode=request.mode,
-            search_time_ms=round(search_time_ms, 2),
+            degraded=degraded,
+            next_cursor=next_cursor,
         )
 
     async def find_similar_papers(
@@ -162,27 +208,34 @@ class SearchService:
         Returns:
             SimilarPapersResponse with similar papers.
         """
-        # Verify the paper exists in PostgreSQL
-        paper = await self._get_paper(paper_id, organization_id)
-        if not paper:
+        # Verify the paper exists; its embedding feeds the live kNN fallback
+        ref = await self.db.execute(
+            select(Paper.id, Paper.embedding).where(
+                Paper.id == paper_id,
+                Paper.organization_id == organization_id,
+            )
+        )
+        ref_row = ref.one_or_none()
+        if ref_row is None:
             raise NotFoundError("Paper", paper_id)
 
-        # Check if the paper has an embedding
-        has_vec = await self.vector.has_vector(db=self.db, paper_id=paper_id)
-        if not has_vec:
+        if ref_row.embedding is None:
             return SimilarPapersResponse(
                 paper_id=paper_id,
                 similar_papers=[],
                 total_found=0,
             )
 
-        # Search for similar papers via pgvector
+        # Served from the precomputed neighbour graph when possible,
+        # otherwise a live pgvector query excluding the paper itself
         vector_results = await self.vector.search_by_paper_id(
             db=self.db,
             paper_id=paper_id,
             organization_id=organization_id,
             limit=limit,
             min_score=min_similarity if min_similarity > 0 else None,
+            filters=filters,
+            query_vector=list(ref_row.embedding),
         )
 
         if not vector_results:
@@ -200,22 +253,13 @@ class SearchService:
             result_ids.append(rid)
             score_map[rid] = result["score"]
 
-        # Hydrate paper metadata from PostgreSQL
-        hydrated_papers = await self._hydrate_papers(result_ids, organization_id)
-
-        # Apply PostgreSQL-side filters (score filters that need joins)
-        if filters:
-            filtered_ids = await self._apply_pg_score_filter(
-                list(hydrated_papers.keys()), filters, organization_id
-            )
-            hydrated_papers = {pid: p for pid, p in hydrated_papers.items() if pid in filtered_ids}
+        # Hydrate paper metadata from PostgreSQL (filters already applied in pgvector)
+        hydrated = await self._hydrate_results(result_ids, organization_id)
 
         # Build similar paper items, preserving ranking order
         similar_papers: list[SimilarPaperItem] = []
-        for rid in result_ids:
-            if rid not in hydrated_papers:
-                continue
-            p = hydrated_papers[rid]
+        for p, _ in hydrated:
+            rid = p.id
             similar_papers.append(
                 SimilarPaperItem(
                     id=p.id,
@@ -256,7 +300,7 @@ class SearchService:
         """
         query_embedding = await self.embedding_client.embed_text(query)
 
-        results, _ = await self._semantic_search(
+        results, _, _ = await self._semantic_search(
             query=query,
             organization_id=organization_id,
             filters=filters,
@@ -334,11 +378,49 @@ class SearchService:
 
         Uses Typesense BM25 ranking with typo tolerance.
         """
+        ts_paper_ids, ts_meta, total = await self._typesense_query(
+            query=query,
+            organization_id=organization_id,
+            filters=filters,
+            page=page,
+            page_size=page_size,
+            scope=scope,
+        )
+        if not ts_paper_ids:
+            return [], total
+
+        items = await self._build_fulltext_items(
+            ts_paper_ids,
+            ts_meta,
+            organization_id=organization_id,
+            filters=filters,
+            include_highlights=include_highlights,
+            scope=scope,
+        )
+        return items, total
+
+    async def _typesense_query(
+        self,
+        query: str,
+        organization_id: UUID,
+        filters: SearchFilters | None,
+        page: int,
+        page_size: int,
+        scope: SearchScope = SearchScope.LIBRARY,
+    ) -> tuple[list[UUID], dict[UUID, dict[str, Any]], int]:
+        """Run the Typesense query and extract ranked IDs plus hit metadata.
+
+        Does not touch PostgreSQL, so it can run concurrently with the
+        pgvector leg of a hybrid search.
+
+        Returns:
+            Tuple of (ranked paper IDs, per-paper metadata, total found).
+        """
         # Build Typesense filter string from SearchFilters
         ts_filter = self._build_typesense_filter(filters, organization_id)
 
         # Execute Typesense search
-        ts_result = self.search_engine.search_papers(
+        ts_result = await self.search_engine.search_papers(
             query=query,
             organization_id=organization_id,
             page=page,
@@ -350,9 +432,6 @@ class SearchService:
         total: int = ts_result.get("found", 0)
         hits: list[dict[str, Any]] = ts_result.get("hits", [])
 
-        if not hits:
-            return [], total
-
         # Extract paper IDs and Typesense metadata (scores, highlights)
         ts_paper_ids: list[UUID] = []
         ts_meta: dict[UUID, dict[str, Any]] = {}
@@ -372,26 +451,30 @@ class SearchService:
                 "has_embedding": doc.get("has_embedding", False),
             }
 
-        # Hydrate paper metadata from PostgreSQL
-        hydrated_papers = await self._hydrate_papers(ts_paper_ids, organization_id, scope=scope)
-
-        # Apply PostgreSQL-side score filters
-        if filters and self._needs_pg_score_filter(filters):
-            filtered_ids = await self._apply_pg_score_filter(
-                list(hydrated_papers.keys()), filters, organization_id
-            )
-            hydrated_papers = {pid: p for pid, p in hydrated_papers.items() if pid in filtered_ids}
+        return ts_paper_ids, ts_meta, total
 
-        # Fetch scores for matched papers (scores are always org-scoped)
-        scores_map = await self._get_latest_scores(list(hydrated_papers.keys()), organization_id)
+    async def _build_fulltext_items(
+        self,
+        ts_paper_ids: list[UUID],
+        ts_meta: dict[UUID, dict[str, Any]],
+        organization_id: UUID,
+        filters: SearchFilters | None,
+        include_highlights: bool = True,
+        scope: SearchScope = SearchScope.LIBRARY,
+    ) -> list[SearchResultItem]:
+        """Hydrate Typesense hits from PostgreSQL into result items."""
+        # Papers, latest scores and the score-existence filter in one query
+        hydrated = await self._hydrate_results(
+            ts_paper_ids,
+            organization_id,
+            scope=scope,
+            filters=filters if filters and self._needs_pg_score_filter(filters) else None,
+        )
 
         # Build result items preserving Typesense ranking order
         items: list[SearchResultItem] = []
-        for pid in ts_paper_ids:
-            if pid not in hydrated_papers:
-                continue
-            paper = hydrated_papers[pid]
-            meta = ts_meta.get(pid, {})
+        for paper, score in hydrated:
+            meta = ts_meta.get(paper.id, {})
             text_score = meta.get("text_score", 0)
 
             # Normalize Typesense text_match score to 0-1 range
@@ -419,11 +502,11 @@ class SearchService:
                     text_score=round(normalized_score, 4),
                     semantic_score=None,
                     highlights=highlights,
-                    score=scores_map.get(paper.id),
+                    score=score,
                 )
             )
 
-        return items, total
+        return items
 
     async def _semantic_search(
         self,
@@ -434,64 +517,117 @@ class SearchService:
         page_size: int,
         query_embedding: list[float] | None = None,
         scope: SearchScope = SearchScope.LIBRARY,
-    ) -> tuple[list[SearchResultItem], int]:
+        cursor: dict[str, Any] | None = None,
+    ) -> tuple[list[SearchResultItem], int, dict[str, Any] | None]:
         """Perform semantic search using pgvector HNSW embeddings.
 
-        Uses pgvector cosine similarity for ranking.
+        Uses pgvector cosine similarity for ranking. With a cursor the page
+        is a keyset query after the previous page's last (distance, id), so
+        it fetches only page_size + 1 rows however deep it is. Without one,
+        ``page`` is honoured by fetching and slicing (legacy behaviour).
+
+        Returns:
+            Tuple of (items, total, next cursor state). ``total`` counts the
+            results up to and including this page; more exist when the
+            cursor state is not None.
         """
         # Generate query embedding if not provided
         if query_embedding is None:
             query_embedding = await self.embedding_client.embed_text(query)
 
-        # pgvector supports ORDER BY + LIMIT natively, so fetch page*page_size
-        fetch_limit = min(page * page_size, 10_000)
+        if cursor is not None:
+            start = 0
+            seen = cursor["n"]
+            vector_results = await self._vector_query(
+                query_embedding,
+                organization_id,
+                limit=page_size + 1,
+                filters=filters,
+                scope=scope,
+                after=(cursor["d"], UUID(cursor["id"])),
+            )
+        else:
+            # pgvector supports ORDER BY + LIMIT natively; one extra row
+            # tells us whether another page exists
+            start = (page - 1) * page_size
+            seen = start
+            vector_results = await self._vector_query(
+                query_embedding,
+                organization_id,
+                limit=min(page * page_size + 1, 10_000),
+                filters=filters,
+                scope=scope,
+            )
+
+        paginated_results = vector_results[start : start + page_size]
+        total = seen + len(paginated_results)
+
+        next_state = None
+        if len(vector_results) > start + page_size:
+            last = paginated_results[-1]
+            next_state = {"d": last["distance"], "id": last["id"], "n": total}
+
+        if not paginated_results:
+            return [], total, None
 
+        items = await self._build_semantic_items(
+            paginated_results,
+            organization_id=organization_id,
+            scope=scope,
+        )
+        return items, total, next_state
+
+    async def _vector_query(
+        self,
+        query_embedding: list[float],
+        organization_id: UUID,
+        limit: int,
+        filters: SearchFilters | None = None,
+        scope: SearchScope = SearchScope.LIBRARY,
+        after: tuple[float, UUID] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run the pgvector nearest-neighbour query for a query embedding.
+
+        Filters are evaluated inside the kNN query, so every returned row
+        already satisfies them.
+        """
         # Execute pgvector search — pass None org_id for catalog scope
         vector_org_id = organization_id if scope == SearchScope.LIBRARY else None
-        vector_results = await self.vector.search_similar(
+        return await self.vector.search_similar(
             db=self.db,
             query_vector=query_embedding,
             organization_id=vector_org_id,
-            limit=fetch_limit,
+            limit=limit,
+            filters=filters,
+            score_organization_id=organization_id,
+            after=after,
         )
 
-        total = len(vector_results)
-
-        # Apply pagination by slicing
-        start = (page - 1) * page_size
-        paginated_results = vector_results[start : start + page_size]
-
-        if not paginated_results:
-            return [], total
+    async def _build_semantic_items(
+        self,
+        vector_results: list[dict[str, Any]],
+        organization_id: UUID,
+        scope: SearchScope = SearchScope.LIBRARY,
+    ) -> list[SearchResultItem]:
+        """Hydrate pgvector hits from PostgreSQL into result items.
 
+        Search filters were already applied by the pgvector query.
+        """
         # Build ID -> score map
         result_ids: list[UUID] = []
         score_map: dict[UUID, float] = {}
-        for result in paginated_results:
+        for result in vector_results:
             rid = UUID(result["id"])
             result_ids.append(rid)
             score_map[rid] = result["score"]
 
-        # Hydrate paper metadata from PostgreSQL
-        hydrated_papers = await self._hydrate_papers(result_ids, organization_id, scope=scope)
-
-        # Apply PostgreSQL-side score filters
-        if filters and self._needs_pg_score_filter(filters):
-            filtered_ids = await self._apply_pg_score_filter(
-                list(hydrated_papers.keys()), filters, organization_id
-            )
-            hydrated_papers = {pid: p for pid, p in hydrated_papers.items() if pid in filtered_ids}
-
-        # Fetch scores (scores are always org-scoped)
-        scores_map = await self._get_latest_scores(list(hydrated_papers.keys()), organization_id)
+        # Papers and latest scores in one query
+        hydrated = await self._hydrate_results(result_ids, organization_id, scope=scope)
 
         # Build results preserving ranking order
         items: list[SearchResultItem] = []
-        for rid in result_ids:
-            if rid not in hydrated_papers:
-                continue
-            paper = hydrated_papers[rid]
-            similarity = score_map.get(rid, 0.0)
+        for paper, score in hydrated:
+            similarity = score_map.get(paper.id, 0.0)
 
             items.append(
                 SearchResultItem(
@@ -510,11 +646,11 @@ class SearchService:
                     text_score=None,
                     semantic_score=round(similarity, 4),
                     highlights=[],
-                    score=scores_map.get(paper.id),
+                    score=score,
                 )
             )
 
-        return items, total
+        return items
 
     async def _hybrid_search(
         self,
@@ -526,48 +662,82 @@ class SearchService:
         semantic_weight: float = 0.5,
         include_highlights: bool = True,
         scope: SearchScope = SearchScope.LIBRARY,
-    ) -> tuple[list[SearchResultItem], int]:
+        cursor: dict[str, Any] | None = None,
+    ) -> tuple[list[SearchResultItem], int, bool, dict[str, Any] | None]:
         """Perform hybrid search combining Typesense and pgvector results.
 
+        The Typesense query and the query embedding run concurrently; the
+        pgvector leg starts as soon as the embedding arrives. Each leg has
+        its own timeout — if one backend is slow or down, the other leg's
+        results are returned and the response is flagged as degraded.
+
         Uses Reciprocal Rank Fusion (RRF) to combine rankings:
         RRF_score = text_weight/(k + rank_text) + semantic_weight/(k + rank_semantic)
+
+        Both legs return only IDs with their rank, raw score and highlights;
+        fusion runs on those and only the requested page is hydrated from
+        PostgreSQL. When more pages remain, the fused ranking is cached in
+        Redis behind the returned cursor state so cursor pages skip both legs.
+
+        Returns:
+            Tuple of (items, total, degraded, next cursor state).
         """
-        # Generate query embedding
-        query_embedding = await self.embedding_client.embed_text(query)
+        if cursor is not None:
+            return await self._hybrid_cursor_page(cursor, organization_id, page_size, scope)
 
         # Fetch more results than needed for RRF merging
         fetch_limit = page_size * 5
 
-        # Get full-text results from Typesense
-        text_results, text_total = await self._fulltext_search(
-            query=query,
-            organization_id=organization_id,
-            filters=filters,
-            page=1,
-            page_size=fetch_limit,
-            include_highlights=include_highlights,
-            scope=scope,
+        text_leg, semantic_leg = await asyncio.gather(
+            asyncio.wait_for(
+                self._typesense_query(
+                    query=query,
+                    organization_id=organization_id,
+                    filters=filters,
+                    page=1,
+                    page_size=fetch_limit,
+                    scope=scope,
+                ),
+                timeout=settings.SEARCH_FULLTEXT_TIMEOUT_SECONDS,
+            ),
+            self._semantic_leg(
+                query, organization_id, limit=fetch_limit, filters=filters, scope=scope
+            ),
+            return_exceptions=True,
         )
 
-        # Get semantic results from pgvector
-        semantic_results, semantic_total = await self._semantic_search(
-            query=query,
-            organization_id=organization_id,
-            filters=filters,
-            page=1,
-            page_size=fetch_limit,
-            query_embedding=query_embedding,
-            scope=scope,
-        )
+        text_failed = isinstance(text_leg, BaseException)
+        semantic_failed = isinstance(semantic_leg, BaseException)
+        if text_failed and semantic_failed:
+            raise text_leg
+        if text_failed:
+            logger.warning("Hybrid search full-text leg failed, degrading: %r", text_leg)
+        if semantic_failed:
+            logger.warning("Hybrid search semantic leg failed, degrading: %r", semantic_leg)
+
+        # Fuse on lightweight (id, rank, score, highlight) tuples; only the
+        # final page is hydrated from PostgreSQL.
+        text_ids: list[UUID] = []
+        ts_meta: dict[UUID, dict[str, Any]] = {}
+        if not text_failed:
+            text_ids, ts_meta, _ = text_leg
+            if text_ids and filters and self._needs_pg_score_filter(filters):
+                # Typesense cannot see score existence; filter the IDs only
+                allowed = await self._apply_pg_score_filter(text_ids, filters, organization_id)
+                text_ids = [pid for pid in text_ids if pid in allowed]
+
+        semantic_scores: dict[UUID, float] = {}
+        if not semantic_failed:
+            semantic_scores = {UUID(hit["id"]): hit["score"] for hit in semantic_leg}
 
         # Create rank mappings
-        text_ranks: dict[UUID, int] = {item.id: rank + 1 for rank, item in enumerate(text_results)}
+        text_ranks: dict[UUID, int] = {pid: rank + 1 for rank, pid in enumerate(text_ids)}
         semantic_ranks: dict[UUID, int] = {
-            item.id: rank + 1 for rank, item in enumerate(semantic_results)
+            pid: rank + 1 for rank, pid in enumerate(semantic_scores)
         }
 
-        # Combine all unique paper IDs
-        all_paper_ids = set(text_ranks.keys()) | set(semantic_ranks.keys())
+        # Combine all unique paper IDs (ordered, so RRF ties are stable)
+        all_paper_ids = dict.fromkeys([*text_ranks, *semantic_ranks])
 
         # Calculate RRF scores
         rrf_scores: dict[UUID, float] = {}
@@ -584,34 +754,148 @@ class SearchService:
             rrf_scores[paper_id] = text_rrf + semantic_rrf
 
         # Sort by RRF score
-        sorted_ids = sorted(rrf_scores.keys(), key=lambda x: rrf_scores[x], reverse=True)
-
-        # Build result items from text or semantic results
-        text_items_map = {item.id: item for item in text_results}
-        semantic_items_map = {item.id: item for item in semantic_results}
+        sorted_ids = sorted(rrf_scores, key=rrf_scores.__getitem__, reverse=True)
+        entries = [
+            self._fused_entry(
+                pid,
+                rrf_scores[pid],
+                ts_meta.get(pid, {}) if pid in text_ranks else None,
+                semantic_scores.get(pid),
+                include_highlights=include_highlights,
+            )
+            for pid in sorted_ids
+        ]
 
-        # Paginate
-        total = len(sorted_ids)
+        # Paginate, then hydrate just this page
+        total = len(entries)
         start = (page - 1) * page_size
         end = start + page_size
-        paginated_ids = sorted_ids[start:end]
+        items = await self._hydrate_fused_entries(entries[start:end], organization_id, scope)
+
+        degraded = text_failed or semantic_failed
+        next_state = None
+        if total > end:
+            token = await hybrid_result_cache.save(organization_id, entries)
+            if token is not None:
+                next_state = {"t": token, "o": end, "dg": degraded}
+
+        return items, total, degraded, next_state
+
+    async def _hybrid_cursor_page(
+        self,
+        cursor: dict[str, Any],
+        organization_id: UUID,
+        page_size: int,
+        scope: SearchScope,
+    ) -> tuple[list[SearchResultItem], int, bool, dict[str, Any] | None]:
+        """Serve a hybrid page from the fused ranking cached by page one."""
+        entries = await hybrid_result_cache.load(organization_id, cursor["t"])
+        if entries is None:
+            raise ValidationError(
+                "Search cursor has expired; restart from the first page", field="cursor"
+            )
+
+        start = cursor["o"]
+        end = start + page_size
+        items = await self._hydrate_fused_entries(entries[start:end], organization_id, scope)
+
+        next_state = None
+        if len(entries) > end:
+            next_state = {"t": cursor["t"], "o": end, "dg": cursor["dg"]}
+        return items, len(entries), cursor["dg"], next_state
+
+    def _fused_entry(
+        self,
+        paper_id: UUID,
+        rrf_score: float,
+        text_meta: dict[str, Any] | None,
+        semantic_score: float | None,
+        include_highlights: bool = True,
+    ) -> dict[str, Any]:
+        """Compact, JSON-serializable record of one fused hybrid hit.
+
+        Args:
+            paper_id: Paper ID.
+            rrf_score: Fused RRF score.
+            text_meta: Typesense hit metadata, or None if absent from the text leg.
+            semantic_score: Cosine similarity, or None if absent from the semantic leg.
+            include_highlights: Whether to keep Typesense highlights.
+        """
+        text_score = None
+        highlights: list[dict[str, Any]] = []
+        if text_meta is not None:
+            text_score = round(self._normalize_typesense_score(text_meta.get("text_score", 0)), 4)
+            if include_highlights:
+                highlights = [
+                    hl.model_dump()
+                    for hl in self._extract_typesense_highlights(text_meta.get("highlights", []))
+                ]
+
+        return {
+            "id": str(paper_id),
+            "r": round(rrf_score, 4),
+            "t": text_score,
+            "s": round(semantic_score, 4) if semantic_score is not None else None,
+            "e": semantic_score is not None or bool(text_meta and text_meta.get("has_embedding")),
+            "h": highlights,
+        }
+
+    async def _hydrate_fused_entries(
+        self,
+        entries: list[dict[str, Any]],
+        organization_id: UUID,
+        scope: SearchScope = SearchScope.LIBRARY,
+    ) -> list[SearchResultItem]:
+        """Hydrate fused hybrid hits from PostgreSQL, preserving their order."""
+        entries_by_id = {UUID(entry["id"]): entry for entry in entries}
+        hydrated = await self._hydrate_results(list(entries_by_id), organization_id, scope=scope)
 
         items: list[SearchResultItem] = []
-        for paper_id in paginated_ids:
-            # Prefer text result (has highlights), fall back to semantic
-            if paper_id in text_items_map:
-                item = text_items_map[paper_id]
-                # Add semantic score if available
-                if paper_id in semantic_items_map:
-                    item.semantic_score = semantic_items_map[paper_id].semantic_score
-            else:
-                item = semantic_items_map[paper_id]
+        for paper, score in hydrated:
+            entry = entries_by_id[paper.id]
+            items.append(
+                SearchResultItem(
+                    id=paper.id,
+                    title=paper.title,
+                    abstract=paper.abstract,
+                    doi=paper.doi,
+                    source=paper.source,
+                    journal=paper.journal,
+                    publication_date=paper.publication_date,
+                    keywords=paper.keywords or [],
+                    citations_count=paper.citations_count,
+                    has_embedding=entry["e"],
+                    created_at=paper.created_at,
+                    relevance_score=entry["r"],
+                    text_score=entry["t"],
+                    semantic_score=entry["s"],
+                    highlights=[SearchHighlight(**hl) for hl in entry["h"]],
+                    score=score,
+                )
+            )
+        return items
 
-            # Update relevance score to RRF score
-            item.relevance_score = round(rrf_scores[paper_id], 4)
-            items.append(item)
+    async def _semantic_leg(
+        self,
+        query: str,
+        organization_id: UUID,
+        limit: int,
+        filters: SearchFilters | None = None,
+        scope: SearchScope = SearchScope.LIBRARY,
+    ) -> list[dict[str, Any]]:
+        """Embed the query, then run the pgvector query as soon as it arrives.
 
-        return items, total
+        The timeout bounds the external embedding call only; cancelling an
+        in-flight statement would leave the shared session unusable for the
+        hydration queries that follow.
+        """
+        query_embedding = await asyncio.wait_for(
+            self.embedding_client.embed_text(query),
+            timeout=settings.SEARCH_EMBEDDING_TIMEOUT_SECONDS,
+        )
+        return await self._vector_query(
+            query_embedding, organization_id, limit=limit, filters=filters, scope=scope
+        )
 
     # =========================================================================
     # Typesense Filter Builder
@@ -963,85 +1247,89 @@ class SearchService:
     # Paper Hydration from PostgreSQL
     # =========================================================================
 
-    async def _hydrate_papers(
+    async def _hydrate_results(
         self,
         paper_ids: list[UUID],
         organization_id: UUID,
         scope: SearchScope = SearchScope.LIBRARY,
-    ) -> dict[UUID, Paper]:
-        """Load paper metadata from PostgreSQL for a list of IDs.
+        filters: SearchFilters | None = None,
+    ) -> list[tuple[Paper, ScoreSummary | None]]:
+        """Load papers and their latest org-scoped score in one round trip.
+
+        The latest PaperScore comes from a lateral join, and the has_score
+        filter is evaluated against it in the same statement, replacing
+        separate hydration, score-filter and score-lookup queries.
 
         Args:
-            paper_ids: Paper IDs to hydrate.
-            organization_id: Tenant isolation (used when scope='library').
+            paper_ids: Paper IDs in rank order.
+            organization_id: Tenant isolation (used when scope='library')
+                and the owner of the scores.
             scope: Search scope — 'library' filters by org, 'catalog' by is_global.
+            filters: Optional filters; only has_score is evaluated here.
 
         Returns:
-            Dict mapping paper ID to Paper ORM object.
+            (paper, latest score) pairs in the order of ``paper_ids``, for
+            the papers that exist in scope and pass the filter.
         """
         if not paper_ids:
-            return {}
+            return []
 
-        query = select(Paper).where(Paper.id.in_(paper_ids))
+        latest_score = (
+            select(PaperScore)
+            .where(
+                PaperScore.paper_id == Paper.id,
+                PaperScore.organization_id == organization_id,
+            )
+            .order_by(PaperScore.created_at.desc())
+            .limit(1)
+            .lateral("latest_score")
+        )
+        score_alias = aliased(PaperScore, latest_score)
+
+        query = (
+            select(Paper, score_alias)
+            .outerjoin(latest_score, true())
+            .where(Paper.id.in_(paper_ids))
+        )
 
         if scope == SearchScope.CATALOG:
             query = query.where(Paper.is_global.is_(True))
         else:
             query = query.where(Paper.organization_id == organization_id)
 
+        if filters is not None and filters.has_score is not None:
+            # The latest score exists exactly when any org score exists
+            if filters.has_score:
+                query = query.where(score_alias.id.isnot(None))
+            else:
+                query = query.where(score_alias.id.is_(None))
+
         result = await self.db.execute(query)
-        papers = result.scalars().all()
-        return {p.id: p for p in papers}
+        rows = {paper.id: (paper, score) for paper, score in result.all()}
 
-    # =========================================================================
-    # Helper Methods
-    # =========================================================================
+        return [
+            (rows[pid][0], self._score_summary(rows[pid][1]))
+            for pid in dict.fromkeys(paper_ids)
+            if pid in rows
+        ]
 
-    async def _get_latest_scores(
-        self,
-        paper_ids: list[UUID],
-        organization_id: UUID,
-    ) -> dict[UUID, ScoreSummary]:
-        """Fetch latest scores for a list of papers."""
-        if not paper_ids:
-            return {}
-
-        # Subquery to get latest score per paper
-        latest_subquery = (
-            select(
-                PaperScore.paper_id,
-                func.max(PaperScore.created_at).label("latest"),
-            )
-            .where(
-                PaperScore.paper_id.in_(paper_ids),
-                PaperScore.organization_id == organization_id,
-            )
-            .group_by(PaperScore.paper_id)
-            .subquery()
-        )
-
-        query = select(PaperScore).join(
-            latest_subquery,
-            and_(
-                PaperScore.paper_id == latest_subquery.c.paper_id,
-                PaperScore.created_at == latest_subquery.c.latest,
-            ),
+    @staticmethod
+    def _score_summary(score: PaperScore | None) -> ScoreSummary | None:
+        """Convert a PaperScore row into the brief search summary."""
+        if score is None:
+            return None
+        return ScoreSummary(
+            overall_score=score.overall_score,
+            novelty=score.novelty,
+            ip_potential=score.ip_potential,
+            marketability=score.marketability,
+            feasibility=score.feasibility,
+            commercialization=score.commercialization,
         )
 
-        result = await self.db.execute(query)
-        scores = result.scalars().all()
-
-        return {
-            score.paper_id: ScoreSummary(
-                overall_score=score.overall_score,
-                novelty=score.novelty,
-                ip_potential=score.ip_potential,
-                marketability=score.marketability,
-                feasibility=score.feasibility,
-                commercialization=score.commercialization,
-            )
-            for score in scores
-        }
+    # =========================================================================
+    # Helper Methods
+    # =========================================================================
 
     async def _get_paper(
         self,
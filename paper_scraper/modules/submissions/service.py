@@ -20,6 +20,7 @@ from paper_scraper.core.exceptions import (
     NotFoundError,
     ValidationError,
 )
+from paper_scraper.core.search_outbox import enqueue_paper_sync
 from paper_scraper.modules.papers.models import Paper, PaperSource
 from paper_scraper.modules.submissions.models import (
     AttachmentType,
@@ -590,6 +591,7 @@ class SubmissionService:
         # Update submission
         submission.converted_paper_id = paper.id
         submission.status = SubmissionStatus.CONVERTED
+        await enqueue_paper_sync(self.db, [paper.id])
 
         await self.db.flush()
         return paper
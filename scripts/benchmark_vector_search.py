@@ -0,0 +1,139 @@
+"""Benchmark pgvector kNN recall and latency across embedding storage modes.
+
+Samples embedded catalog papers as queries, computes exact top-k
+neighbours with index scans disabled, then runs VectorService.search_similar
+in each PGVECTOR_STORAGE_MODE and reports recall@k and latency percentiles.
+
+Run against a database that has the quantized_embeddings migration applied:
+
+    python -m scripts.benchmark_vector_search --queries 200 --k 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import text
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.database import get_db_session
+from paper_scraper.core.vector import QUANTIZED_STORAGE_MODES, VectorService
+
+MODES = ("full", *QUANTIZED_STORAGE_MODES)
+
+
+@dataclass
+class ModeResult:
+    mode: str
+    recall: float
+    p50_ms: float
+    p95_ms: float
+
+
+async def _sample_queries(count: int, sample_percent: float) -> list[tuple[UUID, list[float]]]:
+    async with get_db_session() as db:
+        rows = await db.execute(
+            text(
+                f"""
+                SELECT id, embedding::text AS embedding
+                FROM papers TABLESAMPLE SYSTEM ({float(sample_percent)})
+                WHERE is_global = true AND embedding IS NOT NULL
+                ORDER BY random()
+                LIMIT :count
+                """
+            ),
+            {"count": count},
+        )
+        return [(row.id, [float(x) for x in row.embedding.strip("[]").split(",")]) for row in rows]
+
+
+async def _exact_neighbors(query_vector: list[float], k: int) -> set[str]:
+    """Ground truth: the same query with index scans disabled."""
+    async with get_db_session() as db:
+        await db.execute(text("SET LOCAL enable_indexscan = off"))
+        results = await VectorService().search_similar(db, query_vector, limit=k)
+    return {r["id"] for r in results}
+
+
+async def _run_mode(
+    mode: str,
+    queries: list[tuple[UUID, list[float]]],
+    truth: list[set[str]],
+    k: int,
+) -> ModeResult:
+    settings.PGVECTOR_STORAGE_MODE = mode
+    latencies: list[float] = []
+    recalls: list[float] = []
+    for (_, vector), expected in zip(queries, truth, strict=True):
+        async with get_db_session() as db:
+            start = time.perf_counter()
+            results = await VectorService().search_similar(db, vector, limit=k)
+            latencies.append((time.perf_counter() - start) * 1000)
+        if expected:
+            recalls.append(len(expected & {r["id"] for r in results}) / len(expected))
+
+    latencies.sort()
+    return ModeResult(
+        mode=mode,
+        recall=statistics.fmean(recalls) if recalls else 0.0,
+        p50_ms=statistics.median(latencies),
+        p95_ms=latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    )
+
+
+async def _benchmark(args: argparse.Namespace) -> list[ModeResult]:
+    queries = await _sample_queries(args.queries, args.sample_percent)
+    if not queries:
+        raise SystemExit("No embedded catalog papers found to sample")
+
+    original_mode = settings.PGVECTOR_STORAGE_MODE
+    original_candidates = settings.PGVECTOR_RERANK_CANDIDATES
+    settings.PGVECTOR_RERANK_CANDIDATES = args.rerank_candidates
+    try:
+        settings.PGVECTOR_STORAGE_MODE = "full"
+        truth = [await _exact_neighbors(vector, args.k) for _, vector in queries]
+
+        warmup = min(10, len(queries))
+        results = []
+        for mode in args.modes:
+            # Warm-up pass so the first mode does not pay for cold caches
+            await _run_mode(mode, queries[:warmup], truth[:warmup], args.k)
+            results.append(await _run_mode(mode, queries, truth, args.k))
+    finally:
+        settings.PGVECTOR_STORAGE_MODE = original_mode
+        settings.PGVECTOR_RERANK_CANDIDATES = original_candidates
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare pgvector storage modes")
+    parser.add_argument("--queries", type=int, default=100, help="Query papers to sample")
+    parser.add_argument("--k", type=int, default=20, help="Neighbours per query")
+    parser.add_argument(
+        "--rerank-candidates",
+        type=int,
+        default=settings.PGVECTOR_RERANK_CANDIDATES,
+        help="Shortlist size re-ranked in quantized modes",
+    )
+    parser.add_argument(
+        "--sample-percent",
+        type=float,
+        default=1.0,
+        help="TABLESAMPLE percentage used to pick query papers",
+    )
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    results = asyncio.run(_benchmark(args))
+    print(f"{'mode':<8} {'recall@' + str(args.k):>10} {'p50 ms':>9} {'p95 ms':>9}")
+    for r in results:
+        print(f"{r.mode:<8} {r.recall:>10.3f} {r.p50_ms:>9.1f} {r.p95_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
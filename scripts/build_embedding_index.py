@@ -0,0 +1,83 @@
+"""Build the HNSW index a pgvector storage mode searches.
+
+Migrations only build the quantized index for the PGVECTOR_STORAGE_MODE
+configured when they run. Before switching modes, build the matching
+index (CONCURRENTLY, so papers stays writable), then change the setting:
+
+    python -m scripts.build_embedding_index --mode halfvec
+    python -m scripts.build_embedding_index --mode halfvec --drop-full
+
+--drop-full removes the full-precision index afterwards to reclaim its
+memory; only do that once the quantized mode is live everywhere.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from sqlalchemy import text
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.database import engine
+
+FULL_INDEX = "ix_papers_embedding_hnsw"
+
+# Storage mode -> (index name, indexed expression, operator class)
+_INDEXES = {
+    "full": (FULL_INDEX, "embedding", "vector_cosine_ops"),
+    "halfvec": (
+        "ix_papers_embedding_halfvec_hnsw",
+        "(embedding::halfvec({dims}))",
+        "halfvec_cosine_ops",
+    ),
+    "binary": (
+        "ix_papers_embedding_bit_hnsw",
+        "(binary_quantize(embedding)::bit({dims}))",
+        "bit_hamming_ops",
+    ),
+}
+
+
+async def _build(mode: str, drop_full: bool) -> None:
+    name, expression, opclass = _INDEXES[mode]
+    dims = settings.EMBEDDING_DIMENSIONS
+    async with engine.connect() as conn:
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(
+            text(
+                f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON papers
+                USING hnsw ({expression.format(dims=dims)} {opclass})
+                WITH (m = 32, ef_construction = 200)
+                """
+            )
+        )
+        print(f"Built {name}")
+        if drop_full and name != FULL_INDEX:
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {FULL_INDEX}"))
+            print(f"Dropped {FULL_INDEX}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the HNSW index for a storage mode")
+    parser.add_argument(
+        "--mode",
+        choices=sorted(_INDEXES),
+        default=settings.PGVECTOR_STORAGE_MODE,
+        help="Storage mode whose index to build (default: PGVECTOR_STORAGE_MODE)",
+    )
+    parser.add_argument(
+        "--drop-full",
+        action="store_true",
+        help="Drop the full-precision index after building a quantized one",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(_build(args.mode, args.drop_full))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Rebuild the precomputed similar-papers graph.
+
+Recomputes the top-k neighbour lists of every embedded paper in one
+library, or in every library when no organization is given. Run it after
+deploying the paper_neighbors table or resizing embeddings; until then
+"similar papers" lookups fall back to live kNN queries.
+Equivalent to the build_paper_neighbors_task worker job:
+
+    python -m scripts.build_paper_neighbors --organization-id <uuid>
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from sqlalchemy import select
+
+from paper_scraper.core.database import get_db_session
+from paper_scraper.jobs.neighbors import DEFAULT_BATCH_SIZE, build_paper_neighbors_task
+from paper_scraper.modules.papers.models import OrganizationPaper
+
+
+async def _organization_ids() -> list[UUID]:
+    async with get_db_session() as db:
+        result = await db.execute(select(OrganizationPaper.organization_id).distinct())
+        return list(result.scalars().all())
+
+
+async def _build(organization_ids: list[UUID], batch_size: int) -> None:
+    for org_id in organization_ids or await _organization_ids():
+        result = await build_paper_neighbors_task({}, str(org_id), batch_size=batch_size)
+        print(
+            f"  {org_id}: {result['papers_processed']} papers, "
+            f"{result['neighbors_written']} neighbours"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the paper neighbour graph")
+    parser.add_argument(
+        "--organization-id",
+        type=UUID,
+        action="append",
+        default=[],
+        help="Library to rebuild (repeatable; default: every library)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Papers per kNN batch statement",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(_build(args.organization_id, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
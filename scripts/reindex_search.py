@@ -0,0 +1,52 @@
+"""Rebuild the Typesense paper collections without a search outage.
+
+Creates the next version of the tenant and catalog collections, streams
+every paper from PostgreSQL into them and swaps the aliases once the
+document counts check out.
+Equivalent to the reindex_search_task worker job:
+
+    python -m scripts.reindex_search --writers 8 --batch-size 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.search_reindex import SearchReindexer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reindex Typesense papers behind the alias")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.TYPESENSE_REINDEX_BATCH_SIZE,
+        help="Documents per JSONL import request",
+    )
+    parser.add_argument(
+        "--writers",
+        type=int,
+        default=settings.TYPESENSE_REINDEX_WRITERS,
+        help="Concurrent import requests",
+    )
+    parser.add_argument(
+        "--keep-previous",
+        action="store_true",
+        help="Keep the previous collections for rollback instead of dropping them",
+    )
+    args = parser.parse_args()
+
+    reindexer = SearchReindexer(batch_size=args.batch_size, writers=args.writers)
+    result = asyncio.run(reindexer.run(keep_previous=args.keep_previous))
+    print(
+        f"Indexed {result.documents_indexed} papers ({result.documents_caught_up} caught up) "
+        f"in {result.duration_seconds:.0f}s"
+    )
+    for alias, collection in result.collections.items():
+        print(f"  {alias}: {result.previous_collections[alias]} -> {collection}")
+
+
+if __name__ == "__main__":
+    main()
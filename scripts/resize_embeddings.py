@@ -0,0 +1,124 @@
+"""Resize paper embeddings to EMBEDDING_DIMENSIONS.
+
+The embedding_dimensions migration resizes the column once, when it is
+first applied. To move to another size later, change EMBEDDING_DIMENSIONS
+and run this script instead of downgrading through later revisions:
+
+    python -m scripts.resize_embeddings
+    python -m scripts.resize_embeddings --strategy reembed
+
+--strategy truncate (default, shrinking only) keeps the leading
+components of the Matryoshka-trained vectors and L2-normalizes them in
+place. --strategy reembed clears the vectors so the bulk embed and
+backfill jobs regenerate them at the new size; it is required when
+growing the dimension.
+
+Each existing HNSW index is dropped and rebuilt CONCURRENTLY for the new
+size; only the column rewrite itself blocks writes to papers. The stored
+neighbour graph is cleared; rebuild it with scripts/build_paper_neighbors.py
+after a truncate (the embedding backfill rebuilds it after a reembed).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from sqlalchemy import text
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.database import engine
+from scripts.build_embedding_index import _INDEXES
+
+
+async def _resize(target: int, strategy: str) -> None:
+    async with engine.connect() as conn:
+        # For pgvector columns atttypmod holds the declared dimension
+        current = (
+            await conn.execute(
+                text(
+                    "SELECT atttypmod FROM pg_attribute "
+                    "WHERE attrelid = 'papers'::regclass AND attname = 'embedding'"
+                )
+            )
+        ).scalar_one()
+        existing = set(
+            (
+                await conn.execute(
+                    text(
+                        "SELECT indexname FROM pg_indexes "
+                        "WHERE tablename = 'papers' AND indexname = ANY(:names)"
+                    ),
+                    {"names": [name for name, _, _ in _INDEXES.values()]},
+                )
+            ).scalars()
+        )
+    if current == target:
+        print(f"Embeddings already have {target} dimensions")
+        await engine.dispose()
+        return
+    if strategy == "truncate" and target > current:
+        raise SystemExit(
+            f"Cannot truncate {current}-d embeddings to {target}-d; use --strategy reembed"
+        )
+
+    indexes = [spec for spec in _INDEXES.values() if spec[0] in existing]
+
+    async with engine.connect() as conn:
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        # Dropping first keeps the column rewrite from rebuilding them under its lock
+        for name, _, _ in indexes:
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            print(f"Dropped {name}")
+
+    async with engine.begin() as conn:
+        if strategy == "truncate":
+            await conn.execute(
+                text(
+                    f"""
+                    ALTER TABLE papers ALTER COLUMN embedding TYPE vector({target})
+                    USING l2_normalize(subvector(embedding, 1, {target}))::vector({target})
+                    """
+                )
+            )
+        else:
+            await conn.execute(text("UPDATE papers SET embedding = NULL, has_embedding = false"))
+            await conn.execute(
+                text(f"ALTER TABLE papers ALTER COLUMN embedding TYPE vector({target})")
+            )
+        # Similarities were computed on the old vectors
+        await conn.execute(text("TRUNCATE paper_neighbors"))
+    print(f"Resized embeddings from {current} to {target} dimensions ({strategy})")
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name, expression, opclass in indexes:
+            await conn.execute(
+                text(
+                    f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON papers
+                    USING hnsw ({expression.format(dims=target)} {opclass})
+                    WITH (m = 32, ef_construction = 200)
+                    """
+                )
+            )
+            print(f"Built {name}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resize paper embeddings")
+    parser.add_argument(
+        "--strategy",
+        choices=["truncate", "reembed"],
+        default="truncate",
+        help="truncate in place (shrinking only) or clear for re-embedding",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(_resize(int(settings.EMBEDDING_DIMENSIONS), args.strategy))
+
+
+if __name__ == "__main__":
+    main()
@@ -26,8 +26,10 @@ from paper_scraper.api.main import app
 # ---------------------------------------------------------------------------
 # Patch the TokenBlacklist (and any other RedisService subclass) to use
 # fakeredis instead of connecting to a real Redis instance.
+from paper_scraper.core import index_generation as index_generation_module
 from paper_scraper.core import token_blacklist as tb_module
 from paper_scraper.core.database import Base, get_db
+from paper_scraper.core.http_clients import HTTPClientManager
 from paper_scraper.core.security import create_access_token, get_password_hash
 from paper_scraper.modules.alerts.models import Alert, AlertResult  # noqa: F401
 from paper_scraper.modules.audit.models import AuditLog  # noqa: F401
@@ -37,6 +39,7 @@ from paper_scraper.modules.billing.models import OrganizationUsage  # noqa: F401
 from paper_scraper.modules.compliance.models import RetentionLog, RetentionPolicy  # noqa: F401
 from paper_scraper.modules.developer.models import APIKey, RepositorySource, Webhook  # noqa: F401
 from paper_scraper.modules.discovery.models import DiscoveryRun  # noqa: F401
+from paper_scraper.modules.embeddings.models import StoredEmbedding  # noqa: F401
 from paper_scraper.modules.groups.models import GroupMember, ResearcherGroup  # noqa: F401
 from paper_scraper.modules.ingestion.models import (  # noqa: F401
     IngestCheckpoint,
@@ -75,12 +78,19 @@ from paper_scraper.modules.projects.models import (  # noqa: F401
 )
 from paper_scraper.modules.reports.models import ScheduledReport  # noqa: F401
 from paper_scraper.modules.saved_searches.models import SavedSearch  # noqa: F401
+from paper_scraper.modules.scoring import embeddings as embeddings_module
+from paper_scraper.modules.scoring import enrichment_cache as enrichment_cache_module
 from paper_scraper.modules.scoring.models import (  # noqa: F401
     GlobalScoreCache,
     PaperScore,
     ScoringJob,
 )
-from paper_scraper.modules.search.models import SearchActivity  # noqa: F401
+from paper_scraper.modules.search import cache as search_cache_module
+from paper_scraper.modules.search.models import (  # noqa: F401
+    PaperNeighbor,
+    SearchActivity,
+    SearchOutboxEntry,
+)
 from paper_scraper.modules.submissions.models import (  # noqa: F401
     ResearchSubmission,
     SubmissionAttachment,
@@ -122,6 +132,11 @@ async def _patched_get_redis() -> fakeredis.aioredis.FakeRedis:
 
 
 tb_module.token_blacklist._get_redis = _patched_get_redis  # type: ignore[assignment]
+embeddings_module.query_embedding_cache._get_redis = _patched_get_redis  # type: ignore[assignment]
+enrichment_cache_module.enrichment_cache._get_redis = _patched_get_redis  # type: ignore[assignment]
+search_cache_module.hybrid_result_cache._get_redis = _patched_get_redis  # type: ignore[assignment]
+search_cache_module.search_response_cache._get_redis = _patched_get_redis  # type: ignore[assignment]
+index_generation_module.index_generation._get_redis = _patched_get_redis  # type: ignore[assignment]
 
 
 # ---------------------------------------------------------------------------
@@ -151,6 +166,7 @@ def _get_mock_typesense_client() -> MagicMock:
 # Patch the singleton factory so SearchEngineService never connects to Typesense
 _se_module._client = _get_mock_typesense_client()  # type: ignore[assignment]
 _se_module.get_typesense_client = lambda: _se_module._client  # type: ignore[assignment]
+_se_module.get_typesense_read_client = lambda: _se_module._client  # type: ignore[assignment]
 
 # Note: VectorService (pgvector) uses the test database directly via db_session
 # fixture — no separate mock needed. Embeddings live on the papers table.
@@ -333,7 +349,10 @@ async def _clear_fake_redis():
     when pytest-asyncio uses function-scoped loops.
     """
     _reset_fake_redis()
+    embeddings_module.query_embedding_cache.clear_local()
     yield
+    # Pooled HTTP clients are bound to this test's event loop
+    await HTTPClientManager.close_all()
     try:
         redis = _get_fake_redis()
         await redis.flushall()
@@ -0,0 +1,53 @@
+"""Unit tests for paper_scraper.core.http_clients — the pooled httpx client registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.http_clients import HTTPClientManager
+
+
+class TestHTTPClientManager:
+    """Tests for client reuse, per-host pools and shutdown."""
+
+    async def test_clients_are_shared_per_host(self) -> None:
+        async with HTTPClientManager.get_client("https://api.openalex.org/works") as a:
+            pass
+        async with HTTPClientManager.get_client("https://API.openalex.org/authors") as b:
+            pass
+        other = HTTPClientManager.client("https://api.crossref.org/works")
+
+        assert a is b
+        assert not a.is_closed  # leaving the block keeps the pool open
+        assert other is not a
+
+    async def test_pool_uses_per_host_limits(self) -> None:
+        client = HTTPClientManager.client("https://pub.orcid.org/v3.0", timeout=15.0)
+        pool = client._transport._pool
+
+        assert pool._max_connections == settings.HTTPX_MAX_CONNECTIONS_PER_HOST
+        assert client.timeout.read == 15.0
+
+    async def test_close_all_closes_and_forgets_clients(self) -> None:
+        client = HTTPClientManager.client("https://api.resend.com", timeout=30.0)
+
+        await HTTPClientManager.close_all()
+
+        assert client.is_closed
+        assert HTTPClientManager.client("https://api.resend.com", timeout=30.0) is not client
+
+    @pytest.mark.parametrize("timeout", [15.0, 60.0])
+    async def test_timeouts_get_separate_pools(self, timeout: float) -> None:
+        default = HTTPClientManager.client("https://api.openai.com/v1")
+        custom = HTTPClientManager.client("https://api.openai.com/v1", timeout=timeout)
+
+        assert custom is not default
+        assert custom.timeout.read == timeout
+
+    async def test_pool_sizes_get_separate_pools(self) -> None:
+        small = HTTPClientManager.client("https://api.openai.com/v1", max_connections=4)
+        large = HTTPClientManager.client("https://api.openai.com/v1", max_connections=8)
+
+        assert large is not small
+        assert large._transport._pool._max_connections == 8
@@ -5,15 +5,29 @@ All tests mock the typesense.Client so no real Typesense instance is needed.
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import pytest
+
+from paper_scraper.core.config import settings
+from paper_scraper.core.exceptions import ValidationError
 from paper_scraper.core.search_engine import (
+    SCHEMA_VERSION,
     SearchEngineService,
     _collection_name,
     _datetime_to_epoch,
+    catalog_collection_for,
+    collection_version,
+    create_typesense_client,
+    get_typesense_executor,
+    merge_search_results,
+    shutdown_typesense_executor,
 )
+from paper_scraper.core.search_reindex import ReindexError, SearchReindexer
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -35,7 +49,7 @@ class TestEnsureCollections:
     """Tests for SearchEngineService.ensure_collections."""
 
     async def test_ensure_collections_creates_schema_when_missing(self) -> None:
-        """When the collection does not exist, it should be created with PAPERS_SCHEMA."""
+        """Missing collections are created with PAPERS_SCHEMA behind their aliases."""
         import typesense.exceptions
 
         mock_client = MagicMock()
@@ -47,10 +61,15 @@ class TestEnsureCollections:
         service = _make_service(mock_client)
         await service.ensure_collections()
 
-        mock_client.collections.create.assert_called_once()
-        create_arg = mock_client.collections.create.call_args[0][0]
-        assert create_arg["name"] == _collection_name("papers")
-        assert "fields" in create_arg
+        created = [c[0][0] for c in mock_client.collections.create.call_args_list]
+        assert [c["name"] for c in created] == [
+            _collection_name(f"papers_v{SCHEMA_VERSION}"),
+            _collection_name(f"catalog_v{SCHEMA_VERSION}"),
+        ]
+        assert all("fields" in c for c in created)
+        mock_client.aliases.upsert.assert_any_call(
+            _collection_name("papers"), {"collection_name": created[0]["name"]}
+        )
 
     async def test_ensure_collections_skips_existing(self) -> None:
         """When the collection already exists, create should not be called."""
@@ -63,13 +82,157 @@ class TestEnsureCollections:
         await service.ensure_collections()
 
         mock_client.collections.create.assert_not_called()
+        mock_client.aliases.upsert.assert_not_called()
+
+
+class TestReindexPrimitives:
+    """Tests for the alias and import helpers used by zero-downtime reindexing."""
+
+    async def test_resolve_collection_follows_alias(self) -> None:
+        mock_client = MagicMock()
+        mock_client.aliases.__getitem__.return_value.retrieve.return_value = {
+            "collection_name": "papers_v3"
+        }
+
+        service = _make_service(mock_client)
+        assert await service.resolve_collection() == "papers_v3"
+        assert collection_version("papers_v3") == 3
+        assert collection_version("papers") == 0
+
+    async def test_point_alias_replaces_legacy_collection(self) -> None:
+        """A legacy unversioned collection holding the alias name is dropped first."""
+        import typesense.exceptions
+
+        mock_client = MagicMock()
+        mock_client.aliases.__getitem__.return_value.retrieve.side_effect = (
+            typesense.exceptions.ObjectNotFound("Not found")
+        )
+        legacy = MagicMock()
+        mock_client.collections.__getitem__.return_value = legacy
+
+        service = _make_service(mock_client)
+        await service.point_alias("papers_v1")
+
+        legacy.delete.assert_called_once()
+        mock_client.aliases.upsert.assert_called_once_with(
+            _collection_name("papers"), {"collection_name": "papers_v1"}
+        )
+
+    async def test_import_jsonl_counts_failures(self) -> None:
+        mock_client = MagicMock()
+        mock_docs = MagicMock()
+        mock_docs.import_.return_value = '{"success": true}\n{"success": false, "error": "bad"}'
+        mock_client.collections.__getitem__.return_value.documents = mock_docs
+
+        service = _make_service(mock_client)
+        imported, errors = await service.import_jsonl("papers_v2", '{"id": "1"}\n{"id": "2"}')
+
+        assert imported == 1
+        assert errors == ["bad"]
+        mock_docs.import_.assert_called_once_with('{"id": "1"}\n{"id": "2"}', {"action": "create"})
+
+
+class TestSearchReindexer:
+    """Tests for SearchReindexer.run against a mocked search service."""
+
+    @staticmethod
+    def _rows(count: int) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(
+                id=uuid4(),
+                organization_id=None,
+                title=f"Paper {i}",
+                abstract=None,
+                doi=None,
+                source=None,
+                journal=None,
+                paper_type=None,
+                keywords=[],
+                citations_count=None,
+                has_embedding=False,
+                is_global=True,
+                publication_date=None,
+                created_at=datetime(2024, 1, 1),
+            )
+            for i in range(count)
+        ]
+
+    def _reindexer(self, search: AsyncMock, pages: list[list]) -> SearchReindexer:
+        reindexer = SearchReindexer(search=search, batch_size=2, writers=2)
+        reindexer._read_page = AsyncMock(side_effect=pages)
+        return reindexer
+
+    @staticmethod
+    def _search() -> AsyncMock:
+        """Mock service with papers_v1/catalog_v1 live and counting imports."""
+        search = AsyncMock()
+        search.resolve_collection.side_effect = lambda alias: f"{alias}_v1"
+        search.create_versioned_collection.side_effect = lambda version, alias: (
+            f"{alias}_v{version}"
+        )
+        imported: dict[str, int] = {}
+
+        async def import_jsonl(name: str, jsonl: str, action: str) -> tuple[int, list]:
+            imported[name] = imported.get(name, 0) + len(jsonl.splitlines())
+            return len(jsonl.splitlines()), []
+
+        search.import_jsonl.side_effect = import_jsonl
+        search.count_documents.side_effect = lambda name: imported.get(name, 0)
+        return search
+
+    async def test_streams_into_next_version_and_swaps_aliases(self) -> None:
+        search = self._search()
+        rows = self._rows(3)
+        rows[0].is_global = False
+        rows[0].organization_id = uuid4()
+
+        result = await self._reindexer(search, [rows[:2], rows[2:], [], [], [], []]).run()
+
+        assert result.collections == {"papers": "papers_v2", "catalog": "catalog_v2"}
+        assert result.documents_indexed == 3
+        assert result.documents_caught_up == 0
+        imported_into = {c[0][0] for c in search.import_jsonl.call_args_list}
+        assert imported_into == {"papers_v2", "catalog_v2"}
+        # Catalog first, tenant collection last
+        assert [c[0] for c in search.point_alias.call_args_list] == [
+            ("catalog_v2", "catalog"),
+            ("papers_v2", "papers"),
+        ]
+        dropped = {c[0][0] for c in search.drop_collection.call_args_list}
+        assert dropped == {"papers_v1", "catalog_v1"}
+
+    async def test_catches_up_again_after_swap(self) -> None:
+        search = self._search()
+        late = self._rows(1)
+        reindexer = self._reindexer(search, [self._rows(2), [], [], [], late, []])
+
+        result = await reindexer.run()
+
+        assert result.documents_caught_up == 1
+        assert search.import_jsonl.call_args_list[-1][0][2] == "upsert"
+        # Three catch-ups after the initial stream, each resuming where the last began
+        since = [c[0][1] for c in reindexer._read_page.call_args_list if c[0][0] is None][1:]
+        assert len(since) == 3
+        assert since == sorted(since)
+
+    async def test_count_mismatch_keeps_aliases(self) -> None:
+        search = self._search()
+        search.count_documents.side_effect = None
+        search.count_documents.return_value = 1
+
+        with pytest.raises(ReindexError):
+            await self._reindexer(search, [self._rows(2), []]).run()
+
+        search.point_alias.assert_not_awaited()
+        dropped = {c[0][0] for c in search.drop_collection.call_args_list}
+        assert dropped == {"papers_v2", "catalog_v2"}
 
 
 class TestDeleteCollections:
     """Tests for SearchEngineService.delete_collections."""
 
     async def test_delete_collections(self) -> None:
-        """delete_collections should attempt to delete the papers collection."""
+        """delete_collections should delete the papers and catalog collections."""
         mock_client = MagicMock()
         mock_collection = MagicMock()
         mock_client.collections.__getitem__.return_value = mock_collection
@@ -77,7 +240,7 @@ class TestDeleteCollections:
         service = _make_service(mock_client)
         await service.delete_collections()
 
-        mock_collection.delete.assert_called_once()
+        assert mock_collection.delete.call_count == 2
 
     async def test_delete_collections_ignores_errors(self) -> None:
         """delete_collections should not raise if delete fails."""
@@ -99,7 +262,7 @@ class TestDeleteCollections:
 class TestIndexPaper:
     """Tests for SearchEngineService.index_paper."""
 
-    def test_index_paper(self) -> None:
+    async def test_index_paper(self) -> None:
         """index_paper should upsert the document to the correct collection."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
@@ -117,25 +280,45 @@ class TestIndexPaper:
             "created_at": 1700000000,
         }
 
-        service.index_paper(doc)
+        await service.index_paper(doc)
 
         mock_docs.upsert.assert_called_once_with(doc)
 
-    def test_index_paper_uses_correct_collection_name(self) -> None:
+    async def test_index_paper_uses_correct_collection_name(self) -> None:
         """index_paper should use the prefixed collection name."""
         mock_client = MagicMock()
         service = _make_service(mock_client)
 
-        doc = {"id": "test", "title": "Test", "created_at": 0}
-        service.index_paper(doc)
+        doc = {"id": str(uuid4()), "title": "Test", "created_at": 0}
+        await service.index_paper(doc)
+
+        upsert_target = mock_client.collections.__getitem__.call_args_list[0]
+        assert upsert_target.args == (_collection_name("papers"),)
+
+    async def test_index_paper_removes_document_from_stale_collection(self) -> None:
+        """A paper that became global is deleted from the tenant collection."""
+        mock_client = MagicMock()
+        collections: dict[str, MagicMock] = {}
+        mock_client.collections.__getitem__.side_effect = lambda name: collections.setdefault(
+            name, MagicMock()
+        )
+        paper_id = str(uuid4())
 
-        mock_client.collections.__getitem__.assert_called_with(_collection_name("papers"))
+        await _make_service(mock_client).index_paper(
+            {"id": paper_id, "title": "t", "is_global": True, "created_at": 0}
+        )
+
+        catalog = collections[_collection_name(catalog_collection_for(paper_id))]
+        catalog.documents.upsert.assert_called_once()
+        tenant = collections[_collection_name("papers")]
+        tenant.documents.__getitem__.assert_called_once_with(paper_id)
+        tenant.documents.__getitem__.return_value.delete.assert_called_once()
 
 
 class TestIndexPapersBatch:
     """Tests for SearchEngineService.index_papers_batch."""
 
-    def test_index_papers_batch(self) -> None:
+    async def test_index_papers_batch(self) -> None:
         """Batch import should call import_ with papers and action param."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
@@ -149,12 +332,12 @@ class TestIndexPapersBatch:
             {"id": str(uuid4()), "title": "Paper 2", "created_at": 0},
         ]
 
-        results = service.index_papers_batch(papers)
+        results = await service.index_papers_batch(papers)
 
         mock_docs.import_.assert_called_once_with(papers, {"action": "upsert"})
         assert len(results) == 2
 
-    def test_index_papers_batch_custom_action(self) -> None:
+    async def test_index_papers_batch_custom_action(self) -> None:
         """index_papers_batch should respect the action parameter."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
@@ -162,23 +345,55 @@ class TestIndexPapersBatch:
         mock_client.collections.__getitem__.return_value.documents = mock_docs
 
         service = _make_service(mock_client)
-        service.index_papers_batch([], action="create")
+        await service.index_papers_batch([], action="create")
 
         # Empty list returns early, no import call
         mock_docs.import_.assert_not_called()
 
-    def test_index_papers_batch_empty_returns_empty(self) -> None:
+    async def test_index_papers_batch_empty_returns_empty(self) -> None:
         """An empty list should return [] without calling import_."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
         mock_client.collections.__getitem__.return_value.documents = mock_docs
 
         service = _make_service(mock_client)
-        results = service.index_papers_batch([])
+        results = await service.index_papers_batch([])
 
         assert results == []
         mock_docs.import_.assert_not_called()
 
+    async def test_index_papers_batch_routes_by_is_global(self) -> None:
+        """Global papers go to their catalog shard, results keep input order."""
+        mock_client = MagicMock()
+        docs_by_name: dict[str, MagicMock] = {}
+
+        def collection(name: str) -> MagicMock:
+            docs = docs_by_name.setdefault(name, MagicMock())
+            docs.documents.import_.side_effect = lambda papers, params: [
+                {"success": True, "collection": name} for _ in papers
+            ]
+            return docs
+
+        mock_client.collections.__getitem__.side_effect = collection
+        papers = [
+            {"id": str(uuid4()), "title": "Library", "created_at": 0},
+            {"id": str(uuid4()), "title": "Catalog", "is_global": True, "created_at": 0},
+        ]
+
+        with patch("paper_scraper.core.search_engine.settings") as mock_settings:
+            mock_settings.TYPESENSE_COLLECTION_PREFIX = ""
+            mock_settings.TYPESENSE_CATALOG_SHARDS = 4
+            shard = catalog_collection_for(papers[1]["id"])
+            results = await _make_service(mock_client).index_papers_batch(papers)
+
+        assert shard.startswith("catalog_s")
+        assert [r["collection"] for r in results] == ["papers", shard]
+        # Each paper is removed from the collection the other routing uses
+        library_stale = docs_by_name[shard].documents.delete.call_args[0][0]
+        assert library_stale == {"filter_by": f"paper_id:[{papers[0]['id']}]"}
+        catalog_stale = docs_by_name["papers"].documents.delete.call_args[0][0]
+        assert catalog_stale == {"filter_by": f"paper_id:[{papers[1]['id']}]"}
+
 
 # ---------------------------------------------------------------------------
 # Delete
@@ -188,7 +403,7 @@ class TestIndexPapersBatch:
 class TestDeletePaper:
     """Tests for SearchEngineService.delete_paper."""
 
-    def test_delete_paper(self) -> None:
+    async def test_delete_paper(self) -> None:
         """delete_paper should call documents[paper_id].delete()."""
         mock_client = MagicMock()
         mock_doc = MagicMock()
@@ -198,14 +413,15 @@ class TestDeletePaper:
 
         service = _make_service(mock_client)
         paper_id = str(uuid4())
-        service.delete_paper(paper_id)
+        await service.delete_paper(paper_id)
 
         mock_client.collections.__getitem__.return_value.documents.__getitem__.assert_called_with(
             paper_id
         )
-        mock_doc.delete.assert_called_once()
+        # Library and catalog collection are both tried
+        assert mock_doc.delete.call_count == 2
 
-    def test_delete_paper_not_found_is_silent(self) -> None:
+    async def test_delete_paper_not_found_is_silent(self) -> None:
         """delete_paper should not raise if document is not found."""
         import typesense.exceptions
 
@@ -218,13 +434,13 @@ class TestDeletePaper:
 
         service = _make_service(mock_client)
         # Should not raise
-        service.delete_paper(str(uuid4()))
+        await service.delete_paper(str(uuid4()))
 
 
 class TestDeletePapersByOrg:
     """Tests for SearchEngineService.delete_papers_by_org."""
 
-    def test_delete_papers_by_org(self) -> None:
+    async def test_delete_papers_by_org(self) -> None:
         """delete_papers_by_org should apply filter_by with organization_id."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
@@ -233,7 +449,7 @@ class TestDeletePapersByOrg:
 
         service = _make_service(mock_client)
         org_id = uuid4()
-        result = service.delete_papers_by_org(org_id)
+        result = await service.delete_papers_by_org(org_id)
 
         assert result == 15
         mock_docs.delete.assert_called_once()
@@ -249,7 +465,7 @@ class TestDeletePapersByOrg:
 class TestSearchPapers:
     """Tests for SearchEngineService.search_papers."""
 
-    def test_search_papers_basic(self) -> None:
+    async def test_search_papers_basic(self) -> None:
         """search_papers should call documents.search with correct params."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
@@ -259,7 +475,7 @@ class TestSearchPapers:
         service = _make_service(mock_client)
         org_id = uuid4()
 
-        service.search_papers(
+        await service.search_papers(
             query="machine learning",
             organization_id=org_id,
             page=1,
@@ -275,7 +491,7 @@ class TestSearchPapers:
         assert search_params["per_page"] == 20
         assert search_params["page"] == 1
 
-    def test_search_papers_with_additional_filter(self) -> None:
+    async def test_search_papers_with_additional_filter(self) -> None:
         """Additional filter_by should be combined with org filter via &&."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
@@ -285,7 +501,7 @@ class TestSearchPapers:
         service = _make_service(mock_client)
         org_id = uuid4()
 
-        service.search_papers(
+        await service.search_papers(
             query="crispr",
             organization_id=org_id,
             filter_by="source:=openalex",
@@ -297,7 +513,7 @@ class TestSearchPapers:
         assert "source:=openalex" in filter_str
         assert "&&" in filter_str
 
-    def test_search_papers_with_sort_and_facet(self) -> None:
+    async def test_search_papers_with_sort_and_facet(self) -> None:
         """sort_by and facet_by should be included in search params."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
@@ -306,7 +522,7 @@ class TestSearchPapers:
 
         service = _make_service(mock_client)
 
-        service.search_papers(
+        await service.search_papers(
             query="*",
             organization_id=uuid4(),
             sort_by="created_at:desc",
@@ -317,7 +533,7 @@ class TestSearchPapers:
         assert search_params["sort_by"] == "created_at:desc"
         assert search_params["facet_by"] == "source,paper_type"
 
-    def test_search_papers_typo_tolerance_enabled(self) -> None:
+    async def test_search_papers_typo_tolerance_enabled(self) -> None:
         """num_typos should be set to 2 for typo tolerance."""
         mock_client = MagicMock()
         mock_docs = MagicMock()
@@ -325,7 +541,7 @@ class TestSearchPapers:
         mock_client.collections.__getitem__.return_value.documents = mock_docs
 
         service = _make_service(mock_client)
-        service.search_papers(query="test", organization_id=uuid4())
+        await service.search_papers(query="test", organization_id=uuid4())
 
         search_params = mock_docs.search.call_args[0][0]
         assert search_params["num_typos"] == 2
@@ -336,6 +552,79 @@ class TestSearchPapers:
 # ---------------------------------------------------------------------------
 
 
+class TestCollectionRouting:
+    """Tests for catalog/library routing and multi-collection result merging."""
+
+    async def test_catalog_search_skips_tenant_collection(self) -> None:
+        mock_client = MagicMock()
+        mock_client.collections.__getitem__.return_value.documents.search.return_value = {}
+
+        await _make_service(mock_client).search_papers("q", uuid4(), scope="catalog")
+
+        mock_client.collections.__getitem__.assert_called_with(_collection_name("catalog"))
+        params = mock_client.collections.__getitem__.return_value.documents.search.call_args[0][0]
+        assert "filter_by" not in params
+
+    async def test_sharded_catalog_search_merges_multi_search(self) -> None:
+        mock_client = MagicMock()
+        mock_client.multi_search.perform.return_value = {
+            "results": [
+                {
+                    "found": 2,
+                    "hits": [{"text_match": 9, "document": {"id": "a"}}],
+                    "facet_counts": [
+                        {"field_name": "source", "counts": [{"value": "openalex", "count": 2}]}
+                    ],
+                },
+                {
+                    "found": 3,
+                    "hits": [
+                        {"text_match": 10, "document": {"id": "b"}},
+                        {"text_match": 1, "document": {"id": "c"}},
+                    ],
+                    "facet_counts": [
+                        {"field_name": "source", "counts": [{"value": "openalex", "count": 1}]}
+                    ],
+                },
+            ]
+        }
+
+        with patch("paper_scraper.core.search_engine.settings") as mock_settings:
+            mock_settings.TYPESENSE_COLLECTION_PREFIX = ""
+            mock_settings.TYPESENSE_CATALOG_SHARDS = 2
+            result = await _make_service(mock_client).search_papers(
+                "q", uuid4(), page=1, page_size=2, scope="catalog"
+            )
+
+        searches, common = mock_client.multi_search.perform.call_args[0]
+        assert [s["collection"] for s in searches["searches"]] == ["catalog_s0", "catalog_s1"]
+        assert common["per_page"] == 2
+        assert result["found"] == 5
+        assert [h["document"]["id"] for h in result["hits"]] == ["b", "a"]
+        assert result["facet_counts"][0]["counts"] == [{"value": "openalex", "count": 3}]
+
+    async def test_multi_collection_search_rejects_deep_pages(self) -> None:
+        mock_client = MagicMock()
+
+        with pytest.raises(ValidationError):
+            await _make_service(mock_client).search_papers(
+                "q", uuid4(), page=14, page_size=20, scope="all"
+            )
+
+        mock_client.multi_search.perform.assert_not_called()
+
+    def test_merge_follows_sort_by_and_paginates(self) -> None:
+        results = [
+            {"found": 1, "hits": [{"document": {"created_at": 5}}]},
+            {"found": 2, "hits": [{"document": {"created_at": 9}}, {"document": {}}]},
+        ]
+
+        merged = merge_search_results(results, page=2, page_size=2, sort_by="created_at:desc")
+
+        assert merged["hits"] == [{"document": {}}]
+        assert merged["found"] == 3
+
+
 class TestPaperToDocument:
     """Tests for SearchEngineService.paper_to_document static method."""
 
@@ -485,7 +774,7 @@ class TestCollectionName:
 class TestMultiSearch:
     """Tests for SearchEngineService.multi_search."""
 
-    def test_multi_search(self) -> None:
+    async def test_multi_search(self) -> None:
         """multi_search should call multi_search.perform with search params."""
         mock_client = MagicMock()
         mock_multi = MagicMock()
@@ -498,8 +787,76 @@ class TestMultiSearch:
             {"q": "test2", "collection": "papers"},
         ]
 
-        service.multi_search(searches)
+        await service.multi_search(searches)
 
         mock_multi.perform.assert_called_once()
         call_args = mock_multi.perform.call_args[0]
         assert call_args[0] == {"searches": searches}
+
+
+# ---------------------------------------------------------------------------
+# Client configuration
+# ---------------------------------------------------------------------------
+
+
+class TestClientConfiguration:
+    """Tests for multi-node client construction and read/write routing."""
+
+    def test_client_balances_over_nodes_with_nearest(self) -> None:
+        client = create_typesense_client(
+            nodes=["https://ts-1.internal", "http://ts-2.internal:8108"],
+            nearest_node="http://ts-local:8108",
+        )
+
+        nodes = [(n.host, n.port, n.protocol) for n in client.config.nodes]
+        assert nodes == [("ts-1.internal", "443", "https"), ("ts-2.internal", "8108", "http")]
+        assert client.config.nearest_node.host == "ts-local"
+        assert client.config.retry_interval_seconds == settings.TYPESENSE_RETRY_INTERVAL_SECONDS
+
+    async def test_searches_use_read_client_and_writes_the_primary(self) -> None:
+        primary = MagicMock()
+        replica = MagicMock()
+        replica.collections.__getitem__.return_value.documents.search.return_value = {}
+        service = SearchEngineService(client=primary, read_client=replica)
+
+        await service.search_papers("q", uuid4())
+        await service.index_paper({"id": str(uuid4()), "title": "t", "created_at": 0})
+
+        replica.collections.__getitem__.return_value.documents.search.assert_called_once()
+        primary.collections.__getitem__.return_value.documents.search.assert_not_called()
+        primary.collections.__getitem__.return_value.documents.upsert.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+
+class TestTypesenseExecutor:
+    """Tests for the bounded thread pool that runs blocking SDK calls."""
+
+    async def test_sdk_calls_run_off_the_event_loop_thread(self) -> None:
+        """Blocking SDK calls should execute on a Typesense worker thread."""
+        seen_threads: list[str] = []
+
+        def _search(params: dict) -> dict:
+            seen_threads.append(threading.current_thread().name)
+            return {"found": 0, "hits": []}
+
+        mock_client = MagicMock()
+        mock_client.collections.__getitem__.return_value.documents.search.side_effect = _search
+
+        service = _make_service(mock_client)
+        await service.search_papers(query="test", organization_id=uuid4())
+
+        assert seen_threads
+        assert seen_threads[0].startswith("typesense")
+        assert seen_threads[0] != threading.current_thread().name
+
+    def test_shutdown_resets_executor(self) -> None:
+        """shutdown_typesense_executor should allow a fresh pool to be created."""
+        first = get_typesense_executor()
+        shutdown_typesense_executor()
+        second = get_typesense_executor()
+
+        assert first is not second
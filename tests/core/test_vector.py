@@ -142,9 +142,35 @@ class TestUpsertBatch:
         count = await service.upsert_batch(db_session, items)
 
         assert count == 3
-        for p in papers:
+        for i, p in enumerate(papers):
             await db_session.refresh(p)
             assert p.has_embedding is True
+            # Each row gets its own slice of the flat parameter array
+            assert list(p.embedding) == pytest.approx(_dummy_vector(seed=0.1 * (i + 1)))
+
+    async def test_upsert_batch_skips_wrong_dimension(
+        self, db_session: AsyncSession, org: Organization
+    ) -> None:
+        """Rows with the wrong dimension are skipped; the rest are written in bulk."""
+        good = Paper(organization_id=org.id, title="Good", source="openalex", is_global=True)
+        bad = Paper(organization_id=org.id, title="Bad", source="openalex", is_global=True)
+        db_session.add_all([good, bad])
+        await db_session.flush()
+
+        service = VectorService()
+        count = await service.upsert_batch(
+            db_session,
+            [
+                {"paper_id": good.id, "embedding": _dummy_vector(seed=0.3)},
+                {"paper_id": bad.id, "embedding": [0.1] * 768},
+            ],
+        )
+
+        assert count == 1
+        await db_session.refresh(good)
+        await db_session.refresh(bad)
+        assert good.has_embedding is True
+        assert bad.has_embedding is False
 
     async def test_upsert_batch_empty_list(self, db_session: AsyncSession) -> None:
         """Empty batch should return 0."""
@@ -194,6 +220,92 @@ class TestSearchSimilar:
         result_ids = {r["paper_id"] for r in results}
         assert str(paper_without_embedding.id) not in result_ids
 
+    async def test_search_applies_filters_in_query(
+        self,
+        db_session: AsyncSession,
+        org: Organization,
+        paper_with_embedding: Paper,
+    ) -> None:
+        """Metadata and latest-score filters are evaluated inside the kNN query."""
+        from paper_scraper.modules.scoring.models import PaperScore
+        from paper_scraper.modules.search.schemas import SearchFilters
+
+        scored = Paper(
+            organization_id=org.id,
+            title="Scored Paper",
+            source="pubmed",
+            is_global=True,
+            embedding=_dummy_vector(seed=0.5),
+            has_embedding=True,
+        )
+        db_session.add(scored)
+        await db_session.flush()
+        db_session.add(OrganizationPaper(organization_id=org.id, paper_id=scored.id, source="test"))
+        db_session.add(
+            PaperScore(
+                paper_id=scored.id,
+                organization_id=org.id,
+                novelty=8.0,
+                ip_potential=8.0,
+                marketability=8.0,
+                feasibility=8.0,
+                commercialization=8.0,
+                overall_score=8.0,
+                overall_confidence=0.9,
+                model_version="test",
+            )
+        )
+        await db_session.flush()
+
+        service = VectorService()
+        query_vec = _dummy_vector(seed=0.5)
+
+        by_source = await service.search_similar(
+            db_session,
+            query_vec,
+            organization_id=org.id,
+            filters=SearchFilters(sources=["openalex"]),
+        )
+        assert {r["paper_id"] for r in by_source} == {str(paper_with_embedding.id)}
+
+        by_score = await service.search_similar(
+            db_session,
+            query_vec,
+            organization_id=org.id,
+            filters=SearchFilters(min_score=7.0),
+        )
+        assert {r["paper_id"] for r in by_score} == {str(scored.id)}
+
+        unscored = await service.search_similar(
+            db_session,
+            query_vec,
+            organization_id=org.id,
+            filters=SearchFilters(has_score=False),
+        )
+        assert {r["paper_id"] for r in unscored} == {str(paper_with_embedding.id)}
+
+    @pytest.mark.parametrize("mode", ["halfvec", "binary"])
+    async def test_quantized_modes_rerank_exactly(
+        self,
+        db_session: AsyncSession,
+        org: Organization,
+        paper_with_embedding: Paper,
+        monkeypatch: pytest.MonkeyPatch,
+        mode: str,
+    ) -> None:
+        """Quantized shortlists are re-ranked by full-precision distance."""
+        from paper_scraper.core.config import settings
+
+        service = VectorService()
+        query_vec = _dummy_vector(seed=0.5)
+        exact = await service.search_similar(db_session, query_vec, organization_id=org.id)
+
+        monkeypatch.setattr(settings, "PGVECTOR_STORAGE_MODE", mode)
+        quantized = await service.search_similar(db_session, query_vec, organization_id=org.id)
+
+        assert [r["id"] for r in quantized] == [r["id"] for r in exact]
+        assert [r["score"] for r in quantized] == [r["score"] for r in exact]
+
 
 class TestSearchByPaperId:
     """Tests for VectorService.search_by_paper_id."""
@@ -211,6 +323,23 @@ class TestSearchByPaperId:
         result_ids = {r["id"] for r in results}
         assert str(paper_with_embedding.id) not in result_ids
 
+    async def test_search_by_paper_uses_given_vector(
+        self, db_session: AsyncSession, org: Organization, paper_with_embedding: Paper
+    ) -> None:
+        """A caller-supplied embedding is used instead of re-reading the paper's."""
+        service = VectorService()
+        seen: list[list[float]] = []
+
+        async def search_similar(db, query_vector, **kwargs):
+            seen.append(query_vector)
+            return []
+
+        service.search_similar = search_similar
+        given = _dummy_vector(seed=0.9)
+        await service.search_by_paper_id(db_session, uuid4(), query_vector=given)
+
+        assert seen == [given]
+
     async def test_search_by_nonexistent_paper(self, db_session: AsyncSession) -> None:
         """Searching by a non-existent paper ID should return empty list."""
         service = VectorService()
@@ -218,6 +347,129 @@ class TestSearchByPaperId:
         assert results == []
 
 
+class TestNeighborGraph:
+    """Tests for the precomputed neighbour graph."""
+
+    @staticmethod
+    def _axis_vector(weights: list[float]) -> list[float]:
+        return weights + [0.0] * (EMBEDDING_DIM - len(weights))
+
+    async def _library_paper(
+        self, db_session: AsyncSession, org: Organization, weights: list[float]
+    ) -> Paper:
+        paper = Paper(
+            organization_id=org.id,
+            title=f"Paper {weights}",
+            source="openalex",
+            embedding=self._axis_vector(weights),
+            has_embedding=True,
+        )
+        db_session.add(paper)
+        await db_session.flush()
+        db_session.add(OrganizationPaper(organization_id=org.id, paper_id=paper.id, source="test"))
+        await db_session.flush()
+        return paper
+
+    async def test_refresh_and_read_neighbors(
+        self, db_session: AsyncSession, org: Organization
+    ) -> None:
+        """Stored neighbours are served most similar first and updated incrementally."""
+        service = VectorService()
+        a = await self._library_paper(db_session, org, [1.0, 0.0])
+        b = await self._library_paper(db_session, org, [1.0, 0.2])
+        c = await self._library_paper(db_session, org, [0.0, 1.0])
+
+        assert await service.get_neighbors(db_session, org.id, a.id) is None
+
+        await service.refresh_neighbors(db_session, org.id, [a.id, b.id, c.id], propagate=False)
+        neighbors = await service.get_neighbors(db_session, org.id, a.id)
+        assert [n["id"] for n in neighbors] == [str(b.id), str(c.id)]
+        assert neighbors[0]["score"] > neighbors[1]["score"]
+
+        # c moves next to a: a's list must pick that up without a rebuild
+        c.embedding = self._axis_vector([1.0, 0.05])
+        await db_session.flush()
+        await service.refresh_neighbors(db_session, org.id, [c.id], k=1)
+
+        by_paper = await service.search_by_paper_id(db_session, a.id, organization_id=org.id)
+        assert [n["id"] for n in by_paper] == [str(c.id)]
+
+    async def test_refresh_keeps_other_lists_complete(
+        self, db_session: AsyncSession, org: Organization
+    ) -> None:
+        """Re-embedding one paper must not leave the lists that held it short."""
+        from sqlalchemy import func, select
+
+        from paper_scraper.modules.search.models import PaperNeighbor
+
+        service = VectorService()
+        papers = [
+            await self._library_paper(db_session, org, weights)
+            for weights in ([1.0, 0.0], [1.0, 0.1], [1.0, 0.2], [0.0, 1.0], [0.1, 1.0])
+        ]
+        await service.refresh_neighbors(
+            db_session, org.id, [p.id for p in papers], k=2, propagate=False
+        )
+
+        moved = papers[0]
+        moved.embedding = self._axis_vector([0.05, 1.0])
+        await db_session.flush()
+        await service.refresh_neighbors(db_session, org.id, [moved.id], k=2)
+
+        counts = await db_session.execute(
+            select(PaperNeighbor.paper_id, func.count())
+            .where(PaperNeighbor.organization_id == org.id)
+            .group_by(PaperNeighbor.paper_id)
+        )
+        assert dict(counts.all()) == {p.id: 2 for p in papers}
+
+    async def test_departed_neighbor_falls_back_to_live_knn(
+        self, db_session: AsyncSession, org: Organization
+    ) -> None:
+        """A list holding a paper that left the library is not served short."""
+        from sqlalchemy import delete
+
+        service = VectorService()
+        a = await self._library_paper(db_session, org, [1.0, 0.0])
+        b = await self._library_paper(db_session, org, [1.0, 0.2])
+        c = await self._library_paper(db_session, org, [0.0, 1.0])
+        await service.refresh_neighbors(db_session, org.id, [a.id], propagate=False)
+
+        await db_session.execute(
+            delete(OrganizationPaper).where(
+                OrganizationPaper.organization_id == org.id,
+                OrganizationPaper.paper_id == b.id,
+            )
+        )
+        await db_session.flush()
+
+        assert await service.get_neighbors(db_session, org.id, a.id) is None
+        by_paper = await service.search_by_paper_id(db_session, a.id, organization_id=org.id)
+        assert [n["id"] for n in by_paper] == [str(c.id)]
+
+    async def test_search_similar_many(
+        self, db_session: AsyncSession, org: Organization, paper_without_embedding: Paper
+    ) -> None:
+        """Batched lookups mix graph reads and one lateral kNN statement."""
+        service = VectorService()
+        a = await self._library_paper(db_session, org, [1.0, 0.0])
+        b = await self._library_paper(db_session, org, [1.0, 0.2])
+        c = await self._library_paper(db_session, org, [0.0, 1.0])
+        await service.refresh_neighbors(db_session, org.id, [a.id], propagate=False)
+
+        results = await service.search_similar_many(
+            db_session,
+            [a.id, b.id, c.id, paper_without_embedding.id],
+            organization_id=org.id,
+            limit=1,
+        )
+
+        assert set(results) == {a.id, b.id, c.id}
+        assert [r["id"] for r in results[a.id]] == [str(b.id)]
+        assert [r["id"] for r in results[b.id]] == [str(a.id)]
+        assert [r["id"] for r in results[c.id]] == [str(b.id)]
+
+
 # ---------------------------------------------------------------------------
 # Delete Operations
 # ---------------------------------------------------------------------------
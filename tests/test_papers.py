@@ -6,6 +6,7 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from paper_scraper.core.index_generation import index_generation
 from paper_scraper.modules.auth.models import Organization, User
 from paper_scraper.modules.papers.models import Paper, PaperSource
 
@@ -199,12 +200,15 @@ class TestPaperEndpoints:
         db_session.add(paper)
         await db_session.flush()
         paper_id = paper.id
+        generation = await index_generation.current(test_user.organization_id)
 
         response = await client.delete(
             f"/api/v1/papers/{paper_id}",
             headers=auth_headers,
         )
         assert response.status_code == 204
+        # Cached search responses are retired once the delete is committed
+        assert await index_generation.current(test_user.organization_id) != generation
 
         # Expire all objects in session to force re-fetch from database
         db_session.expire_all()
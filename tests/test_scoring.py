@@ -104,7 +104,9 @@ def mock_llm_client():
     """Create a mock LLM client."""
     client = AsyncMock()
 
-    async def mock_complete_json(prompt, system=None, temperature=None, max_tokens=None):
+    async def mock_complete_json(
+        prompt, system=None, temperature=None, max_tokens=None, prefix=None
+    ):
         # Determine which dimension based on prompt content
         if "Novelty" in prompt or "novelty" in prompt.lower():
             return mock_llm_response("novelty")
@@ -331,6 +333,129 @@ class TestScoringOrchestrator:
         assert "ip_potential" in result.dimension_results
         assert result.overall_score == 8.0
 
+    @pytest.mark.asyncio
+    async def test_combined_strategy_makes_one_call(self, sample_paper_context):
+        """Test combined scoring asks for all dimensions in a single LLM call."""
+        client = AsyncMock()
+        client.complete_json = AsyncMock(
+            return_value={
+                name: mock_llm_response(name)
+                for name in ["novelty", "ip_potential", "marketability"]
+            }
+        )
+        orchestrator = ScoringOrchestrator(llm_client=client, scoring_strategy="combined")
+
+        result = await orchestrator.score_paper(
+            sample_paper_context,
+            dimensions=["novelty", "ip_potential", "marketability"],
+            dimension_contexts={"ip_potential": "## Patent Landscape\nNo blocking patents."},
+        )
+
+        client.complete_json.assert_awaited_once()
+        prompt = client.complete_json.await_args.kwargs["prompt"]
+        assert prompt.count(sample_paper_context.title) == 1
+        assert "## IP Potential" in prompt
+        assert "No blocking patents." in prompt
+        assert '"marketability": {' in prompt
+        assert result.dimension_results["novelty"].score == 7.5
+        assert result.dimension_results["ip_potential"].details["prior_art_risk"] == "low"
+        assert result.overall_score == 7.33
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_combined_strategy_scores_missing_dimensions_separately(
+        self, sample_paper_context
+    ):
+        """Test dimensions absent from the combined response fall back to their own call."""
+        client = AsyncMock()
+        client.complete_json = AsyncMock(return_value={"novelty": mock_llm_response("novelty")})
+        orchestrator = ScoringOrchestrator(llm_client=client, scoring_strategy="combined")
+        orchestrator.dimensions["feasibility"].score = AsyncMock(
+            return_value=DimensionResult("feasibility", 6.0, 0.7, "Separate call")
+        )
+
+        result = await orchestrator.score_paper(
+            sample_paper_context, dimensions=["novelty", "feasibility"]
+        )
+
+        client.complete_json.assert_awaited_once()
+        orchestrator.dimensions["feasibility"].score.assert_awaited_once()
+        assert result.dimension_results["novelty"].score == 7.5
+        assert result.dimension_results["feasibility"].reasoning == "Separate call"
+
+    @pytest.mark.asyncio
+    async def test_combined_strategy_falls_back_when_call_fails(
+        self, sample_paper_context, mock_llm_client
+    ):
+        """Test a failed combined call scores every dimension individually."""
+        orchestrator = ScoringOrchestrator(llm_client=mock_llm_client, scoring_strategy="combined")
+        per_dimension = mock_llm_client.complete_json
+
+        async def complete_json(prompt, **kwargs):
+            if "panel of expert reviewers" in prompt:
+                raise ValueError("invalid JSON")
+            return await per_dimension(prompt, **kwargs)
+
+        mock_llm_client.complete_json = complete_json
+
+        result = await orchestrator.score_paper(
+            sample_paper_context, dimensions=["novelty", "ip_potential"]
+        )
+
+        assert set(result.dimension_results) == {"novelty", "ip_potential"}
+        assert result.dimension_results["novelty"].score == 7.5
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_dimensions_share_cacheable_prefix(self, sample_paper_context):
+        """Test every dimension call sends the same system prompt and paper prefix."""
+        client = AsyncMock()
+        client.complete_json = AsyncMock(return_value=mock_llm_response("default"))
+        orchestrator = ScoringOrchestrator(llm_client=client)
+        similar = [PaperContext(id=uuid.uuid4(), title="Prior Work", doi="10.1/prior")]
+
+        await orchestrator.score_paper(sample_paper_context, similar_papers=similar)
+
+        calls = [c.kwargs for c in client.complete_json.await_args_list]
+        assert len(calls) == 6
+        assert len({(c["system"], c["prefix"]) for c in calls}) == 1
+        assert sample_paper_context.title in calls[0]["prefix"]
+        assert "10.1/prior" in calls[0]["prefix"]
+        assert all(sample_paper_context.title not in c["prompt"] for c in calls)
+        assert len({c["prompt"] for c in calls}) == 6
+
+    @pytest.mark.asyncio
+    async def test_prefix_shared_when_only_some_dimensions_have_context(
+        self, sample_paper_context
+    ):
+        """Test organization knowledge stays out of the prefix and fills missing contexts."""
+        client = AsyncMock()
+        client.complete_json = AsyncMock(return_value=mock_llm_response("default"))
+        orchestrator = ScoringOrchestrator(llm_client=client)
+        sample_paper_context.knowledge_context = "We focus on AI in healthcare."
+
+        await orchestrator.score_paper(
+            sample_paper_context, dimension_contexts={"novelty": "Novelty context"}
+        )
+
+        calls = [c.kwargs for c in client.complete_json.await_args_list]
+        assert len({c["prefix"] for c in calls}) == 1
+        assert "We focus on AI in healthcare." not in calls[0]["prefix"]
+        with_knowledge = [c for c in calls if "We focus on AI in healthcare." in c["prompt"]]
+        assert len(with_knowledge) == 5
+        assert all("Novelty context" not in c["prompt"] for c in with_knowledge)
+
+    def test_unknown_strategy_rejected(self):
+        """Test the orchestrator rejects unknown scoring strategies."""
+        with pytest.raises(ValueError, match="Unknown scoring strategy"):
+            ScoringOrchestrator(scoring_strategy="batched")
+
+    def test_with_weights_keeps_strategy(self, mock_llm_client):
+        """Test with_weights preserves the scoring strategy."""
+        orchestrator = ScoringOrchestrator(llm_client=mock_llm_client, scoring_strategy="combined")
+
+        assert orchestrator.with_weights(ScoringWeights()).scoring_strategy == "combined"
+
 
 # =============================================================================
 # Schema Tests
@@ -598,6 +723,46 @@ class TestScoringJobEndpoints:
         assert data["items"][0]["total_papers"] == 2
 
 
+class TestScoringModelResolution:
+    """Test which model configuration scoring runs with."""
+
+    @pytest.mark.asyncio
+    async def test_strategy_comes_from_the_resolved_config(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """A strategy set on another workflow's config must not apply to scoring."""
+        from paper_scraper.modules.model_settings.models import ModelConfiguration
+        from paper_scraper.modules.scoring.service import ScoringService
+
+        org_id = test_user.organization_id
+        db_session.add_all(
+            [
+                ModelConfiguration(
+                    organization_id=org_id,
+                    provider="openai",
+                    model_name="text-embedding-3-small",
+                    workflow="embedding",
+                    scoring_strategy="combined",
+                ),
+                ModelConfiguration(
+                    organization_id=org_id,
+                    provider="anthropic",
+                    model_name="claude-sonnet",
+                    workflow="scoring",
+                ),
+            ]
+        )
+        await db_session.flush()
+
+        with patch("paper_scraper.modules.scoring.service.get_llm_client"):
+            _, config = await ScoringService(db_session)._resolve_llm_client(
+                org_id, workflow="scoring"
+            )
+
+        assert config.workflow == "scoring"
+        assert config.scoring_strategy is None
+
+
 # =============================================================================
 # LLM Client Tests
 # =============================================================================
@@ -639,6 +804,96 @@ class TestLLMClient:
         with pytest.raises(ValueError, match="Unknown LLM provider"):
             get_llm_client("invalid_provider")
 
+    @staticmethod
+    def _mock_http(body: dict):
+        """Answer pooled httpx requests with a fixed JSON body."""
+        import httpx
+
+        real_client = httpx.AsyncClient
+        requests: list = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=body)
+
+        def factory(**kwargs):
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        return patch("paper_scraper.core.http_clients.httpx.AsyncClient", side_effect=factory), (
+            requests
+        )
+
+    @pytest.mark.asyncio
+    async def test_anthropic_marks_prefix_for_caching(self):
+        """Test the Anthropic client sets a cache breakpoint after the prefix."""
+        import json
+
+        from paper_scraper.modules.scoring.llm_client import AnthropicClient
+
+        patcher, requests = self._mock_http(
+            {
+                "content": [{"type": "text", "text": "ok"}],
+                "usage": {
+                    "input_tokens": 200,
+                    "output_tokens": 50,
+                    "cache_read_input_tokens": 1500,
+                    "cache_creation_input_tokens": 0,
+                },
+            }
+        )
+        with patcher:
+            response = await AnthropicClient(api_key="test-key").complete_with_usage(
+                prompt="Score novelty", system="System", prefix="## Paper to Evaluate"
+            )
+
+        content = json.loads(requests[0].content)["messages"][0]["content"]
+        assert content[0] == {
+            "type": "text",
+            "text": "## Paper to Evaluate",
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert content[1] == {"type": "text", "text": "Score novelty"}
+        assert response.usage.prompt_tokens == 1700
+        assert response.usage.cached_prompt_tokens == 1500
+        assert response.usage.total_tokens == 1750
+
+    @pytest.mark.asyncio
+    async def test_openai_sends_prefix_first_and_reports_cached_tokens(self):
+        """Test the OpenAI client leads the user message with the prefix."""
+        import json
+
+        from paper_scraper.modules.scoring.llm_client import OpenAIClient
+
+        patcher, requests = self._mock_http(
+            {
+                "choices": [{"message": {"content": "ok"}}],
+                "usage": {
+                    "prompt_tokens": 1800,
+                    "completion_tokens": 40,
+                    "total_tokens": 1840,
+                    "prompt_tokens_details": {"cached_tokens": 1536},
+                },
+            }
+        )
+        with patcher:
+            response = await OpenAIClient(api_key="test-key").complete_with_usage(
+                prompt="Score novelty", system="System", prefix="## Paper to Evaluate"
+            )
+
+        messages = json.loads(requests[0].content)["messages"]
+        assert messages[0] == {"role": "system", "content": "System"}
+        assert messages[1]["content"] == "## Paper to Evaluate\n\nScore novelty"
+        assert response.usage.cached_prompt_tokens == 1536
+
+    def test_cached_tokens_lower_estimated_cost(self):
+        """Test prompt tokens read from the cache are priced below uncached ones."""
+        from paper_scraper.modules.scoring.llm_client import TokenUsage
+
+        uncached = TokenUsage(2000, 100, 2100, "gpt-4o")
+        cached = TokenUsage(2000, 100, 2100, "gpt-4o", cached_prompt_tokens=1500)
+
+        assert cached.estimated_cost_usd < uncached.estimated_cost_usd
+
 
 # =============================================================================
 # PaperContext Tests
@@ -683,3 +938,434 @@ class TestPaperContext:
         assert context.title == "Minimal Paper"
         assert context.abstract is None
         assert context.keywords == []
+
+
+# =============================================================================
+# Query Embedding Cache Tests
+# =============================================================================
+
+
+class TestQueryEmbeddingCache:
+    """Test the two-tier query embedding cache used by EmbeddingClient."""
+
+    @staticmethod
+    def _make_cache(**kwargs):
+        import fakeredis.aioredis
+
+        from paper_scraper.modules.scoring.embeddings import QueryEmbeddingCache
+
+        cache = QueryEmbeddingCache(**kwargs)
+        fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        cache._get_redis = AsyncMock(return_value=fake)
+        return cache
+
+    def test_key_normalizes_whitespace_only(self):
+        """Queries differing only in spacing share a key; case still matters."""
+        from paper_scraper.modules.scoring.embeddings import QueryEmbeddingCache
+
+        a = QueryEmbeddingCache.make_key("m", "  CRISPR   gene editing ")
+        b = QueryEmbeddingCache.make_key("m", "CRISPR gene editing")
+        c = QueryEmbeddingCache.make_key("other-model", "CRISPR gene editing")
+        d = QueryEmbeddingCache.make_key("m", "crispr gene editing")
+
+        assert a == b
+        assert a != c
+        assert a != d
+
+    @pytest.mark.asyncio
+    async def test_embed_text_reuses_cached_vector(self):
+        """A repeated query should be served from the LRU without an API call."""
+        from paper_scraper.modules.scoring.embeddings import EmbeddingClient
+
+        cache = self._make_cache()
+        client = EmbeddingClient(api_key="test", cache=cache)
+        client.embed_texts = AsyncMock(return_value=[[0.5] * 8])
+
+        first = await client.embed_text("quantum sensors")
+        second = await client.embed_text(" quantum  sensors")
+
+        assert first == second
+        client.embed_texts.assert_awaited_once()
+        assert cache.stats()["local_hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_serves_after_local_eviction(self):
+        """Vectors dropped from the LRU should still come back from Redis."""
+        cache = self._make_cache()
+        await cache.set("m", "query", [0.25, -0.5, 1.0])
+        cache.clear_local()
+
+        vector = await cache.get("m", "query")
+
+        assert vector == [0.25, -0.5, 1.0]
+        assert cache.stats()["redis_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_respects_size_cap(self):
+        """The in-process tier should evict least recently used entries."""
+        cache = self._make_cache(max_entries=2)
+        await cache.set("m", "a", [1.0])
+        await cache.set("m", "b", [2.0])
+        await cache.set("m", "c", [3.0])
+
+        assert cache.stats()["local_size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_fails_open(self):
+        """A Redis outage should be treated as a cache miss."""
+        from paper_scraper.modules.scoring.embeddings import QueryEmbeddingCache
+
+        cache = QueryEmbeddingCache()
+        cache._get_redis = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        assert await cache.get("m", "query") is None
+        await cache.set("m", "query", [1.0])
+        assert await cache.get("m", "query") == [1.0]
+
+
+# =============================================================================
+# Embedding Client Batching Tests
+# =============================================================================
+
+
+class TestEmbeddingClientBatching:
+    """Test token-aware batching and retries in EmbeddingClient."""
+
+    def test_plan_batches_respects_token_and_input_limits(self):
+        """Batches should close before exceeding either per-request limit."""
+        from paper_scraper.modules.scoring.embeddings import EmbeddingClient
+
+        with patch("paper_scraper.modules.scoring.embeddings.settings") as mock_settings:
+            mock_settings.EMBEDDING_MAX_BATCH_INPUTS = 3
+            mock_settings.EMBEDDING_MAX_BATCH_TOKENS = 100
+
+            batches = EmbeddingClient._plan_batches([40, 40, 40, 10, 10, 10, 10, 500])
+
+        assert batches == [(0, 2), (2, 5), (5, 7), (7, 8)]
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_preserves_order_across_sub_batches(self):
+        """Concurrent sub-batches should be reassembled in input order."""
+        from paper_scraper.modules.scoring.embeddings import EmbeddingClient
+
+        client = EmbeddingClient(api_key="test")
+
+        async def fake_request(inputs: list[str]) -> list[list[float]]:
+            return [[float(text)] for text in inputs]
+
+        client._request_embeddings = AsyncMock(side_effect=fake_request)
+
+        with patch("paper_scraper.modules.scoring.embeddings.settings") as mock_settings:
+            mock_settings.EMBEDDING_MAX_INPUT_TOKENS = 8191
+            mock_settings.EMBEDDING_MAX_BATCH_INPUTS = 2
+            mock_settings.EMBEDDING_MAX_BATCH_TOKENS = 300_000
+            mock_settings.EMBEDDING_MAX_CONCURRENT_REQUESTS = 2
+
+            result = await client.embed_texts([str(i) for i in range(5)])
+
+        assert result == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+        assert client._request_embeddings.await_count == 3
+
+    def test_retry_after_header_parsing(self):
+        """Retry-After seconds and retry-after-ms should both be understood."""
+        import httpx
+
+        from paper_scraper.modules.scoring.llm_client import _retry_after_seconds
+
+        assert _retry_after_seconds(httpx.Response(429, headers={"retry-after": "7"})) == 7.0
+        assert _retry_after_seconds(httpx.Response(429, headers={"retry-after-ms": "250"})) == 0.25
+        assert _retry_after_seconds(httpx.Response(429)) is None
+
+    @pytest.mark.asyncio
+    async def test_retry_with_backoff_honors_retry_after(self):
+        """A 429 with Retry-After should wait at least the requested delay."""
+        import httpx
+
+        from paper_scraper.modules.scoring.llm_client import retry_with_backoff
+
+        request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+        throttled = httpx.Response(429, headers={"retry-after": "4"}, request=request)
+        func = AsyncMock(
+            side_effect=[
+                httpx.HTTPStatusError("429", request=request, response=throttled),
+                {"ok": True},
+            ]
+        )
+
+        with patch(
+            "paper_scraper.modules.scoring.llm_client.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            result = await retry_with_backoff(func, base_delay=0.1)
+
+        assert result == {"ok": True}
+        assert sleep.await_args.args[0] >= 4.0
+
+    @pytest.mark.asyncio
+    async def test_requests_configured_dimensions(self):
+        """Shortened dimensions are requested and keep cache/store keys apart."""
+        from contextlib import asynccontextmanager
+
+        from paper_scraper.modules.scoring.embeddings import EmbeddingClient
+
+        http = MagicMock()
+        http.post = AsyncMock(
+            return_value=MagicMock(json=lambda: {"data": [{"index": 0, "embedding": [0.5] * 4}]})
+        )
+
+        @asynccontextmanager
+        async def fake_client(*args, **kwargs):
+            yield http
+
+        client = EmbeddingClient(api_key="test", model="text-embedding-3-small", dimensions=4)
+        with patch(
+            "paper_scraper.modules.scoring.embeddings.HTTPClientManager.get_client",
+            new=fake_client,
+        ):
+            assert await client._request_embeddings(["text"]) == [[0.5] * 4]
+
+        assert http.post.await_args.kwargs["json"]["dimensions"] == 4
+        assert client.model_key == "text-embedding-3-small@4"
+        assert EmbeddingClient(api_key="test", model="text-embedding-ada-002").model_key == (
+            "text-embedding-ada-002"
+        )
+
+
+# =============================================================================
+# Dimension Context Builder Tests
+# =============================================================================
+
+
+class TestDimensionContextBuilderSources:
+    """Test concurrent context source fetching in DimensionContextBuilder."""
+
+    @staticmethod
+    def _make_builder():
+        from paper_scraper.modules.scoring.dimension_context_builder import (
+            DimensionContextBuilder,
+        )
+
+        builder = DimensionContextBuilder(MagicMock())
+        builder._get_snapshot_data = AsyncMock(return_value={})
+        builder._get_knowledge_sources = AsyncMock(return_value=[])
+        return builder
+
+    @staticmethod
+    def _make_paper():
+        return MagicMock(id=uuid.uuid4(), keywords=["sensors"])
+
+    @pytest.mark.asyncio
+    async def test_external_sources_run_concurrently(self):
+        """Total latency should track the slowest source, not the sum."""
+        import asyncio
+        import time
+
+        from paper_scraper.modules.scoring.author_profile_client import AuthorProfileResult
+        from paper_scraper.modules.scoring.citation_graph import CitationGraph
+        from paper_scraper.modules.scoring.jstor_client import JstorSearchResult
+
+        def slow(value):
+            async def fetch(_paper):
+                await asyncio.sleep(0.1)
+                return value
+
+            return fetch
+
+        builder = self._make_builder()
+        builder._get_citation_graph = slow(CitationGraph())
+        builder._get_jstor_references = slow(JstorSearchResult())
+        builder._get_author_profiles = slow(AuthorProfileResult())
+
+        started = time.perf_counter()
+        result = await builder.build_all(self._make_paper(), uuid.uuid4(), dimensions=["novelty"])
+
+        assert time.perf_counter() - started < 0.25
+        timings = result.metadata["_source_timings"]
+        assert set(timings) == {
+            "snapshot",
+            "knowledge",
+            "citation_graph",
+            "jstor",
+            "author_profiles",
+        }
+        assert timings["jstor"]["latency_ms"] >= 100
+
+    @pytest.mark.asyncio
+    async def test_timed_out_source_falls_back_to_empty(self):
+        """A source exceeding its timeout should be skipped, not fail the build."""
+        import asyncio
+
+        from paper_scraper.modules.scoring.author_profile_client import AuthorProfileResult
+        from paper_scraper.modules.scoring.citation_graph import CitationGraph
+
+        async def hang(_paper):
+            await asyncio.sleep(10)
+
+        builder = self._make_builder()
+        builder._get_citation_graph = AsyncMock(return_value=CitationGraph())
+        builder._get_jstor_references = hang
+        builder._get_author_profiles = AsyncMock(return_value=AuthorProfileResult())
+
+        with patch(
+            "paper_scraper.modules.scoring.dimension_context_builder.settings."
+            "SCORING_CONTEXT_JSTOR_TIMEOUT_SECONDS",
+            0.05,
+        ):
+            result = await builder.build_all(
+                self._make_paper(), uuid.uuid4(), dimensions=["novelty"]
+            )
+
+        assert result.metadata["_source_timings"]["jstor"]["timed_out"] is True
+        assert result.metadata["novelty"]["has_jstor"] is False
+        assert "_jstor_references" not in result.metadata
+
+    @pytest.mark.asyncio
+    async def test_source_timings_stored_with_score(self):
+        """Per-source latency should land in the persisted score metadata."""
+        from paper_scraper.modules.scoring.service import ScoringService
+
+        db = MagicMock(commit=AsyncMock(), refresh=AsyncMock())
+        timings = {"jstor": {"latency_ms": 120.0, "timed_out": False}}
+        result = MagicMock(dimension_results={}, errors=[])
+
+        with patch(
+            "paper_scraper.modules.scoring.service.index_generation.bump", new=AsyncMock()
+        ):
+            score = await ScoringService(db)._save_score(
+                MagicMock(id=uuid.uuid4()), uuid.uuid4(), result, source_timings=timings
+            )
+
+        assert score.dimension_details["_metadata"]["source_timings"] == timings
+
+
+# =============================================================================
+# Enrichment Cache Tests
+# =============================================================================
+
+
+class TestEnrichmentCache:
+    """Test the shared enrichment cache in front of the external clients."""
+
+    @staticmethod
+    def _mock_http(handler):
+        """Route pooled httpx clients through a mock transport."""
+        import httpx
+
+        real_client = httpx.AsyncClient
+        requests: list = []
+
+        def record(request):
+            requests.append(request)
+            return handler(request)
+
+        def factory(**kwargs):
+            return real_client(transport=httpx.MockTransport(record), **kwargs)
+
+        return patch("paper_scraper.core.http_clients.httpx.AsyncClient", side_effect=factory), (
+            requests
+        )
+
+    @pytest.mark.asyncio
+    async def test_rescoring_makes_no_outbound_citation_calls(self):
+        """A fresh cache should serve the whole citation graph."""
+        import httpx
+
+        from paper_scraper.modules.scoring.citation_graph import fetch_citation_graph
+
+        def handler(request):
+            params = request.url.params
+            if request.url.path.startswith("/works/doi:"):
+                return httpx.Response(200, json={"id": "https://openalex.org/W1"})
+            if params["filter"].startswith("cites:"):
+                works = [{"id": "https://openalex.org/W9", "title": "Citing"}]
+                return httpx.Response(200, json={"meta": {"count": 1}, "results": works})
+            works = [{"id": "https://openalex.org/W2", "title": "Referenced"}]
+            return httpx.Response(200, json={"results": works})
+
+        patcher, requests = self._mock_http(handler)
+        raw = {"referenced_works": ["https://openalex.org/W2", "https://openalex.org/W3"]}
+        with patcher:
+            first = await fetch_citation_graph(paper_doi="10.1234/ABC", raw_metadata=raw)
+            calls = len(requests)
+            second = await fetch_citation_graph(paper_doi="10.1234/abc", raw_metadata=raw)
+
+        assert calls == 3
+        assert len(requests) == calls
+        assert second == first
+        assert [r.title for r in second.references] == ["Referenced"]
+        assert second.total_citing == 1
+
+    @pytest.mark.asyncio
+    async def test_orcid_miss_is_cached_but_errors_are_not(self):
+        """A 404 should be cached as a negative entry; a 5xx should be retried."""
+        import httpx
+
+        from paper_scraper.modules.scoring.author_profile_client import _fetch_orcid_profile
+
+        statuses = {"0000-0001-2345-6789": 404, "0000-0002-2345-6789": 503}
+
+        def handler(request):
+            return httpx.Response(statuses[request.url.path.split("/")[-2]])
+
+        patcher, requests = self._mock_http(handler)
+        with patcher:
+            for _ in range(2):
+                assert await _fetch_orcid_profile("0000-0001-2345-6789") is None
+                assert await _fetch_orcid_profile("0000-0002-2345-6789") is None
+
+        paths = [r.url.path for r in requests]
+        assert sum("0000-0001" in p for p in paths) == 1
+        assert sum("0000-0002" in p for p in paths) == 2
+
+    @pytest.mark.asyncio
+    async def test_github_match_is_cached_per_affiliation(self):
+        """A cached match for one affiliation must not answer for another."""
+        import httpx
+
+        from paper_scraper.modules.scoring.author_profile_client import _search_github_user
+
+        def handler(request):
+            return httpx.Response(200, json={"items": []})
+
+        patcher, requests = self._mock_http(handler)
+        with patcher:
+            assert await _search_github_user("J. Smith", ["MIT", "CERN"]) is None
+            assert await _search_github_user("j.  smith", ["cern", "MIT"]) is None
+            assert await _search_github_user("J. Smith", ["ETH Zurich"]) is None
+
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_prewarm_batches_reference_works(self):
+        """Pre-warming should fetch references for many papers in one request."""
+        import httpx
+
+        from paper_scraper.modules.scoring.citation_graph import (
+            _fetch_works_batch,
+            prewarm_citation_graphs,
+        )
+
+        def handler(request):
+            params = request.url.params
+            if params["filter"].startswith("cites:"):
+                return httpx.Response(200, json={"meta": {"count": 0}, "results": []})
+            ids = params["filter"].removeprefix("openalex:").split("|")
+            works = [{"id": wid, "title": wid.rsplit("/", 1)[-1]} for wid in ids]
+            return httpx.Response(200, json={"results": works})
+
+        papers = [
+            (None, f"https://openalex.org/W{i}", {"referenced_works": [f"W{100 + i}", "W999"]})
+            for i in range(1, 6)
+        ]
+        patcher, requests = self._mock_http(handler)
+        with patcher:
+            stats = await prewarm_citation_graphs(papers)
+            work_requests = [r for r in requests if "openalex:" in r.url.params["filter"]]
+            calls = len(requests)
+            works = await _fetch_works_batch(["W101", "W999"])
+
+        assert stats == {"papers": 5, "works": 6, "citing": 5}
+        assert len(work_requests) == 1
+        assert len(requests) == calls
+        assert [w.title for w in works] == ["W101", "W999"]
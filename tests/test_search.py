@@ -375,49 +375,62 @@ class TestSearchService:
         assert count == 5
 
     @pytest.mark.asyncio
-    async def test_get_latest_scores(
+    async def test_hydrate_results_single_query(
         self,
         db_session: AsyncSession,
         test_user: User,
     ):
-        """Test fetching latest scores for papers."""
+        """Hydration returns papers in rank order with latest score and has_score filter."""
+        from paper_scraper.modules.search.schemas import SearchFilters
         from paper_scraper.modules.search.service import SearchService
 
         service = SearchService(db_session)
 
-        # Create a paper
-        paper = Paper(
+        scored = Paper(
             organization_id=test_user.organization_id,
-            title="Scored Paper",
+            title="Scored",
             source=PaperSource.MANUAL,
         )
-        db_session.add(paper)
-        await db_session.flush()
-
-        # Create scores
-        old_score = PaperScore(
-            paper_id=paper.id,
+        unscored = Paper(
             organization_id=test_user.organization_id,
-            novelty=5.0,
-            ip_potential=5.0,
-            marketability=5.0,
-            feasibility=5.0,
-            commercialization=5.0,
-            overall_score=5.0,
-            overall_confidence=0.8,
-            model_version="test-v1",
-            weights={},
-            dimension_details={},
-            errors=[],
-        )
-        db_session.add(old_score)
+            title="Unscored",
+            source=PaperSource.MANUAL,
+        )
+        db_session.add_all([scored, unscored])
         await db_session.flush()
+        for overall in (4.0, 7.0):
+            db_session.add(
+                PaperScore(
+                    paper_id=scored.id,
+                    organization_id=test_user.organization_id,
+                    novelty=overall,
+                    ip_potential=overall,
+                    marketability=overall,
+                    feasibility=overall,
+                    commercialization=overall,
+                    overall_score=overall,
+                    overall_confidence=0.8,
+                    model_version="test-v1",
+                    weights={},
+                    dimension_details={},
+                    errors=[],
+                )
+            )
+            await db_session.flush()
 
-        # Fetch scores
-        scores_map = await service._get_latest_scores([paper.id], test_user.organization_id)
-
-        assert paper.id in scores_map
-        assert scores_map[paper.id].overall_score == 5.0
+        hydrated = await service._hydrate_results(
+            [unscored.id, scored.id], test_user.organization_id
+        )
+        assert [paper.id for paper, _ in hydrated] == [unscored.id, scored.id]
+        assert hydrated[0][1] is None
+        assert hydrated[1][1] is not None
+
+        only_scored = await service._hydrate_results(
+            [unscored.id, scored.id],
+            test_user.organization_id,
+            filters=SearchFilters(has_score=True),
+        )
+        assert [paper.id for paper, _ in only_scored] == [scored.id]
 
 
 class TestSearchTenantIsolation:
@@ -563,6 +576,404 @@ class TestHybridSearchRRF:
         request_balanced = SearchRequest(query="test", mode=SearchMode.HYBRID, semantic_weight=0.5)
         assert request_balanced.semantic_weight == 0.5
 
+    @staticmethod
+    def _result_item(paper_id: uuid.UUID, **kwargs):
+        from paper_scraper.modules.search.schemas import SearchResultItem
+
+        return SearchResultItem(
+            id=paper_id,
+            title="Paper",
+            source=PaperSource.OPENALEX,
+            created_at=datetime(2024, 1, 1),
+            **kwargs,
+        )
+
+    @classmethod
+    def _hydrate_entries(cls, entries, *args, **kwargs):
+        return [
+            cls._result_item(
+                uuid.UUID(e["id"]),
+                relevance_score=e["r"],
+                text_score=e["t"],
+                semantic_score=e["s"],
+            )
+            for e in entries
+        ]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_fuses_ids_then_hydrates_only_the_page(self):
+        """Legs are fused on IDs; only the requested page reaches hydration."""
+        from paper_scraper.modules.search.service import SearchService
+
+        shared, text_only, semantic_only = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        service._typesense_query = AsyncMock(
+            return_value=(
+                [text_only, shared],
+                {
+                    text_only: {"text_score": 10**6, "highlights": []},
+                    shared: {"text_score": 10**6, "highlights": []},
+                },
+                2,
+            )
+        )
+        service._semantic_leg = AsyncMock(
+            return_value=[
+                {"id": str(shared), "score": 0.9},
+                {"id": str(semantic_only), "score": 0.8},
+            ]
+        )
+        service._hydrate_fused_entries = AsyncMock(side_effect=self._hydrate_entries)
+
+        items, total, degraded, _ = await service._hybrid_search(
+            query="test",
+            organization_id=uuid.uuid4(),
+            filters=None,
+            page=1,
+            page_size=1,
+        )
+
+        assert total == 3
+        assert degraded is False
+        assert [item.id for item in items] == [shared]
+        assert items[0].text_score is not None and items[0].semantic_score == 0.9
+        hydrated = service._hydrate_fused_entries.await_args.args[0]
+        assert [entry["id"] for entry in hydrated] == [str(shared)]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_degrades_when_fulltext_leg_fails(self):
+        """A failing Typesense leg should yield semantic-only results flagged degraded."""
+        from paper_scraper.modules.search.service import SearchService
+
+        paper_id = uuid.uuid4()
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        service._typesense_query = AsyncMock(side_effect=TimeoutError())
+        service._semantic_leg = AsyncMock(return_value=[{"id": str(paper_id), "score": 0.9}])
+        service._hydrate_fused_entries = AsyncMock(side_effect=self._hydrate_entries)
+
+        items, total, degraded, _ = await service._hybrid_search(
+            query="test",
+            organization_id=uuid.uuid4(),
+            filters=None,
+            page=1,
+            page_size=10,
+        )
+
+        assert degraded is True
+        assert total == 1
+        assert [item.id for item in items] == [paper_id]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_degrades_when_semantic_leg_fails(self):
+        """A failing embedding/pgvector leg should yield full-text-only results."""
+        from paper_scraper.modules.search.service import SearchService
+
+        paper_id = uuid.uuid4()
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        service._typesense_query = AsyncMock(return_value=([paper_id], {paper_id: {}}, 1))
+        service._semantic_leg = AsyncMock(side_effect=RuntimeError("OpenAI down"))
+        service._hydrate_fused_entries = AsyncMock(side_effect=self._hydrate_entries)
+
+        items, total, degraded, _ = await service._hybrid_search(
+            query="test",
+            organization_id=uuid.uuid4(),
+            filters=None,
+            page=1,
+            page_size=10,
+        )
+
+        assert degraded is True
+        assert [item.id for item in items] == [paper_id]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_raises_when_both_legs_fail(self):
+        """If neither backend answers there is nothing to degrade to."""
+        from paper_scraper.modules.search.service import SearchService
+
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        service._typesense_query = AsyncMock(side_effect=RuntimeError("Typesense down"))
+        service._semantic_leg = AsyncMock(side_effect=RuntimeError("OpenAI down"))
+
+        with pytest.raises(RuntimeError, match="Typesense down"):
+            await service._hybrid_search(
+                query="test",
+                organization_id=uuid.uuid4(),
+                filters=None,
+                page=1,
+                page_size=10,
+            )
+
+
+class TestSearchCursorPagination:
+    """Test keyset cursor pagination for semantic and hybrid search."""
+
+    @staticmethod
+    def _vector_hit(paper_id: uuid.UUID, distance: float) -> dict:
+        return {"id": str(paper_id), "score": 1 - distance, "distance": distance}
+
+    @pytest.mark.asyncio
+    async def test_semantic_cursor_continues_after_last_row(self):
+        """Cursor pages run a keyset query of page_size + 1 rows after the last hit."""
+        from paper_scraper.modules.search.service import SearchService
+
+        ids = [uuid.uuid4() for _ in range(3)]
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        service.embedding_client.embed_text = AsyncMock(return_value=[0.1] * 1536)
+        service._vector_query = AsyncMock(
+            return_value=[
+                self._vector_hit(ids[0], 0.1),
+                self._vector_hit(ids[1], 0.2),
+                self._vector_hit(ids[2], 0.3),
+            ]
+        )
+        service._build_semantic_items = AsyncMock(
+            side_effect=lambda hits, **_: [
+                TestHybridSearchRRF._result_item(uuid.UUID(h["id"])) for h in hits
+            ]
+        )
+
+        request = SearchRequest(query="q", mode=SearchMode.SEMANTIC, page_size=2)
+        first = await service.search(request, organization_id=uuid.uuid4())
+
+        assert [item.id for item in first.items] == ids[:2]
+        assert first.next_cursor is not None
+
+        service._vector_query.return_value = [self._vector_hit(ids[2], 0.3)]
+        second = await service.search(
+            request.model_copy(update={"cursor": first.next_cursor}),
+            organization_id=uuid.uuid4(),
+        )
+
+        kwargs = service._vector_query.await_args.kwargs
+        assert kwargs["limit"] == 3
+        assert kwargs["after"] == (0.2, ids[1])
+        assert [item.id for item in second.items] == [ids[2]]
+        assert second.page == 2
+        assert second.total == 3
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_rejected_for_different_query(self):
+        """A cursor cannot be replayed against another search."""
+        from paper_scraper.core.exceptions import ValidationError
+        from paper_scraper.modules.search.cursor import encode_cursor, request_fingerprint
+        from paper_scraper.modules.search.service import SearchService
+
+        issued_for = SearchRequest(query="first", mode=SearchMode.SEMANTIC)
+        cursor = encode_cursor({"fp": request_fingerprint(issued_for), "p": 2})
+
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        with pytest.raises(ValidationError):
+            await service.search(
+                SearchRequest(query="second", mode=SearchMode.SEMANTIC, cursor=cursor),
+                organization_id=uuid.uuid4(),
+            )
+
+    @pytest.mark.asyncio
+    async def test_hybrid_cursor_pages_from_cached_fusion(self):
+        """Later hybrid pages reuse the cached fused list instead of re-running legs."""
+        from paper_scraper.modules.search.service import SearchService
+
+        org_id = uuid.uuid4()
+        ids = [uuid.uuid4() for _ in range(3)]
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        service._typesense_query = AsyncMock(return_value=([], {}, 0))
+        service._semantic_leg = AsyncMock(
+            return_value=[{"id": str(pid), "score": 0.9 - n / 10} for n, pid in enumerate(ids)]
+        )
+        service._hydrate_fused_entries = AsyncMock(side_effect=TestHybridSearchRRF._hydrate_entries)
+
+        items, total, _, next_state = await service._hybrid_search(
+            query="q", organization_id=org_id, filters=None, page=1, page_size=2
+        )
+        assert [item.id for item in items] == ids[:2]
+        assert total == 3
+        assert next_state is not None and next_state["o"] == 2
+
+        service._typesense_query.reset_mock()
+        service._semantic_leg.reset_mock()
+        items, total, _, next_state = await service._hybrid_search(
+            query="q",
+            organization_id=org_id,
+            filters=None,
+            page=2,
+            page_size=2,
+            cursor=next_state,
+        )
+
+        service._typesense_query.assert_not_awaited()
+        service._semantic_leg.assert_not_awaited()
+        assert [item.id for item in items] == [ids[2]]
+        assert total == 3
+        assert next_state is None
+
+
+class TestSearchResponseCache:
+    """Test the generation-keyed search response cache."""
+
+    @staticmethod
+    def _service(ids: list[uuid.UUID]):
+        from paper_scraper.modules.search.service import SearchService
+
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        service._fulltext_search = AsyncMock(
+            return_value=([TestHybridSearchRRF._result_item(pid) for pid in ids], len(ids))
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeat_search_served_from_cache(self):
+        """An identical request in the same generation skips the backends."""
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        org_id = uuid.uuid4()
+        service = self._service(ids)
+        request = SearchRequest(query="q", mode=SearchMode.FULLTEXT)
+
+        first = await service.search(request, organization_id=org_id)
+        second = await service.search(request, organization_id=org_id)
+
+        service._fulltext_search.assert_awaited_once()
+        assert [item.id for item in second.items] == [item.id for item in first.items]
+        assert second.total == 2
+
+        # Other tenants never share entries
+        await service.search(request, organization_id=uuid.uuid4())
+        assert service._fulltext_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generation_bump_invalidates_cached_responses(self):
+        """Index writes for a tenant retire its cached responses."""
+        from paper_scraper.core.index_generation import index_generation
+
+        org_id = uuid.uuid4()
+        service = self._service([uuid.uuid4()])
+        library = SearchRequest(query="q", mode=SearchMode.FULLTEXT)
+        catalog = SearchRequest(query="q", mode=SearchMode.FULLTEXT, scope="catalog")
+
+        await service.search(library, organization_id=org_id)
+        await service.search(catalog, organization_id=org_id)
+        await index_generation.bump(org_id)
+        await service.search(library, organization_id=org_id)
+        assert service._fulltext_search.await_count == 3
+
+        # Global catalog writes only affect catalog-scoped searches
+        await service.search(catalog, organization_id=org_id)
+        await index_generation.bump(None)
+        await service.search(library, organization_id=org_id)
+        await service.search(catalog, organization_id=org_id)
+        assert service._fulltext_search.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_degraded_responses_are_not_cached(self):
+        """A hybrid response missing a backend is recomputed next time."""
+        from paper_scraper.modules.search.service import SearchService
+
+        service = SearchService(MagicMock(), vector=MagicMock(), search_engine=MagicMock())
+        service._hybrid_search = AsyncMock(return_value=([], 0, True, None))
+        request = SearchRequest(query="q")
+        org_id = uuid.uuid4()
+
+        await service.search(request, organization_id=org_id)
+        await service.search(request, organization_id=org_id)
+
+        assert service._hybrid_search.await_count == 2
+
+
+class TestSearchOutbox:
+    """Test the transactional search outbox and its indexer."""
+
+    @staticmethod
+    def _patch_session(monkeypatch: pytest.MonkeyPatch, db_session: AsyncSession) -> None:
+        from contextlib import asynccontextmanager
+
+        @asynccontextmanager
+        async def fake_db_session():
+            yield db_session
+
+        monkeypatch.setattr("paper_scraper.core.search_outbox.get_db_session", fake_db_session)
+
+    @pytest.mark.asyncio
+    async def test_drain_coalesces_entries_per_paper(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Repeated changes to a paper become one upsert; gone papers are deleted."""
+        from sqlalchemy import func, select
+
+        from paper_scraper.core.search_outbox import (
+            OUTBOX_DELETE,
+            SearchIndexer,
+            enqueue_paper_sync,
+        )
+        from paper_scraper.modules.search.models import SearchOutboxEntry
+
+        paper = Paper(
+            organization_id=test_user.organization_id,
+            title="Outbox paper",
+            source=PaperSource.MANUAL,
+        )
+        db_session.add(paper)
+        await db_session.flush()
+        deleted_id = uuid.uuid4()
+        await enqueue_paper_sync(db_session, [paper.id])
+        await enqueue_paper_sync(db_session, [paper.id])
+        await enqueue_paper_sync(
+            db_session, [deleted_id], OUTBOX_DELETE, organization_id=test_user.organization_id
+        )
+        self._patch_session(monkeypatch, db_session)
+
+        search = AsyncMock()
+        search.index_papers_batch.return_value = [{"success": True}]
+        stats = await SearchIndexer(search=search, generations=AsyncMock()).drain()
+
+        assert stats == {"entries": 3, "indexed": 1, "deleted": 1, "failed": 0}
+        documents = search.index_papers_batch.call_args[0][0]
+        assert [d["id"] for d in documents] == [str(paper.id)]
+        search.delete_papers.assert_awaited_once_with([str(deleted_id)])
+        remaining = await db_session.scalar(select(func.count()).select_from(SearchOutboxEntry))
+        assert remaining == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_rescheduled(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """A failed import keeps the entry with its error and a backoff."""
+        from sqlalchemy import select
+
+        from paper_scraper.core.search_outbox import SearchIndexer, enqueue_paper_sync
+        from paper_scraper.modules.search.models import SearchOutboxEntry
+
+        paper = Paper(
+            organization_id=test_user.organization_id,
+            title="Unlucky paper",
+            source=PaperSource.MANUAL,
+        )
+        db_session.add(paper)
+        await db_session.flush()
+        await enqueue_paper_sync(db_session, [paper.id])
+        self._patch_session(monkeypatch, db_session)
+
+        search = AsyncMock()
+        search.index_papers_batch.return_value = [{"success": False, "error": "boom"}]
+        generations = AsyncMock()
+        stats = await SearchIndexer(search=search, generations=generations).drain()
+
+        assert stats["failed"] == 1
+        generations.bump.assert_not_awaited()
+        entry = (await db_session.execute(select(SearchOutboxEntry))).scalar_one()
+        assert entry.attempts == 1
+        assert entry.last_error == "boom"
+        # Not due again until the backoff passes
+        assert (await SearchIndexer(search=search).drain_batch())["entries"] == 0
+        lag = await SearchIndexer.lag()
+        assert lag["pending"] == 1
+        assert lag["retrying"] == 1
+
 
 class TestBackfillEmbeddings:
     """Test embedding backfill functionality."""
@@ -628,27 +1039,20 @@ class TestBackfillEmbeddings:
             db_session.add(paper)
         await db_session.flush()
 
-        async def failing_batch(*args, **kwargs):
-            raise Exception("Batch API error")
+        single_calls = 0
 
-        call_count = 0
-
-        async def partial_single(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 2:
+        async def failing_batch_partial_single(texts, *args, **kwargs):
+            nonlocal single_calls
+            if len(texts) > 1:
+                raise Exception("Batch API error")
+            single_calls += 1
+            if single_calls == 2:
                 raise Exception("Single API error")
-            return [0.1] * 1536
+            return [[0.1] * 1536]
 
-        with (
-            patch(
-                "paper_scraper.modules.embeddings.service.EmbeddingClient.embed_texts",
-                side_effect=failing_batch,
-            ),
-            patch(
-                "paper_scraper.modules.embeddings.service.EmbeddingClient.embed_text",
-                side_effect=partial_single,
-            ),
+        with patch(
+            "paper_scraper.modules.embeddings.service.EmbeddingClient.embed_texts",
+            side_effect=failing_batch_partial_single,
         ):
             result = await service.backfill_embeddings(
                 organization_id=test_user.organization_id,
@@ -661,3 +1065,164 @@ class TestBackfillEmbeddings:
         assert result.papers_failed == 1
         assert len(result.errors) >= 1
         assert any("Single API error" in message for message in result.errors)
+
+    @pytest.mark.asyncio
+    async def test_backfill_reuses_stored_embeddings_for_duplicate_content(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        """Identical paper text is embedded once and served from the store afterwards."""
+        from paper_scraper.modules.embeddings.service import EmbeddingService
+
+        for _ in range(2):
+            db_session.add(
+                Paper(
+                    organization_id=test_user.organization_id,
+                    title="Duplicated paper",
+                    abstract="Same abstract imported twice",
+                    source=PaperSource.MANUAL,
+                )
+            )
+        await db_session.flush()
+
+        embed_texts = AsyncMock(side_effect=lambda texts: [[0.2] * 1536 for _ in texts])
+        with patch(
+            "paper_scraper.modules.embeddings.service.EmbeddingClient.embed_texts",
+            new=embed_texts,
+        ):
+            service = EmbeddingService(db_session)
+            result = await service.backfill_for_organization(test_user.organization_id)
+
+            assert result.papers_succeeded == 2
+            assert embed_texts.await_count == 1
+            assert len(embed_texts.await_args.args[0]) == 1
+
+            # A later copy of the same literature needs no API call at all
+            db_session.add(
+                Paper(
+                    organization_id=test_user.organization_id,
+                    title="Duplicated paper",
+                    abstract="Same abstract imported twice",
+                    source=PaperSource.MANUAL,
+                )
+            )
+            await db_session.flush()
+            result = await service.backfill_for_organization(test_user.organization_id)
+
+        assert result.papers_succeeded == 1
+        assert embed_texts.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_for_paper_schedules_neighbor_refresh(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        """A single new embedding queues its neighbour-graph refresh after committing."""
+        from paper_scraper.modules.embeddings.service import EmbeddingService
+
+        paper = Paper(
+            organization_id=test_user.organization_id,
+            title="Freshly scored paper",
+            source=PaperSource.MANUAL,
+        )
+        db_session.add(paper)
+        await db_session.flush()
+
+        with (
+            patch(
+                "paper_scraper.modules.embeddings.service.EmbeddingClient.embed_texts",
+                new=AsyncMock(return_value=[[0.3] * 1536]),
+            ),
+            patch("paper_scraper.jobs.neighbors.schedule_neighbor_update") as schedule,
+        ):
+            generated = await EmbeddingService(db_session).generate_for_paper(
+                paper.id, test_user.organization_id
+            )
+
+        assert generated is True
+        schedule.assert_awaited_once_with([paper.id])
+
+
+class TestBulkEmbedPipeline:
+    """Test the bulk embedding pipeline and its resume checkpoint."""
+
+    def test_checkpoint_advances_over_contiguous_batches(self):
+        """Batches finishing out of order only move the checkpoint once contiguous."""
+        from paper_scraper.jobs.bulk_embed import _ContiguousCheckpoint
+
+        ids = [uuid.uuid4() for _ in range(3)]
+        checkpoint = _ContiguousCheckpoint()
+
+        assert checkpoint.complete(1, ids[1]) is None
+        assert checkpoint.complete(0, ids[0]) == ids[1]
+        assert checkpoint.complete(2, ids[2]) == ids[2]
+
+    def test_failed_batch_pins_checkpoint(self):
+        """Nothing at or after a failed batch may become the resume point."""
+        from paper_scraper.jobs.bulk_embed import _ContiguousCheckpoint
+
+        ids = [uuid.uuid4() for _ in range(4)]
+        checkpoint = _ContiguousCheckpoint()
+
+        assert checkpoint.complete(0, ids[0]) == ids[0]
+        checkpoint.fail(2)
+        assert checkpoint.complete(3, ids[3]) is None
+        assert checkpoint.complete(1, ids[1]) == ids[1]
+        assert checkpoint.complete(2, ids[2]) is None
+
+    @pytest.mark.asyncio
+    async def test_writer_drains_batches_queued_behind_shutdown(self):
+        """Batches coalesced together with the end-of-stream marker are still written."""
+        import asyncio
+
+        from paper_scraper.jobs import bulk_embed
+
+        papers = sorted(
+            [(uuid.uuid4(), f"Paper {i}", None, None) for i in range(4)], key=lambda row: row[0]
+        )
+        first_id = papers[0][0]
+        written: list[list[uuid.UUID]] = []
+
+        async def fetch(limit, after_id=None, global_only=True):
+            rows = [row for row in papers if after_id is None or row[0] > after_id]
+            return rows[:limit]
+
+        async def embed(client, texts):
+            if texts != [papers[0][1]]:
+                # Later batches reach the writer while the first write is held
+                await asyncio.sleep(0.01)
+            return [[0.1] * 1536 for _ in texts]
+
+        async def update(paper_ids, embeddings):
+            if first_id in paper_ids:
+                # Hold the first write until the rest and the end marker queue up
+                await asyncio.sleep(0.05)
+            written.append(paper_ids)
+            # One row of the first write is skipped (dimension mismatch)
+            return len(paper_ids) - (first_id in paper_ids)
+
+        with (
+            patch.object(bulk_embed, "_load_checkpoint", AsyncMock(return_value=None)),
+            patch.object(bulk_embed, "_save_checkpoint", AsyncMock()) as save,
+            patch.object(bulk_embed, "_clear_checkpoint", AsyncMock()) as clear,
+            patch.object(bulk_embed, "_fetch_unembedded_papers", side_effect=fetch),
+            patch.object(bulk_embed, "_bulk_update_embeddings", side_effect=update),
+            patch.object(bulk_embed, "schedule_neighbor_update", AsyncMock()),
+            patch.object(bulk_embed.EmbeddingStore, "embed_texts_detached", side_effect=embed),
+            patch.object(bulk_embed, "EmbeddingClient"),
+        ):
+            result = await asyncio.wait_for(
+                bulk_embed.bulk_embed_papers_task({}, batch_size=1, concurrency=2), timeout=5
+            )
+
+        assert written[0] == [first_id]
+        assert sorted(pid for batch in written[1:] for pid in batch) == [
+            row[0] for row in papers[1:]
+        ]
+        assert result["papers_embedded"] == 3
+        assert result["errors"] == 1
+        assert result["status"] == "completed_with_errors"
+        assert save.await_args.args[0] == papers[-1][0]
+        clear.assert_not_awaited()
@@ -249,7 +249,7 @@ class TestBadgeAutoAward:
         """Test that badge tasks are registered in worker."""
         from paper_scraper.jobs.worker import WorkerSettings
 
-        function_names = [f.__name__ for f in WorkerSettings.functions]
+        function_names = [getattr(f, "name", None) or f.__name__ for f in WorkerSettings.functions]
 
         assert "check_and_award_badges_task" in function_names
         assert "batch_check_badges_task" in function_names
@@ -323,7 +323,7 @@ class TestKnowledgeEnhancedScoring:
 
     def test_scoring_prompt_includes_knowledge_placeholder(self):
         """Test that scoring prompts include knowledge context."""
-        from paper_scraper.modules.scoring.prompts import render_prompt
+        from paper_scraper.modules.scoring.prompts import render_paper_context, render_prompt
 
         # Create context with knowledge
         context = MagicMock()
@@ -338,11 +338,14 @@ class TestKnowledgeEnhancedScoring:
         context.references_count = None
         context.knowledge_context = "We focus on AI in healthcare."
 
-        rendered = render_prompt("novelty.jinja2", paper=context, similar_papers=[])
+        rendered = render_paper_context(context) + render_prompt(
+            "novelty.jinja2", knowledge_context=context.knowledge_context
+        )
 
         # The rendered prompt should include knowledge context section
         # when knowledge_context is provided
         assert "Test Paper" in rendered
+        assert "We focus on AI in healthcare." in rendered
 
     def test_scoring_weights_include_team_readiness(self):
         """Test scoring weights schema includes team_readiness."""